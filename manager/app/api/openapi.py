@@ -4,12 +4,14 @@ OpenAPI configuration for Runner Manager API.
 Handles custom documentation, tags, and API schema generation.
 """
 
-from typing import Annotated, Callable, Dict, List, Optional
+import hashlib
+import json
+from typing import Annotated, Callable, Dict, List, Optional, Tuple
 
 from fastapi import Cookie, Depends, FastAPI, Request
 from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
 from fastapi.openapi.utils import get_openapi
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 
 from app.__version__ import __author__, __email__, __version__
 
@@ -120,6 +122,24 @@ def _get_openapi_tags() -> List[Dict]:
     ]
 
 
+# Path keywords -> tag, checked in order; the first tag with a keyword in the path wins
+_PATH_TAG_KEYWORDS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("Admin", ("admin",)),
+    ("Health", ("health", "ping")),
+    ("Runner", ("register", "heartbeat")),
+    ("Task", ("task",)),
+    ("Authentication", ("auth", "token")),
+)
+
+
+def _tag_for_path(path: str) -> str:
+    """Return the tag matching an endpoint path, "API" when no keyword matches."""
+    for tag, keywords in _PATH_TAG_KEYWORDS:
+        if any(keyword in path for keyword in keywords):
+            return tag
+    return "API"
+
+
 def _assign_tags_to_endpoints(openapi_schema: Dict) -> None:
     """
     Assign appropriate tags to endpoints based on their paths.
@@ -129,19 +149,10 @@ def _assign_tags_to_endpoints(openapi_schema: Dict) -> None:
         openapi_schema: OpenAPI schema to modify
     """
     for path, methods in openapi_schema["paths"].items():
-        for method, details in methods.items():
-            if "admin" in path:
-                details["tags"] = ["Admin"]
-            elif "health" in path or "ping" in path:
-                details["tags"] = ["Health"]
-            elif "register" in path or "heartbeat" in path:
-                details["tags"] = ["Runner"]
-            elif "task" in path:
-                details["tags"] = ["Task"]
-            elif "auth" in path or "token" in path:
-                details["tags"] = ["Authentication"]
-            else:
-                details["tags"] = ["API"]
+        # Resolve the tag once per path, not once per HTTP method
+        tag = _tag_for_path(path)
+        for details in methods.values():
+            details["tags"] = [tag]
 
 
 def _mark_runner_version_headers_required(openapi_schema: Dict) -> None:
@@ -162,22 +173,18 @@ def _enhance_schemas_with_examples(openapi_schema: Dict) -> None:
     Args:
         openapi_schema: OpenAPI schema to modify
     """
-    if "components" not in openapi_schema:
-        openapi_schema["components"] = {}
+    schemas = openapi_schema.setdefault("components", {}).setdefault("schemas", {})
 
-    if "schemas" not in openapi_schema["components"]:
-        openapi_schema["components"]["schemas"] = {}
-
-    if "Runner" in openapi_schema["components"]["schemas"]:
-        openapi_schema["components"]["schemas"]["Runner"]["example"] = {
+    if "Runner" in schemas:
+        schemas["Runner"]["example"] = {
             "id": "runner-123",
             "url": "http://runner.example.com:8080",
             "task_types": ["encoding"],
             "token": "tohken-runner-123",
         }
 
-    if "Task" in openapi_schema["components"]["schemas"]:
-        openapi_schema["components"]["schemas"]["Task"]["example"] = {
+    if "Task" in schemas:
+        schemas["Task"]["example"] = {
             "id": "task-abc-123",
             "runner_id": "runner-123",
             "status": "running",
@@ -192,8 +199,8 @@ def _enhance_schemas_with_examples(openapi_schema: Dict) -> None:
             "updated_at": "2023-01-01T12:30:00Z",
         }
 
-    if "TaskRequest" in openapi_schema["components"]["schemas"]:
-        openapi_schema["components"]["schemas"]["TaskRequest"]["example"] = {
+    if "TaskRequest" in schemas:
+        schemas["TaskRequest"]["example"] = {
             "etab_name": "University of Example",
             "app_name": "Pod",
             "app_version": "4.0.2",
@@ -204,6 +211,39 @@ def _enhance_schemas_with_examples(openapi_schema: Dict) -> None:
         }
 
 
+def _openapi_json_body(app: FastAPI) -> Tuple[bytes, str]:
+    """
+    Return the serialized OpenAPI schema and its ETag.
+
+    The schema is only encoded again when app.openapi() returns a new schema object,
+    so repeated /openapi.json requests reuse the same bytes.
+
+    Args:
+        app: FastAPI application instance
+
+    Returns:
+        Tuple[bytes, str]: JSON body (same encoding as JSONResponse) and quoted ETag
+    """
+    schema = app.openapi()
+    cached = getattr(app.state, "openapi_json", None)
+    if cached is None or cached[0] is not schema:
+        body = json.dumps(
+            schema, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+        ).encode("utf-8")
+        etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        cached = (schema, body, etag)
+        app.state.openapi_json = cached
+    return cached[1], cached[2]
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Return True when an If-None-Match header value covers the given ETag."""
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+    return etag in candidates or "*" in candidates
+
+
 def setup_openapi_config(app: FastAPI) -> None:
     """
     Set up custom OpenAPI configuration for FastAPI app.
@@ -297,8 +337,12 @@ def setup_protected_openapi_routes(app: FastAPI) -> None:
         token: Optional[str] = Depends(verify_openapi_token),
         token_cookie: Annotated[Optional[str], Cookie(alias=OPENAPI_TOKEN_COOKIE_NAME)] = None,
     ):
-        """Protected OpenAPI schema."""
-        response = JSONResponse(app.openapi())
+        """Protected OpenAPI schema, served from pre-serialized bytes with an ETag."""
+        body, etag = _openapi_json_body(app)
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            response = Response(status_code=304, headers={"ETag": etag})
+        else:
+            response = Response(body, media_type="application/json", headers={"ETag": etag})
         _set_openapi_auth_cookie_if_needed(
             response=response,
             request=request,
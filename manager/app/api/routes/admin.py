@@ -28,7 +28,6 @@ from app.api.routes.task import (
 from app.core import config as config_module
 from app.core.auth import OPENAPI_TOKEN_COOKIE_NAME, build_openapi_cookie_value, verify_admin
 from app.core.config import config
-from app.core.passwords import BcryptPasswordContext
 from app.core.paths import WEB_TEMPLATES_DIR
 from app.core.setup_logging import setup_default_logging
 from app.core.state import get_task as get_task_from_state
@@ -72,7 +71,6 @@ _ADMIN_ENV_PREFIX = "ADMIN_USERS__"
 _DEFAULT_GENERATED_TOKEN_LENGTH = 32
 _MIN_GENERATED_TOKEN_LENGTH = 16
 _MAX_GENERATED_TOKEN_LENGTH = 128
-_PASSWORD_CONTEXT = BcryptPasswordContext()
 
 # ======================================================
 # Endpoints
@@ -138,8 +136,8 @@ def _generate_authorized_token(length: int = _DEFAULT_GENERATED_TOKEN_LENGTH) ->
 
 
 def _hash_admin_password(password: str) -> str:
-    """Hash an admin password using the same policy as scripts/generate_password.py."""
-    return _PASSWORD_CONTEXT.hash(password)
+    """Hash an admin password with bcrypt, at the configured BCRYPT_ROUNDS cost."""
+    return config.pwd_context.hash(password)
 
 
 def _read_env_lines(env_path: Path) -> list[str]:
@@ -1,7 +1,10 @@
+import os
 import re
+from collections import Counter
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import BinaryIO, Dict, Iterator, List, NamedTuple, Optional
 
 # For FastAPI
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
@@ -23,6 +26,20 @@ router = APIRouter(prefix="/logs", tags=["Logs"], dependencies=[Depends(verify_a
 # Templates configuration
 templates = Jinja2Templates(directory=WEB_TEMPLATES_DIR)
 
+# Bytes read per step when scanning a log file backwards
+REVERSE_READ_CHUNK_SIZE = 64 * 1024
+
+
+class ParsedLine(NamedTuple):
+    """A single logical log entry (structured header plus any continuation lines)"""
+
+    timestamp: str
+    module: str
+    level: str
+    context: str
+    message: str
+    raw: str
+
 
 class LogParser:
     """Parser for the specific log format"""
@@ -41,35 +58,30 @@ class LogParser:
         return line.rstrip("\r\n")
 
     @classmethod
-    def parse_structured_log_line(cls, line: str) -> Optional[Dict[str, str]]:
+    def parse_structured_log_line(cls, line: str) -> Optional[ParsedLine]:
         """Parse a line only if it matches the expected structured format."""
         match = cls.LOG_PATTERN.match(line)
         if not match:
             return None
 
-        return {
-            "timestamp": match.group("timestamp"),
-            "module": match.group("module"),
-            "level": match.group("level").upper(),
-            "context": match.group("context"),
-            "message": match.group("message"),
-            "raw": line,
-        }
+        # A single groups() call feeds the tuple directly, no intermediate dict per line.
+        timestamp, module, level, context, message = match.groups()
+        return ParsedLine(timestamp, module, level.upper(), context, message, line)
 
     @staticmethod
-    def create_unknown_log_line(line: str) -> Dict[str, str]:
+    def create_unknown_log_line(line: str) -> ParsedLine:
         """Fallback for lines that don't match the structured pattern."""
-        return {
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "module": "UNKNOWN",
-            "level": "UNKNOWN",
-            "context": "",
-            "message": line,
-            "raw": line,
-        }
+        return ParsedLine(
+            timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            module="UNKNOWN",
+            level="UNKNOWN",
+            context="",
+            message=line,
+            raw=line,
+        )
 
     @classmethod
-    def parse_log_line(cls, line: str) -> Dict[str, str]:
+    def parse_log_line(cls, line: str) -> ParsedLine:
         """
         Parse a log line according to the format:
         2025-10-22 15:43:34 - runner - INFO - [encoding_handler:execute_task:134] - Encoding task completed successfully
@@ -93,50 +105,120 @@ class LogManager:
         """Append a continuation line while preserving multi-line payloads."""
         return f"{existing}\n{line}" if existing else line
 
-    def _parse_log_entries(self, lines: List[str]) -> List[Dict[str, str]]:
-        """
-        Parse file lines into logical log entries.
-        Lines that do not match the structured pattern are treated as continuations
-        of the previous structured entry (e.g. HTML payloads, stack traces).
-        """
-        entries: List[Dict[str, str]] = []
-        current_entry: Optional[Dict[str, str]] = None
-
-        for raw_line in lines:
-            line = LogParser._strip_line_end(raw_line)
-            structured_entry = LogParser.parse_structured_log_line(line)
+    @classmethod
+    def _attach_continuations(cls, entry: ParsedLine, lines: List[str]) -> ParsedLine:
+        """Return `entry` with continuation lines appended to its message and raw text."""
+        if not lines:
+            return entry
+        message, raw = entry.message, entry.raw
+        for line in lines:
+            message = cls._append_line(message, line)
+            raw = cls._append_line(raw, line)
+        return entry._replace(message=message, raw=raw)
 
-            if structured_entry:
-                if current_entry:
-                    entries.append(current_entry)
-                current_entry = structured_entry
-                continue
+    @staticmethod
+    def _matches_filters(
+        entry: ParsedLine, level_filter: Optional[List[str]], search_lower: Optional[str]
+    ) -> bool:
+        """Return True when an entry passes the level and (lowercased) search filters."""
+        if level_filter and entry.level not in level_filter:
+            return False
+        return not search_lower or search_lower in entry.raw.lower()
 
-            if current_entry:
-                current_entry["message"] = self._append_line(current_entry["message"], line)
-                current_entry["raw"] = self._append_line(current_entry["raw"], line)
-                continue
+    @staticmethod
+    def _iter_lines_reversed(
+        log_file: BinaryIO, chunk_size: int = REVERSE_READ_CHUNK_SIZE
+    ) -> Iterator[str]:
+        """
+        Yield the lines of a binary file from last to first, without line terminators.
 
-            if not line:
-                continue
+        The file is read backwards in buffered chunks rather than memory-mapped: a live
+        log truncated during the scan (copytruncate rotation) would raise SIGBUS on a
+        mapping, whereas a short read here just ends the scan.
+        """
+        position = log_file.seek(0, os.SEEK_END)
+        at_end = True
+        partial = b""
+
+        while position > 0:
+            read_size = min(chunk_size, position)
+            position -= read_size
+            log_file.seek(position)
+            chunk = log_file.read(read_size)
+            if len(chunk) != read_size:
+                return  # File truncated while being read
+            if at_end:
+                at_end = False
+                if chunk.endswith(b"\n"):
+                    chunk = chunk[:-1]
+
+            lines = (chunk + partial).split(b"\n")
+            partial = lines[0]
+            for line in reversed(lines[1:]):
+                yield line.decode("utf-8", errors="ignore").rstrip("\r")
+
+        if not at_end:
+            yield partial.decode("utf-8", errors="ignore").rstrip("\r")
+
+    def _read_recent_entries(
+        self,
+        log_file: BinaryIO,
+        limit: int,
+        level_filter: Optional[List[str]],
+        search_term: Optional[str],
+    ) -> List[ParsedLine]:
+        """
+        Collect up to `limit` matching entries from the end of a log file.
 
-            entries.append(LogParser.create_unknown_log_line(line))
+        Lines are scanned backwards and the scan stops once `limit` entries have
+        matched, so only the tail of large files is read. Continuation lines are
+        buffered until their structured header line is reached, so multi-line
+        payloads (HTML bodies, stack traces) stay attached to it. Lines preceding the first
+        structured entry are only reported when the scan reaches the file start.
 
-        if current_entry:
-            entries.append(current_entry)
+        Returns:
+            List[ParsedLine]: Matching entries in file (oldest -> newest) order
+        """
+        matches: List[ParsedLine] = []
+        pending: List[str] = []
+        parse_structured = LogParser.parse_structured_log_line
+        search_lower = search_term.lower() if search_term else None
+
+        for line in self._iter_lines_reversed(log_file):
+            entry = parse_structured(line)
+            if entry is None:
+                pending.append(line)
+                continue
 
-        return entries
+            entry = self._attach_continuations(entry, pending[::-1])
+            pending.clear()
+
+            if self._matches_filters(entry, level_filter, search_lower):
+                matches.append(entry)
+                if len(matches) >= limit:
+                    break
+        else:
+            # Reached the start of the file: leftover lines precede any structured entry.
+            leading = [LogParser.create_unknown_log_line(line) for line in pending if line]
+            matches.extend(
+                entry
+                for entry in leading
+                if self._matches_filters(entry, level_filter, search_lower)
+            )
+
+        matches.reverse()
+        return matches
 
     def read_logs(
         self,
         limit: int = 1000,
         level_filter: Optional[List[str]] = None,
         search_term: Optional[str] = None,
-    ) -> List[Dict]:
+    ) -> List[ParsedLine]:
         """
         Read logs from configured files with optional filtering
         """
-        all_logs = []
+        all_logs: List[ParsedLine] = []
 
         for log_path in self.log_paths:
             log_file = Path(log_path)
@@ -146,41 +228,27 @@ class LogManager:
                 continue
 
             try:
-                # Read all lines from log file
-                with open(log_file, "r", encoding="utf-8", errors="ignore") as f:
-                    lines = f.readlines()
-
-                # Parse each logical log entry (multi-line payloads included)
-                for parsed_log in self._parse_log_entries(lines):
-
-                    # Apply level filter if specified
-                    if level_filter and parsed_log["level"] not in level_filter:
-                        continue
-
-                    # Apply search filter if specified
-                    if search_term and search_term.lower() not in parsed_log["raw"].lower():
-                        continue
-
-                    all_logs.append(parsed_log)
+                # Scan the file from the end: only the newest entries are read
+                with open(log_file, "rb") as f:
+                    all_logs.extend(self._read_recent_entries(f, limit, level_filter, search_term))
 
             except Exception as e:
                 logger.error(f"Error reading log file {log_path}: {e}")
                 continue
 
         # Sort by timestamp (oldest first)
-        all_logs.sort(key=lambda x: x["timestamp"])
+        all_logs.sort(key=attrgetter("timestamp"))
 
         # Keep the most recent `limit` entries while preserving oldest->newest display
         return all_logs[-limit:]
 
-    def get_logs_statistics(self, logs: List[Dict]) -> Dict[str, int]:
+    def get_logs_statistics(self, logs: List[ParsedLine]) -> Dict[str, int]:
         """Calculate statistics by log level"""
-        stats = {level: 0 for level in self.available_levels}
+        stats = dict.fromkeys(self.available_levels, 0)
         stats["UNKNOWN"] = 0
 
-        for log in logs:
-            level = log["level"]
-            stats[level] = stats.get(level, 0) + 1
+        # Counter tallies in C; update() keeps the zeroed known levels first.
+        stats.update(Counter(log.level for log in logs))
 
         return stats
 
@@ -193,6 +261,11 @@ LOG_PATHS = [
 log_manager = LogManager(LOG_PATHS)
 
 
+def get_log_manager() -> LogManager:
+    """Dependency returning the log manager used by the endpoints."""
+    return log_manager
+
+
 # ======================================================
 # Endpoints
 # ======================================================
@@ -205,18 +278,19 @@ async def view_logs(
     level: List[str] = Query([], description="Filter by log level"),
     search: str = Query(None, description="Search term"),
     auto_refresh: int = Query(0, description="Auto-refresh interval in seconds"),
+    manager: LogManager = Depends(get_log_manager),
 ):
     """
     Main logs display page with filtering and search capabilities
     """
     try:
         # Read logs with applied filters
-        logs = log_manager.read_logs(
+        logs = manager.read_logs(
             limit=limit, level_filter=level if level else None, search_term=search
         )
 
         # Calculate statistics
-        stats = log_manager.get_logs_statistics(logs)
+        stats = manager.get_logs_statistics(logs)
 
         dark_mode = request.cookies.get("theme") == "dark"
 
@@ -226,7 +300,7 @@ async def view_logs(
             "logs": logs,
             "levels_count": stats,
             "total_logs": len(logs),
-            "available_levels": log_manager.available_levels,
+            "available_levels": manager.available_levels,
             "current_filters": {
                 "limit": limit,
                 "levels": level,
@@ -249,12 +323,13 @@ async def view_logs(
 async def stream_logs(
     request: Request,
     limit: int = Query(100, description="Number of recent logs to display", ge=1, le=1000),
+    manager: LogManager = Depends(get_log_manager),
 ):
     """
     Endpoint for log streaming (used for auto-refresh)
     """
     try:
-        logs = log_manager.read_logs(limit=limit)
+        logs = manager.read_logs(limit=limit)
 
         context = {"request": request, "logs": logs, "now": datetime.now()}
 
@@ -270,12 +345,13 @@ async def search_logs(
     request: Request,
     q: str = Query(..., description="Search term"),
     limit: int = Query(500, description="Maximum number of results"),
+    manager: LogManager = Depends(get_log_manager),
 ):
     """
     Advanced search in logs
     """
     try:
-        logs = log_manager.read_logs(limit=limit, search_term=q)
+        logs = manager.read_logs(limit=limit, search_term=q)
 
         context = {
             "request": request,
@@ -293,14 +369,14 @@ async def search_logs(
 
 
 @router.get("/api/stats")
-async def get_logs_stats():
+async def get_logs_stats(manager: LogManager = Depends(get_log_manager)):
     """
     API endpoint for log statistics (for dashboard)
     """
     try:
         # Read recent logs for statistics
-        logs = log_manager.read_logs(limit=5000)
-        stats = log_manager.get_logs_statistics(logs)
+        logs = manager.read_logs(limit=5000)
+        stats = manager.get_logs_statistics(logs)
 
         return {"total": len(logs), "by_level": stats, "last_updated": datetime.now().isoformat()}
 
@@ -17,6 +17,7 @@ from app.core.config import config
 from app.core.setup_logging import setup_default_logging
 from app.core.state import runners
 from app.models.models import Runner
+from app.services import task_callback_service
 
 # Configure logging
 logger = setup_default_logging()
@@ -38,19 +39,7 @@ class RunnerHeartbeatPayload(BaseModel):
 
 def _host_matches_allowlist(host: str, allowed_hosts: list[str]) -> bool:
     """Return True when host matches one allowlist entry (exact/subdomain)."""
-    normalized_host = (host or "").strip().lower().rstrip(".")
-    if not normalized_host:
-        return False
-
-    for allowed in allowed_hosts:
-        normalized_allowed = (allowed or "").strip().lower().rstrip(".")
-        if not normalized_allowed:
-            continue
-        if normalized_host == normalized_allowed or normalized_host.endswith(
-            "." + normalized_allowed
-        ):
-            return True
-    return False
+    return task_callback_service.host_matches_allowlist(host, allowed_hosts)
 
 
 def _is_disallowed_ip(ip: str) -> bool:
@@ -157,8 +157,8 @@ def _is_disallowed_ip(ip: str) -> bool:
 
 
 async def _resolve_host_ips(host: str) -> List[str]:
-    """Resolve all IPs for a hostname using system DNS."""
-    return await task_callback_service.resolve_host_ips(host)
+    """Resolve all IPs for a hostname using system DNS (successful lookups are cached)."""
+    return await task_callback_service.resolve_host_ips_cached(host)
 
 
 def _parse_notify_url(url: str) -> tuple[ParseResult, str]:
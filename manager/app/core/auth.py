@@ -5,6 +5,7 @@ Handles API token verification and dependency injection for protected endpoints.
 """
 
 import base64
+import functools
 import hashlib
 import hmac
 import json
@@ -34,10 +35,13 @@ logger = setup_default_logging()
 _SEMVER_MAJOR_MINOR_RE = re.compile(r"^v?(?P<major>0|[1-9]\d*)\.(?P<minor>0|[1-9]\d*)")
 
 
+@functools.lru_cache(maxsize=64)
 def _parse_major_minor(version: str) -> tuple[int, int]:
     """Extract (major, minor) from a semver-ish string.
 
     Accepts values like `1.0.0`, `1.0`, `v1.0.1`, `1.0.0-alpha+1`.
+    Cached: the manager version and the handful of deployed runner versions are
+    parsed once instead of on every runner request.
     """
 
     candidate = (version or "").strip()
@@ -108,6 +112,15 @@ def _resolve_token_name(token: str) -> Optional[str]:
     return None
 
 
+def _is_authorized_token(token: str) -> bool:
+    """
+    Check a token against the authorized ones.
+    Every candidate is compared in constant time: no hash lookup decides first,
+    so response timing does not depend on the token value.
+    """
+    return any(hmac.compare_digest(token, value) for value in config.AUTHORIZED_TOKENS.values())
+
+
 def build_openapi_cookie_value(token: str) -> Optional[str]:
     """Build a signed opaque cookie value for OpenAPI docs auth."""
     token_name = _resolve_token_name(token)
@@ -249,14 +262,7 @@ async def verify_openapi_token(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Check if token is in authorized tokens (constant-time comparison)
-    authorized = False
-    for token_value in config.AUTHORIZED_TOKENS.values():
-        if hmac.compare_digest(token, token_value):
-            authorized = True
-            break
-
-    if not authorized:
+    if not _is_authorized_token(token):
         logger.warning("Unauthorized OpenAPI access attempt")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -324,14 +330,7 @@ async def verify_token(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Check if token is in authorized tokens (constant-time comparison)
-    authorized = False
-    for token_value in config.AUTHORIZED_TOKENS.values():
-        if hmac.compare_digest(token, token_value):
-            authorized = True
-            break
-
-    if not authorized:
+    if not _is_authorized_token(token):
         logger.warning("Unauthorized token attempt")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
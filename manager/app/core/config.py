@@ -4,15 +4,19 @@ Configuration module for runner management system.
 Handles environment variables, security settings, and application configuration.
 """
 
+import functools
 import ipaddress
 import os
 import re
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 from app.core._check_output import format_status
-from app.core.passwords import BcryptPasswordContext
+from app.core.passwords import DEFAULT_BCRYPT_ROUNDS, MAX_BCRYPT_ROUNDS, MIN_BCRYPT_ROUNDS
+
+if TYPE_CHECKING:
+    from app.core.passwords import BcryptPasswordContext
 
 SUPPORTED_API_DOCS_VISIBILITIES = frozenset({"private", "public"})
 SUPPORTED_ENVIRONMENTS = frozenset({"development", "production"})
@@ -108,6 +112,7 @@ _CONFIG_ENV_KEYS = [
     "OPENAPI_COOKIE_MAX_AGE_SECONDS",
     "OPENAPI_COOKIE_ROTATE_EACH_REQUEST",
     "OPENAPI_COOKIE_SECRET",
+    "BCRYPT_ROUNDS",
 ]
 
 
@@ -537,8 +542,21 @@ class Config:
 
         # Admin users configuration
         self.ADMIN_USERS: Dict[str, str] = self._load_admin_users()
+        # bcrypt cost factor for newly hashed admin passwords (each +1 doubles hashing time).
+        # Existing hashes keep the cost they were created with.
+        self.BCRYPT_ROUNDS: int = self._read_int(
+            "BCRYPT_ROUNDS",
+            DEFAULT_BCRYPT_ROUNDS,
+            min_value=MIN_BCRYPT_ROUNDS,
+            max_value=MAX_BCRYPT_ROUNDS,
+        )
+
+    @functools.cached_property
+    def pwd_context(self) -> "BcryptPasswordContext":
+        """Password hashing context, built (and bcrypt imported) on first use."""
+        from app.core.passwords import BcryptPasswordContext
 
-        self.pwd_context = BcryptPasswordContext()
+        return BcryptPasswordContext(rounds=self.BCRYPT_ROUNDS)
 
     def _load_storage_configuration(self) -> None:
         """Load log, shared storage, and cache paths."""
@@ -748,6 +766,7 @@ class Config:
             ("COMPLETION_NOTIFY_BACKOFF_FACTOR", self.COMPLETION_NOTIFY_BACKOFF_FACTOR, 1, None),
             ("SMTP_PORT", self.SMTP_PORT, 1, 65535),
             ("OPENAPI_COOKIE_MAX_AGE_SECONDS", self.OPENAPI_COOKIE_MAX_AGE_SECONDS, 60, 86400),
+            ("BCRYPT_ROUNDS", self.BCRYPT_ROUNDS, MIN_BCRYPT_ROUNDS, MAX_BCRYPT_ROUNDS),
         )
         for name, value, minimum, maximum in checks:
             if value < minimum:
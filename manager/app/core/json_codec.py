@@ -0,0 +1,53 @@
+"""
+JSON encoding and decoding shared by task persistence, the runner store and logging.
+
+orjson is used when it is installed (``speedups`` extra); the standard json module
+is the fallback and produces equivalent documents.
+"""
+
+import json
+from typing import Any, Union
+
+try:  # Optional speedup: orjson reads and writes JSON several times faster than json.
+    import orjson
+except ImportError:  # pragma: no cover - depends on the installed extras
+    orjson = None  # type: ignore[assignment]
+
+
+def loads(raw: Union[bytes, str]) -> Any:
+    """Decode a JSON document.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers handle
+    decode errors the same way with either parser.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def dumps_document(obj: Any) -> bytes:
+    """Encode a JSON document as indented UTF-8 bytes, as stored in data files.
+
+    Values orjson refuses (e.g. integers wider than 64 bits) fall back to json,
+    which produces the same indent=2, non-ASCII-preserving layout.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def dumps_line(obj: Any) -> str:
+    """Encode a JSON value on one compact line, keeping non-ASCII text (log entries).
+
+    Values orjson refuses fall back to json, which uses the same compact separators
+    so the log format does not depend on the installed extras.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
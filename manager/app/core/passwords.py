@@ -4,13 +4,21 @@ from __future__ import annotations
 
 from typing import Union
 
-import bcrypt
+# Cost factor bounds accepted for new hashes (BCRYPT_ROUNDS in the manager .env).
+# app.core.config imports these, so bcrypt itself is only imported on first use.
+DEFAULT_BCRYPT_ROUNDS = 12
+MIN_BCRYPT_ROUNDS = 4
+MAX_BCRYPT_ROUNDS = 15
 
 
 class BcryptPasswordContext:
     """Minimal hash/verify interface compatible with current config usage."""
 
-    def __init__(self, rounds: int = 12) -> None:
+    def __init__(self, rounds: int = DEFAULT_BCRYPT_ROUNDS) -> None:
+        if not MIN_BCRYPT_ROUNDS <= rounds <= MAX_BCRYPT_ROUNDS:
+            raise ValueError(
+                f"bcrypt rounds must be between {MIN_BCRYPT_ROUNDS} and {MAX_BCRYPT_ROUNDS}"
+            )
         self._rounds = rounds
 
     @staticmethod
@@ -22,11 +30,15 @@ class BcryptPasswordContext:
         raise TypeError("Password values must be str or bytes")
 
     def hash(self, password: Union[str, bytes]) -> str:
+        import bcrypt
+
         password_bytes = self._to_bytes(password)
         hashed = bcrypt.hashpw(password_bytes, bcrypt.gensalt(rounds=self._rounds))
         return hashed.decode("utf-8")
 
     def verify(self, password: Union[str, bytes], hashed_password: Union[str, bytes]) -> bool:
+        import bcrypt
+
         try:
             password_bytes = self._to_bytes(password)
             hashed_bytes = self._to_bytes(hashed_password)
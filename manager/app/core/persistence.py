@@ -4,21 +4,73 @@ Module for JSON-based persistence with daily directory rotation.
 Each day gets its own directory, with one JSON file per task.
 """
 
+import functools
 import json
 import logging
 import os
+import random
 import re
+import shutil
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterator, List, Optional, Set
 
 from filelock import BaseFileLock, FileLock, Timeout
 
+from app.core import json_codec
 from app.models.models import Task
 
 logger = logging.getLogger(__name__)
 
+
 _SAFE_TASK_ID_PATTERN = re.compile(r"[A-Za-z0-9][A-Za-z0-9._-]{0,199}\Z", re.ASCII)
+# Low-cardinality task fields shared by many loaded tasks: interned to store one copy each
+_INTERNED_TASK_FIELDS = ("status", "task_type", "app_name", "app_version", "runner_id", "etab_name")
+# Retry backoff of SafeDailyJSONPersistence: base * 2**attempt seconds, capped, with jitter
+RETRY_BACKOFF_BASE_SECONDS = 0.05
+RETRY_BACKOFF_MAX_SECONDS = 0.5
+# Date directories read concurrently by load_historical_tasks (file I/O releases the GIL)
+HISTORICAL_LOAD_MAX_WORKERS = 8
+
+
+@functools.lru_cache(maxsize=64)
+def _format_date_suffix(day: date) -> str:
+    """Return the YYYY-MM-DD directory name of a date (memoized: asked for on every call)."""
+    return day.strftime("%Y-%m-%d")
+
+
+def _parse_date_directory_name(name: str) -> Optional[date]:
+    """Return the date of a YYYY-MM-DD directory name, or None for any other name."""
+    # Fixed-layout check first: most names that are not dates fail on length alone
+    if len(name) != 10 or name[4] != "-" or name[7] != "-" or not name.isascii():
+        return None
+    year, month, day = name[:4], name[5:7], name[8:10]
+    if not (year.isdigit() and month.isdigit() and day.isdigit()):
+        return None
+    try:
+        return date(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
+
+def _iter_json_files(directory: Path) -> Iterator[Path]:
+    """
+    Yield the *.json entries of a directory (nothing when it does not exist).
+
+    One os.scandir() pass filtered on entry names, instead of Path.glob() and
+    its per-entry pattern matching.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json"):
+                    yield Path(entry.path)
+    except FileNotFoundError:
+        return
 
 
 class DailyJSONPersistence:
@@ -32,7 +84,9 @@ class DailyJSONPersistence:
         self.data_directory.mkdir(parents=True, exist_ok=True)
         self.lock_timeout = lock_timeout
         self._current_date: Optional[date] = None
-        self._current_lock: Optional[BaseFileLock] = None
+        # One FileLock per date directory, reused across calls (pruned by cleanup_old_files)
+        self._date_locks: Dict[date, BaseFileLock] = {}
+        self._date_locks_guard = threading.Lock()
 
     def _get_date_suffix(self, target_date: Optional[date] = None) -> str:
         """
@@ -46,7 +100,7 @@ class DailyJSONPersistence:
         """
         if target_date is None:
             target_date = datetime.now().date()
-        return target_date.strftime("%Y-%m-%d")
+        return _format_date_suffix(target_date)
 
     def _sanitize_task_id(self, task_id: str) -> str:
         """Validate that a task ID is safe to use as a single filename component."""
@@ -123,25 +177,38 @@ class DailyJSONPersistence:
         directory = self._get_directory_path(target_date)
         return directory / ".lock"
 
+    def _get_date_lock(self, target_date: date) -> BaseFileLock:
+        """
+        Get the lock guarding a date directory, creating it on first use.
+
+        Args:
+            target_date: Date of the directory to lock
+
+        Returns:
+            BaseFileLock: Lock for the date's directory
+        """
+        with self._date_locks_guard:
+            lock = self._date_locks.get(target_date)
+            if lock is None:
+                lock = FileLock(self._get_lock_path(target_date), timeout=self.lock_timeout)
+                self._date_locks[target_date] = lock
+            return lock
+
     def _get_current_lock(self) -> BaseFileLock:
         """
-        Get lock for current date. Creates new lock if date changed.
+        Get lock for current date. Creates the date directory if date changed.
 
         Returns:
             BaseFileLock: Lock for current date's directory
         """
         current_date = datetime.now().date()
 
-        # Create new lock if date changed or lock doesn't exist
-        if self._current_date != current_date or self._current_lock is None:
-            self._current_date = current_date
-            lock_path = self._get_lock_path(current_date)
+        if self._current_date != current_date:
             # Ensure directory exists
-            lock_path.parent.mkdir(parents=True, exist_ok=True)
-            self._current_lock = FileLock(lock_path, timeout=self.lock_timeout)
+            self._get_directory_path(current_date).mkdir(parents=True, exist_ok=True)
+            self._current_date = current_date
 
-        assert self._current_lock is not None  # Always set in the if block above
-        return self._current_lock
+        return self._get_date_lock(current_date)
 
     def _get_deleted_task_ids(self) -> Set[str]:
         """Load deleted task IDs from tombstone files."""
@@ -159,11 +226,10 @@ class DailyJSONPersistence:
         try:
             lock = self._get_deleted_lock()
             with lock:
-                for tombstone_path in deleted_directory.glob("*.json"):
+                for tombstone_path in _iter_json_files(deleted_directory):
                     try:
                         tombstone_path = self._resolve_data_path(tombstone_path)
-                        with open(tombstone_path, "r", encoding="utf-8") as f:
-                            payload = json.load(f)
+                        payload = json_codec.loads(tombstone_path.read_bytes())
 
                         if isinstance(payload, dict):
                             task_id = str(payload.get("task_id", tombstone_path.stem))
@@ -247,8 +313,7 @@ class DailyJSONPersistence:
             deleted_lock = self._get_deleted_lock()
             with deleted_lock:
                 temp_path = self._resolve_data_path(tombstone_path.with_suffix(".tmp"))
-                with open(temp_path, "w", encoding="utf-8") as f:
-                    json.dump(tombstone, f, indent=2, ensure_ascii=False)
+                temp_path.write_bytes(json_codec.dumps_document(tombstone))
                 temp_path.replace(tombstone_path)
         except Timeout:
             logger.error(
@@ -263,8 +328,7 @@ class DailyJSONPersistence:
         deleted_files = 0
         for target_date in self.list_available_dates():
             try:
-                lock_path = self._get_lock_path(target_date)
-                lock = FileLock(lock_path, timeout=self.lock_timeout)
+                lock = self._get_date_lock(target_date)
                 task_file = self._get_task_file_path(task_id, target_date)
                 with lock:
                     if task_file.exists():
@@ -285,6 +349,36 @@ class DailyJSONPersistence:
         )
         return True
 
+    def _write_task_file(self, task_id: str, task: Task, saved_at: str, date_suffix: str) -> Path:
+        """
+        Write one task (with its metadata) to today's directory through a temp file.
+
+        The document is serialized in a single call and written in one go;
+        json.dump() on a file object issues one write() per encoder chunk.
+
+        Returns:
+            Path: The task file that was written
+        """
+        task_file = self._get_task_file_path(task_id)
+
+        # Convert Task object to dictionary with metadata
+        if hasattr(task, "model_dump"):
+            task_data = task.model_dump()
+        else:
+            task_data = task.dict()
+        task_data["_metadata"] = {
+            "saved_at": saved_at,
+            "task_id": task_id,
+            "date": date_suffix,
+        }
+        payload = json_codec.dumps_document(task_data)
+
+        # Write to temporary file first, then rename (atomic)
+        temp_path = self._resolve_data_path(task_file.with_suffix(".tmp"))
+        temp_path.write_bytes(payload)
+        temp_path.replace(task_file)
+        return task_file
+
     def save_tasks(self, tasks: Dict[str, Task]) -> bool:
         """
         Save tasks to today's directory with one JSON file per task.
@@ -306,32 +400,16 @@ class DailyJSONPersistence:
                 self._delete_current_date_files_for_deleted_tasks(deleted_task_ids)
 
                 # Get existing task files to detect deletions
-                existing_files = set(directory.glob("*.json"))
+                existing_files = set(_iter_json_files(directory))
                 current_task_files = set()
 
-                # Save each task to its own file
+                # Save each task to its own file; one timestamp for the whole batch
+                saved_at = datetime.now().isoformat()
+                date_suffix = self._get_date_suffix()
                 for task_id, task in tasks_to_save.items():
-                    task_file = self._get_task_file_path(task_id)
-                    current_task_files.add(task_file)
-
-                    # Convert Task object to dictionary with metadata
-                    if hasattr(task, "model_dump"):
-                        task_data = task.model_dump()
-                    else:
-                        task_data = task.dict()
-                    task_data["_metadata"] = {
-                        "saved_at": datetime.now().isoformat(),
-                        "task_id": task_id,
-                        "date": self._get_date_suffix(),
-                    }
-
-                    # Write to temporary file first, then rename (atomic)
-                    temp_path = self._resolve_data_path(task_file.with_suffix(".tmp"))
-                    with open(temp_path, "w", encoding="utf-8") as f:
-                        json.dump(task_data, f, indent=2, ensure_ascii=False)
-
-                    # Atomic replace
-                    temp_path.replace(task_file)
+                    current_task_files.add(
+                        self._write_task_file(task_id, task, saved_at, date_suffix)
+                    )
 
                 # Delete task files that no longer exist in tasks dict
                 files_to_delete = existing_files - current_task_files
@@ -380,25 +458,10 @@ class DailyJSONPersistence:
             with lock:
                 self._delete_current_date_files_for_deleted_tasks(deleted_task_ids)
 
+                saved_at = datetime.now().isoformat()
+                date_suffix = self._get_date_suffix()
                 for task_id, task in tasks_to_upsert.items():
-                    task_file = self._get_task_file_path(task_id)
-
-                    if hasattr(task, "model_dump"):
-                        task_data = task.model_dump()
-                    else:
-                        task_data = task.dict()
-
-                    task_data["_metadata"] = {
-                        "saved_at": datetime.now().isoformat(),
-                        "task_id": task_id,
-                        "date": self._get_date_suffix(),
-                    }
-
-                    temp_path = self._resolve_data_path(task_file.with_suffix(".tmp"))
-                    with open(temp_path, "w", encoding="utf-8") as f:
-                        json.dump(task_data, f, indent=2, ensure_ascii=False)
-
-                    temp_path.replace(task_file)
+                    self._write_task_file(task_id, task, saved_at, date_suffix)
 
             logger.info(f"Successfully upserted {len(tasks_to_upsert)} tasks to {directory}")
             return True
@@ -435,8 +498,7 @@ class DailyJSONPersistence:
                 continue
 
             try:
-                lock_path = self._get_lock_path(target_date)
-                lock = FileLock(lock_path, timeout=self.lock_timeout)
+                lock = self._get_date_lock(target_date)
                 task_file = self._get_task_file_path(task_id, target_date)
                 with lock:
                     if not task_file.exists():
@@ -460,14 +522,18 @@ class DailyJSONPersistence:
         """Read a single task file and return (task_id, task_data, metadata) or None on error."""
         try:
             task_file = self._resolve_data_path(task_file)
-            with open(task_file, "r", encoding="utf-8") as f:
-                loaded = json.load(f)
+            loaded = json_codec.loads(task_file.read_bytes())
 
             if not isinstance(loaded, dict):
                 logger.error(f"Invalid task payload in {task_file}: expected object")
                 return None
 
-            task_data: Dict[str, Any] = dict(loaded)
+            # Freshly decoded: no other reference to copy away from
+            task_data: Dict[str, Any] = loaded
+            for field in _INTERNED_TASK_FIELDS:
+                value = task_data.get(field)
+                if type(value) is str:
+                    task_data[field] = sys.intern(value)
             metadata: Optional[Dict[str, Any]] = None
             metadata_obj = task_data.get("_metadata")
 
@@ -532,13 +598,12 @@ class DailyJSONPersistence:
     ) -> None:
         """Merge tasks from a single date directory into tasks_data without overwriting newer entries."""
         directory = self._get_directory_path(date_to_load)
-        lock_path = self._get_lock_path(date_to_load)
-        lock = FileLock(lock_path, timeout=self.lock_timeout)
+        lock = self._get_date_lock(date_to_load)
         deleted_ids = deleted_task_ids or set()
 
         try:
             with lock:
-                for task_file in directory.glob("*.json"):
+                for task_file in _iter_json_files(directory):
                     result = self._read_task_file(task_file, keep_metadata=False)
                     if not result:
                         continue
@@ -571,13 +636,12 @@ class DailyJSONPersistence:
             logger.info(f"No tasks directory found for date {target_date}")
             return {}
 
-        lock_path = self._get_lock_path(target_date)
-        lock = FileLock(lock_path, timeout=self.lock_timeout)
+        lock = self._get_date_lock(target_date)
         tasks_data: Dict[str, Any] = {}
 
         try:
             with lock:
-                for task_file in directory.glob("*.json"):
+                for task_file in _iter_json_files(directory):
                     result = self._read_task_file(task_file, keep_metadata=False)
                     if result:
                         task_id, task_data, metadata = result
@@ -607,16 +671,22 @@ class DailyJSONPersistence:
         Returns:
             Dict[str, Any]: Combined tasks from the date range
         """
-        all_tasks = {}
-        current_date = start_date
-
-        while current_date <= end_date:
-            date_tasks = self.load_tasks(current_date)
+        all_tasks: Dict[str, Any] = {}
+        # Days without a directory have nothing to load
+        dates = [d for d in self.list_available_dates() if start_date <= d <= end_date]
+        if not dates:
+            return all_tasks
+
+        # Each date has its own directory and lock: load them concurrently
+        max_workers = min(HISTORICAL_LOAD_MAX_WORKERS, len(dates))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            date_results = list(executor.map(self.load_tasks, dates))
+
+        for loaded_date, date_tasks in zip(dates, date_results):
             # Add date prefix to task IDs to avoid conflicts
-            date_prefix = current_date.strftime("%Y%m%d")
+            date_prefix = loaded_date.strftime("%Y%m%d")
             for task_id, task_data in date_tasks.items():
                 all_tasks[f"{date_prefix}_{task_id}"] = task_data
-            current_date = current_date + timedelta(days=1)
 
         return all_tasks
 
@@ -627,16 +697,17 @@ class DailyJSONPersistence:
         Returns:
             List[date]: Sorted list of available dates
         """
-        task_dirs = [d for d in self.data_directory.iterdir() if not d.is_symlink() and d.is_dir()]
         dates = []
 
-        for dir_path in task_dirs:
-            try:
+        # DirEntry type checks come from the directory listing itself: no stat per entry
+        with os.scandir(self.data_directory) as entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
                 # Parse directory name as date
-                dir_date = datetime.strptime(dir_path.name, "%Y-%m-%d").date()
-                dates.append(dir_date)
-            except ValueError:
-                continue
+                dir_date = _parse_date_directory_name(entry.name)
+                if dir_date is not None:
+                    dates.append(dir_date)
 
         return sorted(dates)
 
@@ -659,28 +730,28 @@ class DailyJSONPersistence:
                 directory = self._get_directory_path(file_date)
 
                 try:
-                    # Delete all files in directory
-                    for file_path in directory.iterdir():
-                        file_path.unlink()
-                    # Delete the directory itself
-                    directory.rmdir()
+                    # Delete the whole expired directory (task files and lock) in one walk
+                    shutil.rmtree(directory)
                     deleted_count += 1
                     logger.info(f"Deleted old tasks directory: {directory}")
                 except OSError as e:
                     logger.error(f"Error deleting {directory}: {e}")
 
+        with self._date_locks_guard:
+            for lock_date in [d for d in self._date_locks if d < cutoff_date]:
+                del self._date_locks[lock_date]
+
         return deleted_count
 
     def _backup_corrupted_file(self, file_path: Path):
-        """Create a backup of corrupted JSON file for recovery."""
+        """Move a corrupted JSON file aside (*.json.bak) for recovery."""
         try:
             file_path = self._resolve_data_path(file_path)
             backup_path = self._resolve_data_path(file_path.with_suffix(".json.bak"))
             if file_path.exists():
-                import shutil
-
-                shutil.copy2(file_path, backup_path)
-                logger.warning(f"Created backup of corrupted file at {backup_path}")
+                # The file is unreadable as a task anyway: rename it instead of copying its bytes
+                os.replace(file_path, backup_path)
+                logger.warning(f"Moved corrupted file to {backup_path}")
         except Exception as e:
             logger.error(f"Failed to create backup file: {e}")
 
@@ -697,7 +768,7 @@ class DailyJSONPersistence:
         # Count tasks in current directory
         current_task_count = 0
         if current_directory.exists():
-            current_task_count = len(list(current_directory.glob("*.json")))
+            current_task_count = sum(1 for _ in _iter_json_files(current_directory))
 
         return {
             "data_directory": str(self.data_directory),
@@ -705,7 +776,7 @@ class DailyJSONPersistence:
             "current_directory": str(current_directory),
             "current_directory_exists": current_directory.exists(),
             "current_task_count": current_task_count,
-            "available_dates": [d.strftime("%Y-%m-%d") for d in available_dates],
+            "available_dates": [_format_date_suffix(d) for d in available_dates],
             "total_days_stored": len(available_dates),
         }
 
@@ -715,13 +786,34 @@ class SafeDailyJSONPersistence(DailyJSONPersistence):
     Enhanced daily JSON persistence with retry mechanism.
     """
 
-    def __init__(self, data_directory: str = "data", lock_timeout: int = 10, max_retries: int = 3):
+    def __init__(
+        self,
+        data_directory: str = "data",
+        lock_timeout: int = 10,
+        max_retries: int = 3,
+        backoff_base: Optional[float] = None,
+    ):
         super().__init__(data_directory, lock_timeout)
         self.max_retries = max_retries
+        self.backoff_base = RETRY_BACKOFF_BASE_SECONDS if backoff_base is None else backoff_base
+
+    def _wait_before_retry(self, attempt: int) -> None:
+        """
+        Sleep before retry number `attempt` (1-based), with exponential backoff and jitter.
+
+        Spreading retries out lets the current lock holder finish instead of every
+        caller hammering the same FileLock again right away.
+        """
+        if self.backoff_base <= 0:
+            return
+        delay = min(self.backoff_base * 2 ** (attempt - 1), RETRY_BACKOFF_MAX_SECONDS)
+        time.sleep(delay * (0.5 + random.random()))
 
     def save_tasks(self, tasks: Dict[str, Task]) -> bool:
         """Save tasks with retry mechanism."""
         for attempt in range(self.max_retries):
+            if attempt:
+                self._wait_before_retry(attempt)
             try:
                 result = super().save_tasks(tasks)
                 if result:
@@ -740,6 +832,8 @@ class SafeDailyJSONPersistence(DailyJSONPersistence):
     ) -> Dict[str, Any]:
         """Load tasks with retry mechanism."""
         for attempt in range(self.max_retries):
+            if attempt:
+                self._wait_before_retry(attempt)
             try:
                 return super().load_tasks(target_date, load_all)
             except Exception as e:
@@ -754,6 +848,8 @@ class SafeDailyJSONPersistence(DailyJSONPersistence):
     def upsert_tasks(self, tasks: Dict[str, Task]) -> bool:
         """Upsert tasks with retry mechanism."""
         for attempt in range(self.max_retries):
+            if attempt:
+                self._wait_before_retry(attempt)
             try:
                 result = super().upsert_tasks(tasks)
                 if result:
@@ -768,6 +864,8 @@ class SafeDailyJSONPersistence(DailyJSONPersistence):
     def load_task(self, task_id: str) -> Optional[Dict[str, Any]]:
         """Load a single task with retry mechanism."""
         for attempt in range(self.max_retries):
+            if attempt:
+                self._wait_before_retry(attempt)
             try:
                 return super().load_task(task_id)
             except Exception as e:
@@ -782,6 +880,8 @@ class SafeDailyJSONPersistence(DailyJSONPersistence):
     def delete_task(self, task_id: str) -> bool:
         """Delete a task with retry mechanism."""
         for attempt in range(self.max_retries):
+            if attempt:
+                self._wait_before_retry(attempt)
             try:
                 result = super().delete_task(task_id)
                 if result:
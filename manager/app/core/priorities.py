@@ -13,7 +13,8 @@ This keeps behavior deterministic without introducing a global queue.
 
 from __future__ import annotations
 
-import math
+import functools
+import re
 from typing import Mapping, Optional
 from urllib.parse import urlparse
 
@@ -22,10 +23,19 @@ from app.models.models import Task
 
 logger = setup_default_logging()
 
+# Fast path for the common ``scheme://host[:port][/?#...]`` shape. URLs with user
+# info, IPv6 literals or any unusual character do not match and go through urlparse.
+_PLAIN_HOST_URL_PATTERN = re.compile(
+    r"[A-Za-z][A-Za-z0-9+.-]*://([A-Za-z0-9.-]+)(?::[0-9]*)?(?:[/?#]|\Z)"
+)
 
+
+@functools.lru_cache(maxsize=1024)
 def hostname_from_url(url: str) -> Optional[str]:
     """Extract and normalize hostname from a URL.
 
+    Memoized: quota checks ask for the same few callback URLs over and over.
+
     Args:
         url: URL string that may contain a hostname in netloc.
 
@@ -36,6 +46,11 @@ def hostname_from_url(url: str) -> Optional[str]:
     if not url:
         logger.debug("hostname_from_url: empty url")
         return None
+    match = _PLAIN_HOST_URL_PATTERN.match(url)
+    if match:
+        normalized = match.group(1).lower()
+        logger.debug("hostname_from_url: extracted hostname=%s", normalized)
+        return normalized
     try:
         parsed = urlparse(url)
     except Exception:
@@ -69,7 +84,13 @@ def is_priority_hostname(hostname: Optional[str], priority_domain: str) -> bool:
     if not hostname:
         logger.debug("is_priority_hostname: no hostname")
         return False
-    domain = (priority_domain or "").strip().lower()
+    return _is_priority(hostname, priority_domain or "")
+
+
+@functools.lru_cache(maxsize=1024)
+def _is_priority(hostname: str, priority_domain: str) -> bool:
+    """Memoized suffix match behind ``is_priority_hostname`` (non-empty hostname)."""
+    domain = priority_domain.strip().lower()
     if not domain:
         logger.debug("is_priority_hostname: empty priority_domain")
         return False
@@ -109,12 +130,13 @@ def other_domain_running_count(tasks: Mapping[str, Task], priority_domain: str)
         Number of tasks in status ``running`` whose notify hostname is
         non-priority.
     """
-    count = 0
-    for task in tasks.values():
-        if task.status != "running":
-            continue
-        if not is_priority_task(task, priority_domain):
-            count += 1
+    # URL parsing and the domain match are both memoized, so repeated callback URLs are cheap
+    count = sum(
+        1
+        for task in tasks.values()
+        if task.status == "running"
+        and not is_priority_hostname(hostname_from_url(task.notify_url), priority_domain)
+    )
     logger.debug(
         "other_domain_running_count: priority_domain=%s count=%d",
         (priority_domain or "").strip().lower(),
@@ -123,12 +145,13 @@ def other_domain_running_count(tasks: Mapping[str, Task], priority_domain: str)
     return count
 
 
+@functools.lru_cache(maxsize=64)
 def max_other_concurrent_tasks(runner_capacity: int, max_other_percent: int) -> int:
     """Compute max allowed concurrent non-priority tasks.
 
     Rules:
     - Inputs are clamped to ``capacity >= 0`` and ``0 <= percent <= 100``.
-    - Base quota is ``floor(capacity * percent / 100)``.
+    - Base quota is ``floor(capacity * percent / 100)``, computed in integers.
     - If ``capacity > 0`` and ``percent > 0``, a minimum quota of ``1`` applies.
 
     Args:
@@ -140,7 +163,8 @@ def max_other_concurrent_tasks(runner_capacity: int, max_other_percent: int) ->
     """
     capacity = max(0, int(runner_capacity))
     pct = max(0, min(100, int(max_other_percent)))
-    max_other = int(math.floor(capacity * (pct / 100.0)))
+    # Integer division: percent / 100.0 in floats rounds e.g. 100 * 29% down to 28
+    max_other = (capacity * pct) // 100
     if capacity > 0 and pct > 0:
         max_other = max(1, max_other)
     logger.debug(
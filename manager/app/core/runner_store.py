@@ -10,13 +10,26 @@ In development, it falls back to an in-memory dictionary.
 
 import json
 import logging
+from contextlib import AbstractContextManager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterator, MutableMapping, Optional, TypeVar, cast, overload
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    MutableMapping,
+    Optional,
+    Tuple,
+    TypeVar,
+    cast,
+    overload,
+)
 from uuid import uuid4
 
 from filelock import FileLock, Timeout
 
+from app.core import json_codec
 from app.models.models import Runner
 
 logger = logging.getLogger(__name__)
@@ -34,15 +47,26 @@ class RunnerStore(MutableMapping[str, Runner]):
         shared_enabled: bool,
         state_file: str = "data/runners_state.json",
         lock_timeout: int = 10,
+        lock_factory: Callable[[str, int], AbstractContextManager] = FileLock,
     ):
+        """
+        Args:
+            shared_enabled: Share runner state across processes through the state file
+            state_file: JSON state file path (relative paths are anchored to the manager root)
+            lock_timeout: Seconds to wait for the state file lock
+            lock_factory: Builds the lock from (lock path, timeout); FileLock by default.
+                Single-process callers (tests) can pass an in-process lock instead.
+        """
         self.shared_enabled = shared_enabled
         self._memory: Dict[str, Runner] = {}
         self._state_file = self._resolve_state_file(state_file)
-        self._lock: Optional[FileLock] = None
+        self._lock: Optional[AbstractContextManager] = None
+        # Raw bytes of the state file last read and their decoded content
+        self._state_cache: Optional[Tuple[bytes, Any]] = None
 
         if self.shared_enabled:
             self._state_file.parent.mkdir(parents=True, exist_ok=True)
-            self._lock = FileLock(f"{self._state_file}.lock", timeout=lock_timeout)
+            self._lock = lock_factory(f"{self._state_file}.lock", lock_timeout)
             self._initialize_state_file()
             logger.info(f"Runner store initialized in shared mode: {self._state_file}")
         else:
@@ -82,7 +106,8 @@ class RunnerStore(MutableMapping[str, Runner]):
     def _runner_to_dict(self, runner: Runner) -> Dict[str, Any]:
         # Keep JSON output stable and datetime-safe for cross-worker reloads.
         if hasattr(runner, "model_dump_json"):
-            return cast(Dict[str, Any], json.loads(runner.model_dump_json()))
+            # Pydantic v2 yields JSON-safe values directly, without a text round-trip.
+            return runner.model_dump(mode="json")
         if hasattr(runner, "json"):
             return cast(Dict[str, Any], json.loads(runner.json()))
 
@@ -112,13 +137,31 @@ class RunnerStore(MutableMapping[str, Runner]):
 
         self._with_lock(_operation)
 
-    def _read_disk(self) -> Dict[str, Runner]:
-        if not self._state_file.exists():
+    def _read_state_document(self) -> Any:
+        """
+        Return the decoded state file, reusing the last decode while its bytes are unchanged.
+
+        The file is still read on every call; only the JSON decode is skipped. The
+        cache is keyed on content rather than stat metadata, which can stay the same
+        across a replace on filesystems with coarse mtimes or skewed clocks (NFS).
+        """
+        try:
+            with self._state_file.open("rb") as f:
+                content = f.read()
+        except FileNotFoundError:
             return {}
 
+        cached = self._state_cache
+        if cached is not None and cached[0] == content:
+            return cached[1]
+
+        raw = json_codec.loads(content)
+        self._state_cache = (content, raw)
+        return raw
+
+    def _read_disk(self) -> Dict[str, Runner]:
         try:
-            with self._state_file.open("r", encoding="utf-8") as f:
-                raw = json.load(f)
+            raw = self._read_state_document()
         except json.JSONDecodeError as exc:
             logger.error(f"Runner state JSON is invalid: {exc}")
             return {}
@@ -145,8 +188,8 @@ class RunnerStore(MutableMapping[str, Runner]):
         serialized = {runner_id: self._runner_to_dict(r) for runner_id, r in data.items()}
         self._state_file.parent.mkdir(parents=True, exist_ok=True)
         tmp_path = self._state_file.with_name(f"{self._state_file.name}.{uuid4().hex}.tmp")
-        with tmp_path.open("w", encoding="utf-8") as f:
-            json.dump(serialized, f, indent=2, ensure_ascii=False)
+        with tmp_path.open("wb") as f:
+            f.write(json_codec.dumps_document(serialized))
         tmp_path.replace(self._state_file)
 
     def __getitem__(self, key: str) -> Runner:
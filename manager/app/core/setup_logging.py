@@ -4,7 +4,7 @@ Logging configuration module for runner management API.
 Provides flexible logging setup with support for JSON formatting, file rotation, and syslog.
 """
 
-import json
+import functools
 import logging
 import os
 import stat
@@ -13,10 +13,13 @@ from datetime import datetime
 from logging.handlers import RotatingFileHandler, SysLogHandler
 from typing import Any, Callable, Dict, Optional
 
+from app.core import json_codec
 from app.core.config import config
 
 _DEFAULT_SYSLOG_ADDRESSES = ("/dev/log", "/var/run/syslog")
 _LOGGER_DISPLAY_ALIASES = {"uvicorn.error": "uvicorn.server"}
+# Extra record attributes copied into JSON log entries when set
+_JSON_CUSTOM_FIELDS = ("task_id", "runner_id", "component", "operation")
 
 
 def _resolve_display_logger_name(logger_name: str) -> str:
@@ -63,8 +66,7 @@ class JSONFormatter(logging.Formatter):
             "line": record.lineno,
         }
 
-        custom_fields = ["task_id", "runner_id", "component", "operation"]
-        for field in custom_fields:
+        for field in _JSON_CUSTOM_FIELDS:
             if hasattr(record, field):
                 log_record[field] = getattr(record, field)
 
@@ -74,10 +76,15 @@ class JSONFormatter(logging.Formatter):
                 self.formatStack(record.stack_info) if record.stack_info else None
             )
 
-        return json.dumps(log_record, ensure_ascii=False)
+        return json_codec.dumps_line(log_record)
 
 
+@functools.lru_cache(maxsize=16)
 def _coerce_log_level(level: int | str) -> int:
+    """Return the numeric level for a level number or name (unknown names map to INFO).
+
+    Memoized: every logger setup resolves one of a handful of level names.
+    """
     if isinstance(level, int):
         return level
     level_name = level.strip().upper()
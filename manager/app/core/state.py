@@ -225,6 +225,20 @@ def get_tasks_snapshot() -> Dict[str, Task]:
     return dict(merged_tasks)
 
 
+def get_tasks_count() -> int:
+    """
+    Return the number of tasks a snapshot would contain.
+
+    Outside production the in-memory cache is counted directly instead of
+    being copied, since only its size is needed.
+    """
+    if IS_PRODUCTION:
+        return len(get_tasks_snapshot())
+
+    _purge_deleted_tasks_from_memory(_get_deleted_task_ids())
+    return len(tasks)
+
+
 def delete_task(task_id: str) -> bool:
     """Delete a task from persistence and the in-memory cache."""
     task = tasks.get(task_id)
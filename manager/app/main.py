@@ -95,14 +95,29 @@ async def lifespan(app: FastAPI):
     await background_manager.stop_all_services()
 
 
+def _build_openapi_config(visibility: str) -> dict:
+    """
+    Build FastAPI keyword arguments for the given API docs visibility.
+
+    Private docs disable the default OpenAPI routes; protected ones are
+    added in lifespan instead.
+
+    Args:
+        visibility: API_DOCS_VISIBILITY value ("public" or "private")
+
+    Returns:
+        dict: Keyword arguments for the FastAPI constructor
+    """
+    openapi_config = OpenAPIConfig.get_fastapi_config()
+    if visibility == "private":
+        openapi_config["docs_url"] = None
+        openapi_config["redoc_url"] = None
+        openapi_config["openapi_url"] = None
+    return openapi_config
+
+
 # FastAPI application configuration
-# Disable default OpenAPI routes if authentication is enabled
-openapi_config = OpenAPIConfig.get_fastapi_config()
-if config.API_DOCS_VISIBILITY == "private":
-    # Disable default routes, we'll create protected ones in lifespan
-    openapi_config["docs_url"] = None
-    openapi_config["redoc_url"] = None
-    openapi_config["openapi_url"] = None
+openapi_config = _build_openapi_config(config.API_DOCS_VISIBILITY)
 
 app = FastAPI(lifespan=lifespan, **openapi_config)
 
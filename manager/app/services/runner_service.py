@@ -29,21 +29,26 @@ async def check_runners_activity(
             break
 
         await asyncio.sleep(poll_interval)
-        now = datetime.now()
-        runners_to_remove = []
+        _check_runners_once()
 
-        for runner_id, runner in runners.items():
-            # Remove runners without heartbeat for 1+ minutes
-            if now - runner.last_heartbeat > timedelta(minutes=1):
-                runners_to_remove.append(runner_id)
 
-        for runner_id in runners_to_remove:
-            current_runner = runners.get(runner_id)
-            if current_runner is None:
-                continue
-            if now - current_runner.last_heartbeat > timedelta(minutes=1):
-                del runners[runner_id]
-                logger.info(f"Runner {runner_id} removed due to inactivity")
+def _check_runners_once() -> None:
+    """Remove runners without heartbeat for 1+ minutes (one pass of the activity monitor)."""
+    now = datetime.now()
+    runners_to_remove = []
+
+    for runner_id, runner in runners.items():
+        # Remove runners without heartbeat for 1+ minutes
+        if now - runner.last_heartbeat > timedelta(minutes=1):
+            runners_to_remove.append(runner_id)
+
+    for runner_id in runners_to_remove:
+        current_runner = runners.get(runner_id)
+        if current_runner is None:
+            continue
+        if now - current_runner.last_heartbeat > timedelta(minutes=1):
+            del runners[runner_id]
+            logger.info(f"Runner {runner_id} removed due to inactivity")
 
 
 def get_online_runners() -> List[Dict]:
@@ -54,11 +59,12 @@ def get_online_runners() -> List[Dict]:
         List[Dict]: Online runners with their status information
     """
     online_runners = []
-    now = datetime.now()
+    # Online if heartbeat < 60s
+    cutoff = datetime.now() - timedelta(seconds=60)
 
     for runner_id, runner in runners.items():
         last_heartbeat = runner.last_heartbeat
-        if (now - last_heartbeat).total_seconds() < 60:  # Online if heartbeat < 60s
+        if last_heartbeat > cutoff:
             online_runners.append(
                 {
                     "id": runner_id,
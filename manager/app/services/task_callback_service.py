@@ -1,11 +1,13 @@
 """Validation, delivery and retry handling for task completion callbacks."""
 
 import asyncio
+import functools
 import ipaddress
 import json
 import socket
+import time
 from datetime import datetime
-from typing import Any, List, cast
+from typing import Any, Dict, FrozenSet, List, Tuple, cast
 from urllib.parse import ParseResult, urlparse
 
 import httpx
@@ -13,21 +15,39 @@ from fastapi import HTTPException
 
 from app.models.models import Task, TaskCompletionNotification
 
+# Successful DNS lookups for notify hosts: host -> (monotonic expiry, sorted IPs)
+RESOLVED_HOSTS_TTL_SECONDS = 300.0
+RESOLVED_HOSTS_MAXSIZE = 1024
+_resolved_hosts: Dict[str, Tuple[float, Tuple[str, ...]]] = {}
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_allowlist(allowed_hosts: Tuple[str, ...]) -> Tuple[FrozenSet[str], Tuple[str, ...]]:
+    """Normalize an allowlist once into exact hosts and ".host" subdomain suffixes."""
+    exact = frozenset(
+        normalized
+        for allowed in allowed_hosts
+        if (normalized := (allowed or "").strip().lower().rstrip("."))
+    )
+    return exact, tuple("." + allowed for allowed in exact)
+
 
 def host_matches_allowlist(host: str, allowed_hosts: List[str]) -> bool:
     """Return whether a host is an exact or subdomain allowlist match."""
     host = (host or "").strip().lower().rstrip(".")
-    if not host:
+    if not host or not allowed_hosts:
         return False
-    for allowed in allowed_hosts:
-        normalized = (allowed or "").strip().lower().rstrip(".")
-        if normalized and (host == normalized or host.endswith("." + normalized)):
-            return True
-    return False
+    exact, suffixes = _compile_allowlist(tuple(allowed_hosts))
+    # str.endswith() checks every suffix in a single call
+    return host in exact or host.endswith(suffixes)
 
 
+@functools.lru_cache(maxsize=4096)
 def is_disallowed_ip(ip: str) -> bool:
-    """Return whether an IP must be blocked for outbound callbacks."""
+    """Return whether an IP must be blocked for outbound callbacks.
+
+    Memoized: callback hosts resolve to the same few addresses again and again.
+    """
     try:
         address = ipaddress.ip_address(ip)
     except ValueError:
@@ -50,6 +70,26 @@ async def resolve_host_ips(host: str) -> List[str]:
     return sorted(ips)
 
 
+async def resolve_host_ips_cached(host: str) -> List[str]:
+    """Resolve a hostname, reusing a successful lookup for RESOLVED_HOSTS_TTL_SECONDS.
+
+    Failures and empty answers are not cached, so they are retried on the next call.
+    """
+    now = time.monotonic()
+    cached = _resolved_hosts.get(host)
+    if cached is not None and cached[0] > now:
+        return list(cached[1])
+
+    ips = await resolve_host_ips(host)
+    if ips:
+        _resolved_hosts.pop(host, None)
+        if len(_resolved_hosts) >= RESOLVED_HOSTS_MAXSIZE:
+            # Dicts keep insertion order: drop the oldest lookup
+            _resolved_hosts.pop(next(iter(_resolved_hosts)))
+        _resolved_hosts[host] = (now + RESOLVED_HOSTS_TTL_SECONDS, tuple(ips))
+    return ips
+
+
 def parse_notify_url(url: str) -> tuple[ParseResult, str]:
     """Parse and syntactically validate a notify URL."""
     if not url:
@@ -8,16 +8,21 @@ Default output: docs/tree.png
 Usage:
   uv run scripts/generate_tree_diagram.py
   uv run scripts/generate_tree_diagram.py --max-depth 6 --out docs/tree.png
+  uv run scripts/generate_tree_diagram.py --optimize
 """
 
 from __future__ import annotations
 
 import argparse
 import fnmatch
+import functools
+import os
+import re
+import weakref
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List, Sequence
+from typing import Callable, Dict, List, Sequence, Tuple
 
 from PIL import Image, ImageDraw, ImageFont
 
@@ -52,45 +57,106 @@ class RenderConfig:
     padding_x: int = 30
     padding_y: int = 30
     line_spacing: float = 1.25
-    bg: tuple[int, int, int] = (255, 255, 255)
-    fg: tuple[int, int, int] = (20, 20, 30)
+    # Colors are 8-bit gray levels (RGB tuples are accepted and converted to luma).
+    bg: int | tuple[int, int, int] = 255
+    fg: int | tuple[int, int, int] = 21
     max_width_px: int = 5200
     max_height_px: int = 5200
+    # The image is mostly background: fast deflate keeps it small enough for dev/CI.
+    compress_level: int = 1
+    optimize: bool = False
+
+
+def _to_gray(color: int | tuple[int, int, int]) -> int:
+    if isinstance(color, int):
+        return color
+    r, g, b = color
+    return int(round(0.299 * r + 0.587 * g + 0.114 * b))
+
+
+FONT_CANDIDATES = (
+    "/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf",
+    "/usr/share/fonts/truetype/liberation/LiberationMono-Regular.ttf",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+)
+
+# First usable font path, resolved once per process ("" when none is usable).
+_resolved_font_path: str | None = None
+
+
+def _resolve_font_path() -> str:
+    global _resolved_font_path
+    if _resolved_font_path is None:
+        _resolved_font_path = ""
+        for path in FONT_CANDIDATES:
+            if not os.path.exists(path):
+                continue
+            try:
+                ImageFont.truetype(path, size=10)
+            except Exception:
+                continue
+            _resolved_font_path = path
+            break
+    return _resolved_font_path
 
 
-def _load_monospace_font(size: int) -> ImageFont.ImageFont:
-    candidates = [
-        "/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf",
-        "/usr/share/fonts/truetype/liberation/LiberationMono-Regular.ttf",
-        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-    ]
-    for path in candidates:
-        try:
-            return ImageFont.truetype(path, size=size)
-        except Exception:
-            continue
+@functools.lru_cache(maxsize=4)
+def _load_monospace_font(size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+    path = _resolve_font_path()
+    if path:
+        return ImageFont.truetype(path, size=size)
     return ImageFont.load_default()
 
 
-def _should_ignore(name: str, patterns: Sequence[str]) -> bool:
-    for pat in patterns:
-        if pat == name:
-            return True
-        if any(ch in pat for ch in "*?[") and fnmatch.fnmatch(name, pat):
-            return True
-    return False
+# Per-font glyph advance (None for proportional fonts), computed once per font object.
+_advance_cache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
 
 
-def _iter_children(path: Path, ignore: Sequence[str]) -> List[Path]:
+def _glyph_advance(font: ImageFont.FreeTypeFont | ImageFont.ImageFont) -> float | None:
     try:
-        children = list(path.iterdir())
-    except Exception:
-        return []
+        return _advance_cache[font]
+    except KeyError:
+        pass
+    advance = font.getlength("M")
+    result = advance if font.getlength("i") == advance else None
+    _advance_cache[font] = result
+    return result
+
+
+def _measure_max_width(
+    lines: Sequence[str],
+    font: ImageFont.FreeTypeFont | ImageFont.ImageFont,
+    cap: int | None = None,
+) -> int:
+    """Return the widest line width in pixels, stopping early once ``cap`` is reached."""
+    advance = _glyph_advance(font)
+    if advance is not None:
+        # Monospace: the widest line is the longest one.
+        return int(max((len(line) for line in lines), default=0) * advance)
+
+    # Proportional font: every line must be measured, unless the cap is hit first.
+    max_w = 0
+    for line in lines:
+        width = int(font.getlength(line))
+        if width > max_w:
+            max_w = width
+            if cap is not None and max_w >= cap:
+                break
+    return max_w
+
+
+def _make_skip(patterns: Sequence[str]) -> Callable[[str], bool]:
+    """Build the ignore predicate once: exact names in a set, globs in one regex."""
+    exact = {pat for pat in patterns if not any(ch in pat for ch in "*?[")}
+    globs = [pat for pat in patterns if pat not in exact]
+    glob_re = re.compile("|".join(fnmatch.translate(pat) for pat in globs)) if globs else None
+
+    def skip(name: str) -> bool:
+        if name in exact:
+            return True
+        return glob_re is not None and glob_re.match(os.path.normcase(name)) is not None
 
-    filtered = [p for p in children if not _should_ignore(p.name, ignore)]
-    # Directories first, then files; stable sort by name.
-    filtered.sort(key=lambda p: (not p.is_dir(), p.name.lower()))
-    return filtered
+    return skip
 
 
 def build_tree_lines(
@@ -100,34 +166,49 @@ def build_tree_lines(
     max_lines: int,
 ) -> List[str]:
     lines: List[str] = []
+    skip = _make_skip(ignore)
+    root_path = os.fspath(root)
+    # Directories scheduled by the walk: path -> (own line, prefix for its children, depth).
+    pending: Dict[str, Tuple[str, str, int]] = {}
 
-    def walk(dir_path: Path, prefix: str, depth: int):
-        if max_lines > 0 and len(lines) >= max_lines:
-            return
+    def on_error(exc: OSError) -> None:
+        # Unreadable directory: still list it, just without children.
+        entry = pending.pop(exc.filename, None) if exc.filename else None
+        if entry is not None and not (max_lines > 0 and len(lines) >= max_lines):
+            lines.append(entry[0])
 
-        if max_depth >= 0 and depth > max_depth:
-            return
+    # Root line
+    lines.append(root.name + "/")
 
-        # Only show directories in the tree.
-        children = [p for p in _iter_children(dir_path, ignore) if p.is_dir()]
-        count = len(children)
+    # os.walk separates directories from files for us (files are never stat'ed) and
+    # visits directories in pre-order, following the in-place sorted dirnames.
+    for dirpath, dirnames, _ in os.walk(
+        root_path, topdown=True, onerror=on_error, followlinks=True
+    ):
+        if max_lines > 0 and len(lines) >= max_lines:
+            break
 
-        for idx, child in enumerate(children):
-            if max_lines > 0 and len(lines) >= max_lines:
-                return
+        if dirpath == root_path:
+            prefix, depth = "", 0
+        else:
+            line, prefix, depth = pending.pop(dirpath)
+            lines.append(line)
 
-            is_last = idx == count - 1
-            branch = "└── " if is_last else "├── "
-            name = child.name + "/"
-            lines.append(prefix + branch + name)
+        if max_depth >= 0 and depth + 1 > max_depth:
+            dirnames[:] = []
+            continue
 
+        dirnames[:] = sorted((d for d in dirnames if not skip(d)), key=str.lower)
+        last = len(dirnames) - 1
+        for idx, name in enumerate(dirnames):
+            is_last = idx == last
+            branch = "└── " if is_last else "├── "
             extension = "    " if is_last else "│   "
-            walk(child, prefix + extension, depth + 1)
-
-    # Root line
-    root_name = root.name + "/"
-    lines.append(root_name)
-    walk(root, "", 1)
+            pending[os.path.join(dirpath, name)] = (
+                prefix + branch + name + "/",
+                prefix + extension,
+                depth + 1,
+            )
 
     if max_lines > 0 and len(lines) >= max_lines:
         lines.append("… (tree truncated: max-lines reached)")
@@ -138,36 +219,41 @@ def build_tree_lines(
 def render_png(lines: Sequence[str], out_path: Path, cfg: RenderConfig, title: str) -> None:
     font = _load_monospace_font(cfg.font_size)
 
-    # Create a temporary draw context to measure text.
-    tmp = Image.new("RGB", (10, 10), cfg.bg)
-    draw = ImageDraw.Draw(tmp)
-
+    # Bind config values once; the draw loop below runs once per line.
+    padding_x = cfg.padding_x
+    padding_y = cfg.padding_y
     line_h = int(cfg.font_size * cfg.line_spacing)
+    max_w_cap = cfg.max_width_px
+    max_h_cap = cfg.max_height_px
 
     # Prepend title lines.
-    all_lines = [title, ""] + list(lines)
+    all_lines = [title, "", *lines]
 
-    widths = [int(draw.textlength(line, font=font)) for line in all_lines]
-    max_w = max(widths) if widths else 0
+    # Measure from font metrics directly: no throwaway image/draw context needed.
+    max_w = _measure_max_width(all_lines, font, cap=max_w_cap - padding_x * 2)
 
-    img_w = min(cfg.max_width_px, max_w + cfg.padding_x * 2)
-    img_h = min(cfg.max_height_px, len(all_lines) * line_h + cfg.padding_y * 2)
+    img_w = min(max_w_cap, max_w + padding_x * 2)
+    img_h = min(max_h_cap, len(all_lines) * line_h + padding_y * 2)
 
-    img = Image.new("RGB", (img_w, img_h), cfg.bg)
+    # Single foreground on a single background: 8-bit grayscale is enough.
+    fg = _to_gray(cfg.fg)
+    img = Image.new("L", (img_w, img_h), _to_gray(cfg.bg))
     draw = ImageDraw.Draw(img)
+    draw_text = draw.text
 
-    x = cfg.padding_x
-    y = cfg.padding_y
+    x = padding_x
+    y = padding_y
+    y_limit = img_h - padding_y
 
-    for i, line in enumerate(all_lines):
-        if y + line_h > img_h - cfg.padding_y:
-            draw.text((x, y), "… (image truncated: max height reached)", font=font, fill=cfg.fg)
+    for line in all_lines:
+        if y + line_h > y_limit:
+            draw_text((x, y), "… (image truncated: max height reached)", font=font, fill=fg)
             break
-        draw.text((x, y), line, font=font, fill=cfg.fg)
+        draw_text((x, y), line, font=font, fill=fg)
         y += line_h
 
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    img.save(out_path, format="PNG")
+    img.save(out_path, format="PNG", optimize=cfg.optimize, compress_level=cfg.compress_level)
 
 
 def _build_arg_parser() -> argparse.ArgumentParser:
@@ -200,6 +286,11 @@ def _build_arg_parser() -> argparse.ArgumentParser:
         default=[],
         help="Add ignore pattern (can be repeated).",
     )
+    p.add_argument(
+        "--optimize",
+        action="store_true",
+        help="Use maximum PNG compression (smaller file, slower save) for release artifacts.",
+    )
     return p
 
 
@@ -218,7 +309,8 @@ def main() -> int:
         root=root, ignore=ignore, max_depth=args.max_depth, max_lines=args.max_lines
     )
 
-    render_png(lines=lines, out_path=out_path, cfg=RenderConfig(), title=title)
+    cfg = RenderConfig(compress_level=9, optimize=True) if args.optimize else RenderConfig()
+    render_png(lines=lines, out_path=out_path, cfg=cfg, title=title)
     print(f"Wrote: {out_path}")
     return 0
 
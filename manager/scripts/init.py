@@ -16,6 +16,7 @@ Usage:
 from __future__ import annotations
 
 import os
+import re
 from pathlib import Path
 from typing import Dict, Iterable, Mapping
 
@@ -27,31 +28,25 @@ ENV_KEY_ALIASES = {
 }
 
 
-def _strip_quotes(value: str) -> str:
-    # Remove optional surrounding quotes to support values like "…" or '…'.
-    if len(value) >= 2 and value[0] == value[-1] and value[0] in {'"', "'"}:
-        return value[1:-1]
-    return value
+# One KEY=VALUE assignment per line: optional "export" prefix, single- or
+# double-quoted values, and trailing comments. As in python-dotenv, "#" only
+# starts a comment after an unquoted value when whitespace precedes it.
+_ENV_RE = re.compile(
+    r"^[ \t]*(?:export[ \t]+)?([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*"
+    r"(?:\"([^\"\n]*)\"[ \t]*(?:#.*)?|'([^'\n]*)'[ \t]*(?:#.*)?|([^\n\r]*?)(?:[ \t]+#.*)?)"
+    r"[ \t]*\r?$",
+    re.M,
+)
 
 
 def read_env_file(env_path: Path) -> Dict[str, str]:
     # Minimal .env parser: supports KEY=VALUE lines and ignores comments.
-    data: Dict[str, str] = {}
     if not env_path.exists():
-        return data
-    for raw in env_path.read_text(encoding="utf-8").splitlines():
-        line = raw.strip()
-        if not line or line.startswith("#"):
-            continue
-        if line.startswith("export "):
-            line = line[len("export ") :].lstrip()
-        if "=" not in line:
-            continue
-        key, value = line.split("=", 1)
-        key = key.strip()
-        value = _strip_quotes(value.strip())
-        data[key] = value
-    return data
+        return {}
+    text = env_path.read_text(encoding="utf-8")
+    return {
+        m.group(1): (m.group(2) or m.group(3) or m.group(4) or "") for m in _ENV_RE.finditer(text)
+    }
 
 
 def resolve_target_uid_gid() -> tuple[int, int]:
@@ -20,6 +20,8 @@ import re
 import sys
 from pathlib import Path
 
+_VERSION_RE = re.compile(r"^__version__\s*=\s*['\"]([^'\"]*)['\"]", re.M)
+
 
 def get_project_root() -> Path:
     """Get the project root directory."""
@@ -33,7 +35,7 @@ def get_current_version() -> str:
         raise FileNotFoundError(f"Version file not found: {version_file}")
 
     content = version_file.read_text()
-    version_match = re.search(r"^__version__\s*=\s*['\"]([^'\"]*)['\"]", content, re.M)
+    version_match = _VERSION_RE.search(content)
     if version_match:
         return version_match.group(1)
     raise ValueError("Unable to find version string in __version__.py")
@@ -81,21 +83,24 @@ def update_version_file(new_version: str) -> None:
     content = version_file.read_text()
 
     # Update __version__
-    content = re.sub(
-        r"^__version__\s*=\s*['\"]([^'\"]*)['\"]",
-        f'__version__ = "{new_version}"',
-        content,
-        flags=re.M,
-    )
+    new_content = _VERSION_RE.sub(f'__version__ = "{new_version}"', content)
+    if new_content == content:
+        print(f"✓ {version_file} (unchanged)")
+        return
 
-    version_file.write_text(content)
+    version_file.write_text(new_content)
     print(f"✓ Updated {version_file}")
 
 
 def update_version_txt(new_version: str) -> None:
     """Update the VERSION file with the new version."""
     version_txt = get_project_root() / "VERSION"
-    version_txt.write_text(f"{new_version}\n")
+    new_content = f"{new_version}\n"
+    if version_txt.exists() and version_txt.read_text() == new_content:
+        print(f"✓ {version_txt} (unchanged)")
+        return
+
+    version_txt.write_text(new_content)
     print(f"✓ Updated {version_txt}")
 
 
@@ -1,6 +1,7 @@
 """Pytest configuration and fixtures for the Manager test suite."""
 
 import asyncio
+import functools
 import os
 import sys
 import threading
@@ -12,6 +13,7 @@ import fastapi.testclient as fastapi_testclient
 import httpx
 import pytest
 import starlette.testclient as starlette_testclient
+from state_helpers import isolated_mapping
 
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if PROJECT_ROOT not in sys.path:
@@ -173,19 +175,77 @@ from app.core import state as state_module
 from app.core.config import config
 
 
+def pytest_sessionstart(session):
+    """Build the FastAPI app graph once, before collection imports any test module."""
+
+    import app.main  # noqa: F401
+
+
+_uncached_pwd_verify: Any = None
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_pwd_verify(password: Any, hashed_password: Any) -> bool:
+    """Memoize bcrypt verification: identical (password, hash) pairs always agree."""
+    return _uncached_pwd_verify(password, hashed_password)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def cache_pwd_verify():
+    """Route config.pwd_context.verify through an LRU cache for the whole session."""
+
+    global _uncached_pwd_verify
+
+    pwd_context = config.pwd_context
+    _uncached_pwd_verify = pwd_context.verify
+    pwd_context.verify = _cached_pwd_verify
+
+    yield
+
+    del pwd_context.verify
+    _cached_pwd_verify.cache_clear()
+    _uncached_pwd_verify = None
+
+
+@pytest.fixture(scope="session")
+def hashed_password() -> tuple[str, str]:
+    """Return a (password, bcrypt hash) pair, hashed once for the whole session."""
+
+    password = "test_password_123"
+    return password, config.pwd_context.hash(password)
+
+
+async def _noop_background_service(*_: Any, **__: Any) -> None:
+    """Stand-in for background service startup/shutdown."""
+    return None
+
+
+@pytest.fixture(scope="session", autouse=True)
+def stub_background_services():
+    """Disable the shared background manager's services once for the whole session.
+
+    The instance's methods are patched rather than the module attribute, because
+    app.main holds its own reference to the same background_manager object.
+    """
+
+    from app.services.background_service import background_manager
+
+    with pytest.MonkeyPatch.context() as patcher:
+        for name in ("start_all_services", "stop_all_services"):
+            patcher.setattr(background_manager, name, _noop_background_service)
+        yield
+
+
 @pytest.fixture(autouse=True)
 def ensure_test_tokens(monkeypatch):
     """Ensure at least one authorized token exists for tests."""
 
-    original_tokens: Dict[str, str] = dict(config.AUTHORIZED_TOKENS)
-
+    # monkeypatch records the original mapping and restores it on undo; no copy needed.
     if not config.AUTHORIZED_TOKENS:
         monkeypatch.setattr(config, "AUTHORIZED_TOKENS", {"test": "test-token"})
 
     yield
 
-    monkeypatch.setattr(config, "AUTHORIZED_TOKENS", original_tokens)
-
 
 @pytest.fixture(autouse=True)
 def isolate_deleted_task_tombstones(monkeypatch):
@@ -201,17 +261,38 @@ def isolate_deleted_task_tombstones(monkeypatch):
 def isolate_runtime_state(monkeypatch):
     """Isolate mutable runtime state and force development mode for deterministic tests."""
 
-    original_tasks = dict(state_module.tasks)
-
-    state_module.tasks.clear()
-
     monkeypatch.setattr(state_module, "IS_PRODUCTION", False)
     monkeypatch.setattr(config, "ENVIRONMENT", "development")
 
-    yield
+    with isolated_mapping(state_module.tasks):
+        yield
+
+
+@pytest.fixture(scope="session")
+def _pristine_config():
+    """Build one Config from a clean environment; tests get shallow copies of it."""
 
-    state_module.tasks.clear()
-    state_module.tasks.update(original_tasks)
+    from app.core import config as config_module
+
+    with pytest.MonkeyPatch.context() as patcher:
+        for key in list(os.environ):
+            if key in config_module._CONFIG_ENV_KEYS or any(
+                key.startswith(prefix) for prefix in config_module._CONFIG_ENV_PREFIXES
+            ):
+                patcher.delenv(key, raising=False)
+        patcher.setenv("OPENAPI_COOKIE_SECRET", "unit-test-secret")
+        return config_module.Config()
+
+
+@pytest.fixture
+def config_copy(_pristine_config):
+    """Return a per-test shallow copy of the pristine Config, safe to mutate."""
+
+    import copy
+
+    cfg = copy.copy(_pristine_config)
+    cfg._configuration_errors = list(_pristine_config._configuration_errors)
+    return cfg
 
 
 @pytest.fixture
@@ -225,21 +306,55 @@ def auth_headers() -> Dict[str, str]:
     }
 
 
-@pytest.fixture
-def client(monkeypatch):
-    """Test client with background services disabled for fast, deterministic runs."""
+@pytest.fixture(scope="session")
+def _app_client():
+    """Session-wide test client: app lifespan startup/shutdown runs once for all users."""
 
     from fastapi.testclient import TestClient
 
     from app.main import app
-    from app.services import background_service
 
-    async def _noop(*_, **__):
-        """Replace background service startup/shutdown with a no-op."""
-        return None
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def api_client(_app_client):
+    """Session test client with API token verification bypassed for the current test."""
+
+    from app.core.auth import verify_token
+
+    overrides = _app_client.app.dependency_overrides
+    overrides[verify_token] = lambda: True
+    _app_client.cookies.clear()
+
+    yield _app_client
 
-    monkeypatch.setattr(background_service.background_manager, "start_all_services", _noop)
-    monkeypatch.setattr(background_service.background_manager, "stop_all_services", _noop)
+    overrides.pop(verify_token, None)
+
+
+@pytest.fixture
+def admin_client(_app_client):
+    """Session test client with admin authentication bypassed for the current test."""
+
+    from app.core.auth import verify_admin
+
+    overrides = _app_client.app.dependency_overrides
+    overrides[verify_admin] = lambda: True
+    _app_client.cookies.clear()
+
+    yield _app_client
+
+    overrides.pop(verify_admin, None)
+
+
+@pytest.fixture
+def client():
+    """Test client with background services disabled for fast, deterministic runs."""
+
+    from fastapi.testclient import TestClient
+
+    from app.main import app
 
     with TestClient(app) as test_client:
         yield test_client
@@ -0,0 +1,23 @@
+"""Helpers isolating the shared in-memory manager state in tests."""
+
+from contextlib import contextmanager
+from typing import Iterator, MutableMapping, TypeVar
+
+MappingT = TypeVar("MappingT", bound=MutableMapping)
+
+
+@contextmanager
+def isolated_mapping(mapping: MappingT) -> Iterator[MappingT]:
+    """Empty a shared mapping for the duration of the block, then restore its entries.
+
+    The mapping object itself is kept: route and service modules import
+    ``runners``/``tasks`` by name, so rebinding the state attribute to a new
+    dict would leave them pointing at the old one.
+    """
+    original = dict(mapping)
+    mapping.clear()
+    try:
+        yield mapping
+    finally:
+        mapping.clear()
+        mapping.update(original)
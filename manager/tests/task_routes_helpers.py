@@ -4,12 +4,12 @@ from datetime import datetime, timedelta
 
 import pytest
 from fastapi.testclient import TestClient
+from state_helpers import isolated_mapping
 
 from app.core.auth import verify_admin, verify_token
 from app.core.state import runners, tasks
 from app.main import app
 from app.models.models import Runner, Task
-from app.services import background_service
 
 
 @pytest.fixture
@@ -24,12 +24,6 @@ def task_module():
 def client(monkeypatch, task_module):
     """Build an authenticated client without background services."""
 
-    async def _noop(*_, **__):
-        return None
-
-    monkeypatch.setattr(background_service.background_manager, "start_all_services", _noop)
-    monkeypatch.setattr(background_service.background_manager, "stop_all_services", _noop)
-
     app.dependency_overrides[verify_token] = lambda: "test-token"
     app.dependency_overrides[verify_admin] = lambda: True
     monkeypatch.setattr(task_module, "save_tasks", lambda: None)
@@ -44,18 +38,8 @@ def client(monkeypatch, task_module):
 @pytest.fixture
 def clean_state():
     """Isolate mutable runner and task state for each test."""
-    original_runners = dict(runners)
-    original_tasks = dict(tasks)
-
-    runners.clear()
-    tasks.clear()
-
-    yield
-
-    runners.clear()
-    runners.update(original_runners)
-    tasks.clear()
-    tasks.update(original_tasks)
+    with isolated_mapping(runners), isolated_mapping(tasks):
+        yield
 
 
 def make_runner(
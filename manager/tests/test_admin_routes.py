@@ -10,6 +10,7 @@ from types import SimpleNamespace
 import pytest
 from fastapi.testclient import TestClient
 from jinja2 import Environment, FileSystemLoader
+from state_helpers import isolated_mapping
 
 from app.api.routes import admin as admin_routes
 from app.api.routes import statistics as statistics_routes
@@ -19,39 +20,15 @@ from app.core.config import config
 from app.core.state import runners, tasks
 from app.main import app
 from app.models.models import Runner, Task
-from app.services import background_service
-
-
-@pytest.fixture
-def admin_client(monkeypatch):
-    async def _noop(*_, **__):
-        return None
-
-    monkeypatch.setattr(background_service.background_manager, "start_all_services", _noop)
-    monkeypatch.setattr(background_service.background_manager, "stop_all_services", _noop)
-
-    app.dependency_overrides[verify_admin] = lambda: True
-
-    with TestClient(app) as client:
-        yield client
-
-    app.dependency_overrides.pop(verify_admin, None)
 
 
 @pytest.fixture
 def clean_state():
-    original_runners = dict(runners)
-    original_tasks = dict(tasks)
-
-    runners.clear()
-    tasks.clear()
+    with isolated_mapping(runners), isolated_mapping(tasks):
+        yield
 
-    yield
 
-    runners.clear()
-    runners.update(original_runners)
-    tasks.clear()
-    tasks.update(original_tasks)
+_NOW_ISO = datetime.now().isoformat()
 
 
 def _make_runner(runner_id: str, *, seconds_ago: int = 0) -> Runner:
@@ -74,8 +51,8 @@ def _make_task(
     created_at: str,
     status: str = "completed",
     parameters: dict | None = None,
+    updated_at: str = _NOW_ISO,
 ) -> Task:
-    now = datetime.now().isoformat()
     return Task(
         task_id=task_id,
         runner_id=runner_id,
@@ -90,7 +67,7 @@ def _make_task(
         notify_url="https://example.com/notify",
         completion_callback=None,
         created_at=created_at,
-        updated_at=now,
+        updated_at=updated_at,
         error=None,
         script_output=None,
     )
@@ -161,15 +138,8 @@ def _render_credentials_template() -> str:
     )
 
 
-def test_admin_dashboard_rate_limit_allows_auto_refresh_margin(monkeypatch):
+def test_admin_dashboard_rate_limit_allows_auto_refresh_margin():
     """Validate dashboard rate limit leaves margin above built-in auto-refresh."""
-
-    async def _noop(*_, **__):
-        return None
-
-    monkeypatch.setattr(background_service.background_manager, "start_all_services", _noop)
-    monkeypatch.setattr(background_service.background_manager, "stop_all_services", _noop)
-
     app.dependency_overrides[verify_admin] = lambda: True
 
     try:
@@ -1018,7 +988,7 @@ def test_hash_admin_password_delegates_to_password_context(monkeypatch):
             captured["password"] = password
             return f"hashed:{password}"
 
-    monkeypatch.setattr(admin_routes, "_PASSWORD_CONTEXT", FakePasswordContext())
+    monkeypatch.setattr(config, "pwd_context", FakePasswordContext())
 
     assert admin_routes._hash_admin_password("secret-password") == "hashed:secret-password"
     assert captured == {"password": "secret-password"}
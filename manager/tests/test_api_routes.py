@@ -5,50 +5,23 @@ from __future__ import annotations
 from datetime import datetime, timedelta
 
 import pytest
-from fastapi.testclient import TestClient
+from state_helpers import isolated_mapping
 
 from app.__version__ import __version__, __version_info__
 from app.core import state as state_module
-from app.core.auth import verify_token
 from app.core.state import runners, tasks
-from app.main import app
 from app.models.models import Runner, Task
-from app.services import background_service
-
-
-@pytest.fixture
-def api_client(monkeypatch):
-    async def _noop(*_, **__):
-        return None
-
-    monkeypatch.setattr(background_service.background_manager, "start_all_services", _noop)
-    monkeypatch.setattr(background_service.background_manager, "stop_all_services", _noop)
-
-    app.dependency_overrides[verify_token] = lambda: True
-
-    with TestClient(app) as client:
-        yield client
-
-    app.dependency_overrides.pop(verify_token, None)
 
 
 @pytest.fixture
 def clean_state(monkeypatch):
-    original_runners = dict(runners)
-    original_tasks = dict(tasks)
-    original_is_production = state_module.IS_PRODUCTION
-
     monkeypatch.setattr(state_module, "IS_PRODUCTION", False)
-    runners.clear()
-    tasks.clear()
+    with isolated_mapping(runners), isolated_mapping(tasks):
+        yield
 
-    yield
 
-    monkeypatch.setattr(state_module, "IS_PRODUCTION", original_is_production)
-    runners.clear()
-    runners.update(original_runners)
-    tasks.clear()
-    tasks.update(original_tasks)
+_NOW = datetime.now()
+_NOW_ISO = _NOW.isoformat()
 
 
 def _make_runner(runner_id: str, *, last_heartbeat: datetime) -> Runner:
@@ -65,7 +38,7 @@ def _make_runner(runner_id: str, *, last_heartbeat: datetime) -> Runner:
 
 
 def _make_task(task_id: str, runner_id: str, *, status: str) -> Task:
-    now = datetime.now().isoformat()
+    # Timestamps are fixed to _NOW_ISO; none of these tests depend on them.
     return Task(
         task_id=task_id,
         runner_id=runner_id,
@@ -79,13 +52,31 @@ def _make_task(task_id: str, runner_id: str, *, status: str) -> Task:
         parameters={},
         notify_url="https://example.com/notify",
         completion_callback=None,
-        created_at=now,
-        updated_at=now,
+        created_at=_NOW_ISO,
+        updated_at=_NOW_ISO,
         error=None,
         script_output=None,
     )
 
 
+@pytest.fixture(scope="session")
+def task_factory():
+    """Hand out one shared Task per (task_id, runner_id, status) for the whole session.
+
+    The API tests only read tasks back through GET routes, and clean_state clears the
+    store rather than the instances, so reusing them across tests is safe.
+    """
+    cache: dict[tuple[str, str, str], Task] = {}
+
+    def make(task_id: str, runner_id: str, status: str) -> Task:
+        key = (task_id, runner_id, status)
+        if key not in cache:
+            cache[key] = _make_task(task_id, runner_id, status=status)
+        return cache[key]
+
+    return make
+
+
 def test_api_version(api_client):
     """Validate Api version."""
     resp = api_client.get("/api/version")
@@ -100,11 +91,11 @@ def test_api_version(api_client):
     }
 
 
-def test_api_tasks_returns_task_status(api_client, clean_state):
+def test_api_tasks_returns_task_status(api_client, clean_state, task_factory):
     """Validate Api tasks returns task status."""
-    runners["r1"] = _make_runner("r1", last_heartbeat=datetime.now())
-    tasks["t1"] = _make_task("t1", "r1", status="running")
-    tasks["t2"] = _make_task("t2", "r1", status="completed")
+    runners["r1"] = _make_runner("r1", last_heartbeat=_NOW)
+    tasks["t1"] = task_factory("t1", "r1", "running")
+    tasks["t2"] = task_factory("t2", "r1", "completed")
 
     resp = api_client.get("/api/tasks")
     assert resp.status_code == 200
@@ -119,6 +110,7 @@ def test_api_tasks_returns_task_status(api_client, clean_state):
 
 def test_api_runners_includes_online_and_offline(api_client, clean_state):
     """Validate Api runners includes online and offline."""
+    # Online/offline is judged against the live clock, so this one cannot use _NOW.
     now = datetime.now()
     runners["online"] = _make_runner("online", last_heartbeat=now - timedelta(seconds=5))
     runners["offline"] = _make_runner("offline", last_heartbeat=now - timedelta(seconds=120))
@@ -3,6 +3,7 @@
 """Validates token verification, OpenAPI cookie handling, and admin authorization logic."""
 
 import base64
+import functools
 import hashlib
 import hmac
 import json
@@ -25,6 +26,43 @@ from app.core.auth import (
 )
 from app.core.config import config
 
+_AUTH_CONFIG_KEYS = (
+    "ADMIN_USERS",
+    "API_DOCS_VISIBILITY",
+    "AUTHORIZED_TOKENS",
+    "OPENAPI_ALLOW_QUERY_TOKEN",
+    "OPENAPI_COOKIE_MAX_AGE_SECONDS",
+    "OPENAPI_COOKIE_SECRET",
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _bearer(token: str) -> HTTPAuthorizationCredentials:
+    """Return a shared Bearer credentials object; the tests never mutate them."""
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+@pytest.fixture
+def auth_cfg():
+    """Override auth-related config attributes, restoring all of them in one shot."""
+    saved = {key: getattr(config, key) for key in _AUTH_CONFIG_KEYS}
+
+    def _set(**overrides):
+        unknown = overrides.keys() - saved.keys()
+        assert not unknown, f"auth_cfg cannot restore {sorted(unknown)}"
+        vars(config).update(overrides)
+
+    yield _set
+
+    vars(config).update(saved)
+
+
+@pytest.fixture
+def client(_app_client):
+    """Shared session client with real token checks (no dependency overrides)."""
+    _app_client.cookies.clear()
+    return _app_client
+
 
 def test_root_endpoint_is_public(client):
     """Root endpoint is public and returns basic metadata."""
@@ -76,55 +114,64 @@ def test_invalid_tokens_are_rejected(client, headers):
 
 
 @pytest.mark.asyncio
-async def test_verify_openapi_token_public_allows_without_token(monkeypatch):
-    """Validate Verify openapi token public allows without token."""
-    monkeypatch.setattr(config, "API_DOCS_VISIBILITY", "public")
-    assert await verify_openapi_token(token_query=None, api_token=None, credentials=None) is None
-
-
-@pytest.mark.asyncio
-async def test_verify_openapi_token_private_missing_token_raises(monkeypatch):
-    """Validate Verify openapi token private missing token raises."""
-    monkeypatch.setattr(config, "API_DOCS_VISIBILITY", "private")
-    monkeypatch.setattr(config, "AUTHORIZED_TOKENS", {"t": "tok"})
-
-    with pytest.raises(HTTPException) as exc:
-        await verify_openapi_token(token_query=None, api_token=None, credentials=None)
-    assert exc.value.status_code == 401
-
-
-@pytest.mark.asyncio
-async def test_verify_openapi_token_private_query_has_priority(monkeypatch):
-    """Validate Verify openapi token private query has priority."""
-    monkeypatch.setattr(config, "API_DOCS_VISIBILITY", "private")
-    monkeypatch.setattr(config, "AUTHORIZED_TOKENS", {"a": "tok-a", "b": "tok-b"})
-    monkeypatch.setattr(config, "OPENAPI_ALLOW_QUERY_TOKEN", True)
-
-    creds = HTTPAuthorizationCredentials(scheme="Bearer", credentials="tok-a")
-    out = await verify_openapi_token(token_query="tok-b", api_token="tok-a", credentials=creds)
-    # Query token is optional and lower priority than headers.
-    assert out == "tok-a"
-
-
-@pytest.mark.asyncio
-async def test_verify_openapi_token_private_query_works_when_enabled(monkeypatch):
-    """Validate Verify openapi token private query works when enabled."""
-    monkeypatch.setattr(config, "API_DOCS_VISIBILITY", "private")
-    monkeypatch.setattr(config, "AUTHORIZED_TOKENS", {"b": "tok-b"})
-    monkeypatch.setattr(config, "OPENAPI_ALLOW_QUERY_TOKEN", True)
+@pytest.mark.parametrize(
+    "visibility,tokens,allow_query,token_query,api_token,bearer,expected",
+    [
+        # Public docs need no token at all.
+        ("public", {"t": "tok"}, False, None, None, None, None),
+        ("private", {"t": "tok"}, False, None, None, None, HTTPException),
+        # Query token is optional and lower priority than headers.
+        ("private", {"a": "tok-a", "b": "tok-b"}, True, "tok-b", "tok-a", "tok-a", "tok-a"),
+        ("private", {"b": "tok-b"}, True, "tok-b", None, None, "tok-b"),
+        ("private", {"a": "tok-a"}, False, None, "tok-a", None, "tok-a"),
+        ("private", {"a": "tok-a"}, False, None, None, "tok-a", "tok-a"),
+        # Header token path hits the "invalid token" branch, not the "missing token" one.
+        ("private", {"a": "tok-a"}, False, None, "bad", None, HTTPException),
+    ],
+    ids=[
+        "public-none",
+        "private-missing-raises",
+        "private-query-priority",
+        "private-query-enabled",
+        "private-header",
+        "private-bearer",
+        "private-invalid-raises",
+    ],
+)
+async def test_verify_openapi_token(
+    auth_cfg, visibility, tokens, allow_query, token_query, api_token, bearer, expected
+):
+    """Validate verify_openapi_token visibility, token sources and priorities."""
+    auth_cfg(
+        API_DOCS_VISIBILITY=visibility,
+        AUTHORIZED_TOKENS=tokens,
+        OPENAPI_ALLOW_QUERY_TOKEN=allow_query,
+    )
+    creds = _bearer(bearer) if bearer else None
 
-    out = await verify_openapi_token(token_query="tok-b", api_token=None, credentials=None)
-    assert out == "tok-b"
+    if expected is HTTPException:
+        with pytest.raises(HTTPException) as exc:
+            await verify_openapi_token(
+                token_query=token_query, api_token=api_token, credentials=creds
+            )
+        assert exc.value.status_code == 401
+    else:
+        out = await verify_openapi_token(
+            token_query=token_query, api_token=api_token, credentials=creds
+        )
+        assert out == expected
 
 
 @pytest.mark.asyncio
-async def test_verify_openapi_token_private_cookie_works(monkeypatch):
+async def test_verify_openapi_token_private_cookie_works(auth_cfg):
     """Validate Verify openapi token private cookie works."""
-    monkeypatch.setattr(config, "API_DOCS_VISIBILITY", "private")
-    monkeypatch.setattr(config, "AUTHORIZED_TOKENS", {"b": "tok-b"})
-    monkeypatch.setattr(config, "OPENAPI_ALLOW_QUERY_TOKEN", False)
-    monkeypatch.setattr(config, "OPENAPI_COOKIE_MAX_AGE_SECONDS", 900)
-    monkeypatch.setattr(config, "OPENAPI_COOKIE_SECRET", "unit-test-secret")
+    auth_cfg(
+        API_DOCS_VISIBILITY="private",
+        AUTHORIZED_TOKENS={"b": "tok-b"},
+        OPENAPI_ALLOW_QUERY_TOKEN=False,
+        OPENAPI_COOKIE_MAX_AGE_SECONDS=900,
+        OPENAPI_COOKIE_SECRET="unit-test-secret",
+    )
 
     cookie_value = build_openapi_cookie_value("tok-b")
     assert cookie_value is not None
@@ -138,11 +185,13 @@ async def test_verify_openapi_token_private_cookie_works(monkeypatch):
     assert out == "tok-b"
 
 
-def test_openapi_cookie_helpers_detect_tamper_and_expiry(monkeypatch):
+def test_openapi_cookie_helpers_detect_tamper_and_expiry(auth_cfg):
     """Validate Openapi cookie helpers detect tamper and expiry."""
-    monkeypatch.setattr(config, "AUTHORIZED_TOKENS", {"a": "tok-a"})
-    monkeypatch.setattr(config, "OPENAPI_COOKIE_MAX_AGE_SECONDS", 1)
-    monkeypatch.setattr(config, "OPENAPI_COOKIE_SECRET", "unit-test-secret")
+    auth_cfg(
+        AUTHORIZED_TOKENS={"a": "tok-a"},
+        OPENAPI_COOKIE_MAX_AGE_SECONDS=1,
+        OPENAPI_COOKIE_SECRET="unit-test-secret",
+    )
 
     cookie_value = build_openapi_cookie_value("tok-a")
     assert cookie_value is not None
@@ -161,11 +210,13 @@ def test_openapi_cookie_helpers_detect_tamper_and_expiry(monkeypatch):
     assert resolve_openapi_cookie_token(f"{expired_payload_b64}.{expired_sig_b64}") is None
 
 
-def test_openapi_cookie_helper_internal_branches(monkeypatch):
+def test_openapi_cookie_helper_internal_branches(auth_cfg):
     """Validate Openapi cookie helper internal branches."""
-    monkeypatch.setattr(config, "OPENAPI_COOKIE_SECRET", "")
-    monkeypatch.setattr(config, "AUTHORIZED_TOKENS", {"b": "tok-b", "a": "tok-a"})
-    monkeypatch.setattr(config, "ADMIN_USERS", {"z": "hash-z", "m": "hash-m"})
+    auth_cfg(
+        OPENAPI_COOKIE_SECRET="",
+        AUTHORIZED_TOKENS={"b": "tok-b", "a": "tok-a"},
+        ADMIN_USERS={"z": "hash-z", "m": "hash-m"},
+    )
 
     # Covers derived-secret fallback path and deterministic output.
     secret = auth_module._openapi_cookie_secret()
@@ -191,7 +242,7 @@ def test_openapi_cookie_helper_internal_branches(monkeypatch):
     assert auth_module._extract_openapi_token_name({"v": 1, "t": "a", "exp": "nope"}) is None
 
     # Resolve branches: empty cookie, malformed parts, payload parse failure after valid signature.
-    monkeypatch.setattr(config, "OPENAPI_COOKIE_SECRET", "unit-test-secret")
+    auth_cfg(OPENAPI_COOKIE_SECRET="unit-test-secret")
     assert resolve_openapi_cookie_token("") is None
     assert resolve_openapi_cookie_token("still-malformed") is None
 
@@ -203,72 +254,93 @@ def test_openapi_cookie_helper_internal_branches(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_verify_openapi_token_private_header_then_bearer(monkeypatch):
-    """Validate Verify openapi token private header then bearer."""
-    monkeypatch.setattr(config, "API_DOCS_VISIBILITY", "private")
-    monkeypatch.setattr(config, "AUTHORIZED_TOKENS", {"a": "tok-a"})
-
-    # Header path
-    out = await verify_openapi_token(token_query=None, api_token="tok-a", credentials=None)
-    assert out == "tok-a"
-
-    # Bearer path
-    creds = HTTPAuthorizationCredentials(scheme="Bearer", credentials="tok-a")
-    out2 = await verify_openapi_token(token_query=None, api_token=None, credentials=creds)
-    assert out2 == "tok-a"
-
-
-@pytest.mark.asyncio
-async def test_verify_openapi_token_private_invalid_token_raises(monkeypatch):
-    """Validate Verify openapi token private invalid token raises."""
-    monkeypatch.setattr(config, "API_DOCS_VISIBILITY", "private")
-    monkeypatch.setattr(config, "AUTHORIZED_TOKENS", {"a": "tok-a"})
-
-    with pytest.raises(HTTPException) as exc:
-        # Use header token path so we hit the "invalid token" branch (not the
-        # "missing token" one).
-        await verify_openapi_token(token_query=None, api_token="bad", credentials=None)
-    assert exc.value.status_code == 401
-
-
-@pytest.mark.asyncio
-async def test_verify_token_missing_raises(monkeypatch):
+async def test_verify_token_missing_raises(auth_cfg):
     """Validate Verify token missing raises."""
-    monkeypatch.setattr(config, "AUTHORIZED_TOKENS", {"a": "tok-a"})
+    auth_cfg(AUTHORIZED_TOKENS={"a": "tok-a"})
     with pytest.raises(HTTPException) as exc:
         await verify_token(api_token=None, credentials=None)
     assert exc.value.status_code == 401
 
 
 @pytest.mark.asyncio
-async def test_verify_token_api_key_header_has_priority(monkeypatch):
+async def test_verify_token_api_key_header_has_priority(auth_cfg):
     """Validate Verify token api key header has priority."""
-    monkeypatch.setattr(config, "AUTHORIZED_TOKENS", {"a": "tok-a", "b": "tok-b"})
-    creds = HTTPAuthorizationCredentials(scheme="Bearer", credentials="tok-b")
+    auth_cfg(AUTHORIZED_TOKENS={"a": "tok-a", "b": "tok-b"})
+    creds = _bearer("tok-b")
     out = await verify_token(api_token="tok-a", credentials=creds)
     assert out == "tok-a"
 
 
 @pytest.mark.asyncio
-async def test_verify_token_bearer_works(monkeypatch):
+async def test_verify_token_bearer_works(auth_cfg):
     """Validate Verify token bearer works."""
-    monkeypatch.setattr(config, "AUTHORIZED_TOKENS", {"a": "tok-a"})
-    creds = HTTPAuthorizationCredentials(scheme="Bearer", credentials="tok-a")
+    auth_cfg(AUTHORIZED_TOKENS={"a": "tok-a"})
+    creds = _bearer("tok-a")
     out = await verify_token(api_token=None, credentials=creds)
     assert out == "tok-a"
 
 
 @pytest.mark.asyncio
-async def test_verify_token_invalid_raises(monkeypatch):
+async def test_verify_token_invalid_raises(auth_cfg):
     """Validate Verify token invalid raises."""
-    monkeypatch.setattr(config, "AUTHORIZED_TOKENS", {"a": "tok-a"})
+    auth_cfg(AUTHORIZED_TOKENS={"a": "tok-a"})
     with pytest.raises(HTTPException) as exc:
         await verify_token(api_token="bad", credentials=None)
     assert exc.value.status_code == 401
 
 
 @pytest.mark.asyncio
-async def test_verify_token_triggers_config_refresh(monkeypatch):
+async def test_verify_token_uses_constant_time_compare(monkeypatch, auth_cfg):
+    """Validate known and unknown tokens are both checked with hmac.compare_digest."""
+    compared = []
+    real_compare_digest = auth_module.hmac.compare_digest
+
+    def _spy(a, b):
+        compared.append((a, b))
+        return real_compare_digest(a, b)
+
+    monkeypatch.setattr(auth_module.hmac, "compare_digest", _spy)
+    auth_cfg(AUTHORIZED_TOKENS={"a": "tok-a"})
+
+    assert await verify_token(api_token="tok-a", credentials=None) == "tok-a"
+    assert compared == [("tok-a", "tok-a")]
+
+    compared.clear()
+    with pytest.raises(HTTPException):
+        await verify_token(api_token="tok-b", credentials=None)
+    assert compared == [("tok-b", "tok-a")]
+
+
+@pytest.mark.asyncio
+async def test_verify_token_rejects_token_removed_in_place(auth_cfg):
+    """Validate a token popped from AUTHORIZED_TOKENS stops authorizing immediately."""
+    tokens = {"a": "tok-a", "b": "tok-b"}
+    auth_cfg(AUTHORIZED_TOKENS=tokens)
+    assert await verify_token(api_token="tok-b", credentials=None) == "tok-b"
+
+    tokens.pop("b")
+    with pytest.raises(HTTPException):
+        await verify_token(api_token="tok-b", credentials=None)
+
+
+def test_build_openapi_cookie_value_uses_constant_time_compare(monkeypatch, auth_cfg):
+    """Validate unknown tokens given to the OpenAPI cookie login go through hmac.compare_digest."""
+    compared = []
+    real_compare_digest = auth_module.hmac.compare_digest
+
+    def _spy(a, b):
+        compared.append((a, b))
+        return real_compare_digest(a, b)
+
+    monkeypatch.setattr(auth_module.hmac, "compare_digest", _spy)
+    auth_cfg(AUTHORIZED_TOKENS={"a": "tok-a"})
+
+    assert build_openapi_cookie_value("tok-b") is None
+    assert compared == [("tok-b", "tok-a")]
+
+
+@pytest.mark.asyncio
+async def test_verify_token_triggers_config_refresh(monkeypatch, auth_cfg):
     """Validate Verify token triggers config refresh."""
     calls = {"count": 0}
 
@@ -277,7 +349,7 @@ async def test_verify_token_triggers_config_refresh(monkeypatch):
         return False
 
     monkeypatch.setattr(auth_module.config_module, "reload_config_if_signaled", _refresh)
-    monkeypatch.setattr(config, "AUTHORIZED_TOKENS", {"a": "tok-a"})
+    auth_cfg(AUTHORIZED_TOKENS={"a": "tok-a"})
 
     out = await verify_token(api_token="tok-a", credentials=None)
     assert out == "tok-a"
@@ -285,16 +357,16 @@ async def test_verify_token_triggers_config_refresh(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_verify_admin_username_missing_raises(monkeypatch):
+async def test_verify_admin_username_missing_raises(auth_cfg):
     """Validate Verify admin username missing raises."""
-    monkeypatch.setattr(config, "ADMIN_USERS", {"admin": "hash"})
+    auth_cfg(ADMIN_USERS={"admin": "hash"})
     with pytest.raises(HTTPException) as exc:
         await verify_admin(HTTPBasicCredentials(username="nope", password="x"))
     assert exc.value.status_code == 401
 
 
 @pytest.mark.asyncio
-async def test_verify_admin_triggers_config_refresh(monkeypatch):
+async def test_verify_admin_triggers_config_refresh(monkeypatch, auth_cfg):
     """Validate Verify admin triggers config refresh."""
     calls = {"count": 0}
 
@@ -303,7 +375,7 @@ async def test_verify_admin_triggers_config_refresh(monkeypatch):
         return False
 
     monkeypatch.setattr(auth_module.config_module, "reload_config_if_signaled", _refresh)
-    monkeypatch.setattr(config, "ADMIN_USERS", {"admin": "hash"})
+    auth_cfg(ADMIN_USERS={"admin": "hash"})
     monkeypatch.setattr(config.pwd_context, "verify", lambda *_a, **_k: True)
 
     assert await verify_admin(HTTPBasicCredentials(username="admin", password="ok")) is True
@@ -311,9 +383,9 @@ async def test_verify_admin_triggers_config_refresh(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_verify_admin_incorrect_password_raises(monkeypatch):
+async def test_verify_admin_incorrect_password_raises(monkeypatch, auth_cfg):
     """Validate Verify admin incorrect password raises."""
-    monkeypatch.setattr(config, "ADMIN_USERS", {"admin": "hash"})
+    auth_cfg(ADMIN_USERS={"admin": "hash"})
     monkeypatch.setattr(config.pwd_context, "verify", lambda *_a, **_k: False)
     with pytest.raises(HTTPException) as exc:
         await verify_admin(HTTPBasicCredentials(username="admin", password="bad"))
@@ -321,60 +393,46 @@ async def test_verify_admin_incorrect_password_raises(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_verify_admin_ok(monkeypatch):
+async def test_verify_admin_ok(monkeypatch, auth_cfg):
     """Validate Verify admin ok."""
-    monkeypatch.setattr(config, "ADMIN_USERS", {"admin": "hash"})
+    auth_cfg(ADMIN_USERS={"admin": "hash"})
     monkeypatch.setattr(config.pwd_context, "verify", lambda *_a, **_k: True)
     assert await verify_admin(HTTPBasicCredentials(username="admin", password="ok")) is True
 
 
-@pytest.mark.asyncio
-async def test_verify_runner_version_missing_header_raises():
-    """Validate Verify runner version missing header raises."""
-    with pytest.raises(HTTPException) as exc:
-        await verify_runner_version(runner_version=None)
-    assert exc.value.status_code == 400
-
-
-@pytest.mark.asyncio
-async def test_verify_runner_version_major_mismatch_raises(monkeypatch):
-    """Validate Verify runner version major mismatch raises."""
-    major = __version__.split(".")[0]
-    other_major = str((int(major) + 1) if major.isdigit() else 999)
-    with pytest.raises(HTTPException) as exc:
-        await verify_runner_version(runner_version=f"{other_major}.0.0")
-    assert exc.value.status_code == 409
+_VERSION_PARTS = __version__.split(".")
+_MAJOR = _VERSION_PARTS[0]
+_MINOR = _VERSION_PARTS[1] if len(_VERSION_PARTS) > 1 else "0"
 
 
-@pytest.mark.asyncio
-async def test_verify_runner_version_minor_mismatch_raises():
-    """Validate Verify runner version minor mismatch raises."""
-    parts = __version__.split(".")
-    major = parts[0]
-    minor = parts[1] if len(parts) > 1 else "0"
-    other_minor = str((int(minor) + 1) if minor.isdigit() else 999)
-
-    with pytest.raises(HTTPException) as exc:
-        await verify_runner_version(runner_version=f"{major}.{other_minor}.0")
-    assert exc.value.status_code == 409
+def _bump(part: str) -> str:
+    """Return a version component guaranteed to differ from part."""
+    return str(int(part) + 1) if part.isdigit() else "999"
 
 
 @pytest.mark.asyncio
-async def test_verify_runner_version_major_minor_match_ok():
-    """Validate Verify runner version major minor match ok."""
-    parts = __version__.split(".")
-    major = parts[0]
-    minor = parts[1] if len(parts) > 1 else "0"
-    out = await verify_runner_version(runner_version=f"{major}.{minor}.99")
-    assert out.startswith(f"{major}.{minor}.")
-
+@pytest.mark.parametrize(
+    "runner_version,expected_status",
+    [
+        (None, 400),
+        (f"{_bump(_MAJOR)}.0.0", 409),
+        (f"{_MAJOR}.{_bump(_MINOR)}.0", 409),
+        # Patch level is free to differ.
+        (f"{_MAJOR}.{_MINOR}.99", None),
+        ("not-a-version", 400),
+    ],
+    ids=["missing-header", "major-mismatch", "minor-mismatch", "patch-differs-ok", "invalid"],
+)
+async def test_verify_runner_version(runner_version, expected_status):
+    """Validate Verify runner version against the manager major.minor."""
+    if expected_status is None:
+        out = await verify_runner_version(runner_version=runner_version)
+        assert out.startswith(f"{_MAJOR}.{_MINOR}.")
+        return
 
-@pytest.mark.asyncio
-async def test_verify_runner_version_invalid_format_raises():
-    """Validate Verify runner version invalid format raises."""
     with pytest.raises(HTTPException) as exc:
-        await verify_runner_version(runner_version="not-a-version")
-    assert exc.value.status_code == 400
+        await verify_runner_version(runner_version=runner_version)
+    assert exc.value.status_code == expected_status
 
 
 @pytest.mark.asyncio
@@ -3,76 +3,65 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 
 import pytest
 
 from app.services import background_service
 
+_SERVICES = {
+    "check_runners_activity": "runners",
+    "cleanup_old_tasks": "cleanup",
+    "check_task_timeouts": "timeouts",
+    "reconcile_running_tasks_with_runners": "reconcile",
+}
 
-@pytest.mark.asyncio
-async def test_start_and_stop_all_services(monkeypatch):
-    """Validate Start and stop all services."""
-    started = []
-
-    async def fake_service(name: str):
-        started.append(name)
-        while True:
-            await asyncio.sleep(0.01)
-
-    monkeypatch.setattr(
-        background_service, "check_runners_activity", lambda: fake_service("runners")
-    )
-    monkeypatch.setattr(background_service, "cleanup_old_tasks", lambda: fake_service("cleanup"))
-    monkeypatch.setattr(background_service, "check_task_timeouts", lambda: fake_service("timeouts"))
-    monkeypatch.setattr(
-        background_service,
-        "reconcile_running_tasks_with_runners",
-        lambda: fake_service("reconcile"),
-    )
-
-    mgr = background_service.BackgroundServiceManager()
-    await mgr.start_all_services()
-    await asyncio.sleep(0.01)
-    assert mgr.is_running is True
-    assert len(mgr.tasks) == 4
-    assert set(started) == {"runners", "cleanup", "timeouts", "reconcile"}
-    assert {service["name"] for service in mgr.get_service_status()["services"]} == {
-        "check_runners_activity",
-        "cleanup_old_tasks",
-        "check_task_timeouts",
-        "reconcile_running_tasks_with_runners",
-    }
-
-    await mgr.stop_all_services()
-    assert mgr.is_running is False
-    assert mgr.tasks == []
 
+def _patch_services(monkeypatch, started: list[str]) -> list[asyncio.Event]:
+    """Replace background services with coroutines that signal an event once running."""
+    events = []
 
-@pytest.mark.asyncio
-async def test_start_when_already_running(monkeypatch):
-    """Validate Start when already running."""
+    async def fake_service(name: str, ev: asyncio.Event):
+        started.append(name)
+        ev.set()
+        await asyncio.Event().wait()
 
-    async def noop():
-        await asyncio.sleep(0)
+    for attr, name in _SERVICES.items():
+        ev = asyncio.Event()
+        events.append(ev)
+        monkeypatch.setattr(background_service, attr, functools.partial(fake_service, name, ev))
+    return events
 
-    monkeypatch.setattr(background_service, "check_runners_activity", lambda: noop())
-    monkeypatch.setattr(background_service, "cleanup_old_tasks", lambda: noop())
-    monkeypatch.setattr(background_service, "check_task_timeouts", lambda: noop())
-    monkeypatch.setattr(background_service, "reconcile_running_tasks_with_runners", lambda: noop())
 
-    mgr = background_service.BackgroundServiceManager()
-    await mgr.start_all_services()
-    await mgr.start_all_services()
-    assert mgr.is_running is True
-    await mgr.stop_all_services()
+async def _wait_all(events: list[asyncio.Event]) -> None:
+    await asyncio.wait_for(asyncio.gather(*(ev.wait() for ev in events)), timeout=1.0)
 
 
 @pytest.mark.asyncio
-async def test_stop_when_not_running():
-    """Validate Stop when not running."""
+@pytest.mark.parametrize(
+    "actions",
+    [["start", "stop"], ["start", "start", "stop"], ["stop"]],
+    ids=["start-stop", "start-twice", "stop-when-idle"],
+)
+async def test_start_stop_transitions(monkeypatch, actions):
+    """Validate manager state after each start/stop step; a second start is a no-op."""
+    started: list[str] = []
+    events = _patch_services(monkeypatch, started)
+
     mgr = background_service.BackgroundServiceManager()
-    await mgr.stop_all_services()
-    assert mgr.is_running is False
+    for action in actions:
+        if action == "start":
+            await mgr.start_all_services()
+            await _wait_all(events)
+            assert mgr.is_running is True
+            assert len(mgr.tasks) == 4
+            assert sorted(started) == sorted(_SERVICES.values())
+            names = {service["name"] for service in mgr.get_service_status()["services"]}
+            assert names == set(_SERVICES)
+        else:
+            await mgr.stop_all_services()
+            assert mgr.is_running is False
+            assert mgr.tasks == []
 
 
 @pytest.mark.asyncio
@@ -80,8 +69,9 @@ async def test_get_service_status_reports_tasks():
     """Validate Get service status reports tasks."""
     mgr = background_service.BackgroundServiceManager()
     task = asyncio.create_task(asyncio.sleep(0))
+    # Let the task finish up front: nothing is left to cancel or gather afterwards.
+    await task
     mgr.tasks.append(task)
     status = mgr.get_service_status()
     assert status["tasks"] == 1
-    task.cancel()
-    await asyncio.gather(task, return_exceptions=True)
+    assert status["services"][0]["done"] is True
@@ -1,7 +1,9 @@
 """Validates configuration parsing, environment loading, and dotenv file handling."""
 
 import builtins
+import functools
 import importlib.util
+import io
 import os
 import sys
 from types import ModuleType
@@ -22,6 +24,33 @@ def isolate_manager_config_environment(monkeypatch):
     monkeypatch.setenv("OPENAPI_COOKIE_SECRET", "unit-test-secret")
 
 
+@pytest.fixture
+def stdout_buf(monkeypatch):
+    """Send app.core.config print output to a plain buffer instead of capsys."""
+    from app.core import config as config_module
+
+    buf = io.StringIO()
+    # pytest re-installs its own sys.stdout between phases, so shadow print in the module.
+    monkeypatch.setattr(config_module, "print", functools.partial(print, file=buf), raising=False)
+    return buf
+
+
+@pytest.fixture(scope="session")
+def fake_dotenv_module():
+    """One stand-in ``dotenv`` module; tests patch ``load_dotenv`` on it as needed."""
+    module = ModuleType("dotenv")
+    module.load_dotenv = lambda *_args, **_kwargs: None
+    return module
+
+
+def _drain(buf: io.StringIO) -> str:
+    """Return everything written to buf so far and reset it."""
+    out = buf.getvalue()
+    buf.seek(0)
+    buf.truncate()
+    return out
+
+
 def test_parse_helpers_cover_edge_cases():
     """Validate Parse helpers cover edge cases."""
     from app.core import config as cfg
@@ -60,69 +89,66 @@ def test_clear_config_env_vars_removes_only_managed(monkeypatch):
     """Validate Clear config env vars removes only managed."""
     from app.core import config as cfg
 
-    monkeypatch.setenv("MANAGER_HOST", "example")
-    monkeypatch.setenv("MANAGER_BIND_HOST", "127.0.0.1")
-    monkeypatch.setenv("LOG_DIR", "/tmp/logs")
-    monkeypatch.setenv("RUNNERS_STORAGE_DIR", "/tmp/storage")
-    monkeypatch.setenv("AUTHORIZED_TOKENS__A", "token-a")
-    monkeypatch.setenv("ADMIN_USERS__bob", "hash")
-    monkeypatch.setenv("SOME_OTHER", "keep")
+    # A small stand-in environ keeps the scan independent of the ambient environment.
+    small_env = {
+        "MANAGER_HOST": "example",
+        "MANAGER_BIND_HOST": "127.0.0.1",
+        "LOG_DIR": "/tmp/logs",
+        "RUNNERS_STORAGE_DIR": "/tmp/storage",
+        "AUTHORIZED_TOKENS__A": "token-a",
+        "ADMIN_USERS__bob": "hash",
+        "SOME_OTHER": "keep",
+    }
+    monkeypatch.setattr(cfg.os, "environ", small_env)
 
     cfg._clear_config_env_vars()
 
-    assert "SOME_OTHER" in cfg.os.environ
-    assert "MANAGER_HOST" not in cfg.os.environ
-    assert "MANAGER_BIND_HOST" not in cfg.os.environ
-    assert "LOG_DIR" not in cfg.os.environ
-    assert "RUNNERS_STORAGE_DIR" not in cfg.os.environ
-    assert "AUTHORIZED_TOKENS__A" not in cfg.os.environ
-    assert "ADMIN_USERS__bob" not in cfg.os.environ
+    assert small_env == {"SOME_OTHER": "keep"}
 
 
-def test_load_environment_variables_override_and_default_paths(monkeypatch, capsys):
+def test_load_environment_variables_override_and_default_paths(monkeypatch, stdout_buf):
     """Validate Load environment variables override and default paths."""
     from app.core import config as cfg
 
     monkeypatch.setenv("CONFIG_ENV_PATH", "/tmp/does-not-exist.env")
     monkeypatch.setattr(cfg.os.path, "exists", lambda _: False)
     cfg._load_environment_variables()
-    out = capsys.readouterr().out
+    out = _drain(stdout_buf)
     assert "override path" in out
     assert "no .env file found" in out
 
     monkeypatch.delenv("CONFIG_ENV_PATH", raising=False)
     monkeypatch.setattr(cfg.os.path, "exists", lambda _: False)
     cfg._load_environment_variables()
-    out = capsys.readouterr().out
+    out = _drain(stdout_buf)
     assert "default path" in out
     assert "no .env file found" in out
 
 
-def test_load_environment_variables_load_dotenv_success(monkeypatch, capsys):
+def test_load_environment_variables_load_dotenv_success(
+    monkeypatch, stdout_buf, fake_dotenv_module
+):
     """Validate Load environment variables load dotenv success."""
     from app.core import config as cfg
 
     calls = []
 
-    fake_dotenv = ModuleType("dotenv")
-
     def fake_load_dotenv(path, *, override=False):
         calls.append((path, override))
 
-    fake_dotenv.load_dotenv = fake_load_dotenv
-
+    monkeypatch.setattr(fake_dotenv_module, "load_dotenv", fake_load_dotenv)
     monkeypatch.setenv("CONFIG_ENV_PATH", "/tmp/fake.env")
     monkeypatch.setattr(cfg.os.path, "exists", lambda _: True)
-    monkeypatch.setitem(sys.modules, "dotenv", fake_dotenv)
+    monkeypatch.setitem(sys.modules, "dotenv", fake_dotenv_module)
 
     cfg._load_environment_variables()
 
     assert calls == [("/tmp/fake.env", True)]
-    out = capsys.readouterr().out
+    out = _drain(stdout_buf)
     assert "Loaded environment variables from" in out
 
 
-def test_load_environment_variables_importerror_branch(monkeypatch, capsys):
+def test_load_environment_variables_importerror_branch(monkeypatch, stdout_buf):
     """Validate Load environment variables importerror branch."""
     from app.core import config as cfg
 
@@ -140,7 +166,7 @@ def test_load_environment_variables_importerror_branch(monkeypatch, capsys):
 
     cfg._load_environment_variables()
 
-    out = capsys.readouterr().out
+    out = _drain(stdout_buf)
     assert "python-dotenv not installed" in out
 
 
@@ -308,11 +334,9 @@ def test_publish_config_reload_event_handles_oserror(monkeypatch, capsys):
     assert "mkdir-failed" in out
 
 
-def test_validate_configuration_warns_when_missing_tokens_and_admin(capsys):
+def test_validate_configuration_warns_when_missing_tokens_and_admin(config_copy, capsys):
     """Validate Validate configuration warns when missing tokens and admin."""
-    from app.core.config import Config
-
-    cfg = Config()
+    cfg = config_copy
     cfg.AUTHORIZED_TOKENS = {}
     cfg.ADMIN_USERS = {}
 
@@ -364,6 +388,7 @@ def test_config_initialization_and_validation_branches(monkeypatch):
     monkeypatch.setenv("OPENAPI_COOKIE_MAX_AGE_SECONDS", "1200")
     monkeypatch.setenv("OPENAPI_COOKIE_ROTATE_EACH_REQUEST", "false")
     monkeypatch.setenv("OPENAPI_COOKIE_SECRET", "cookie-secret")
+    monkeypatch.setenv("BCRYPT_ROUNDS", "10")
 
     # Token/admin discovery via prefixes
     monkeypatch.setenv("AUTHORIZED_TOKENS__client", "tok")
@@ -382,6 +407,8 @@ def test_config_initialization_and_validation_branches(monkeypatch):
     assert cfg.OPENAPI_COOKIE_MAX_AGE_SECONDS == 1200
     assert cfg.OPENAPI_COOKIE_ROTATE_EACH_REQUEST is False
     assert cfg.OPENAPI_COOKIE_SECRET == "cookie-secret"
+    assert cfg.BCRYPT_ROUNDS == 10
+    assert cfg.pwd_context._rounds == 10
 
     # RUNNERS_STORAGE_ENABLED with missing path should raise
     monkeypatch.setenv("RUNNERS_STORAGE_ENABLED", "true")
@@ -427,14 +454,12 @@ def test_config_initialization_and_validation_branches(monkeypatch):
     assert cfg7.MANAGER_BIND_HOST == "0.0.0.0"
 
 
-def test_validate_configuration_rejects_wildcard_origins_with_credentials(monkeypatch):
+def test_validate_configuration_rejects_wildcard_origins_with_credentials(config_copy):
     """Validate Validate configuration rejects wildcard origins with credentials."""
-    from app.core.config import Config
-
-    monkeypatch.setenv("CORS_ALLOW_ORIGINS", "*")
-    monkeypatch.setenv("CORS_ALLOW_CREDENTIALS", "true")
+    cfg = config_copy
+    cfg.CORS_ALLOW_ORIGINS = ["*"]
+    cfg.CORS_ALLOW_CREDENTIALS = True
 
-    cfg = Config()
     with pytest.raises(ValueError, match="Invalid CORS configuration"):
         cfg.validate_configuration()
 
@@ -567,16 +592,14 @@ def test_config_validation_rejects_placeholders_empty_credentials_and_paths(monk
     assert "OPENAPI_COOKIE_SECRET uses a documented placeholder" in capsys.readouterr().out
 
 
-def test_openapi_cookie_secret_placeholder_is_warning_only(monkeypatch, capsys):
+def test_openapi_cookie_secret_placeholder_is_warning_only(monkeypatch, capsys, config_copy):
     """Validate the optional example cookie secret does not block startup."""
     from app.core import _check_output
-    from app.core.config import Config
 
     monkeypatch.delenv("NO_COLOR", raising=False)
-    monkeypatch.setenv("OPENAPI_COOKIE_SECRET", "change-me-with-a-long-random-secret")
+    config_copy.OPENAPI_COOKIE_SECRET = "change-me-with-a-long-random-secret"
 
-    config = Config()
-    config.validate_configuration()
+    config_copy.validate_configuration()
 
     output = capsys.readouterr().out
     assert f"{_check_output._COLORS['warning']}⚠ WARNING: OPENAPI_COOKIE_SECRET" in output
@@ -602,6 +625,7 @@ def test_semantic_validators_cover_mutated_numeric_paths_and_ipv6(monkeypatch):
     config.CLEANUP_TASK_FILES_DAYS = -1
     config.SMTP_PORT = 0
     config.OPENAPI_COOKIE_MAX_AGE_SECONDS = 59
+    config.BCRYPT_ROUNDS = 16
     with pytest.raises(ConfigValidationError) as numeric_error:
         config._validate_numeric_limits()
     assert "MANAGER_PORT must be at most 65535" in str(numeric_error.value)
@@ -609,6 +633,7 @@ def test_semantic_validators_cover_mutated_numeric_paths_and_ipv6(monkeypatch):
     assert "CLEANUP_TASK_FILES_DAYS must be at least 0" in str(numeric_error.value)
     assert "SMTP_PORT must be at least 1" in str(numeric_error.value)
     assert "OPENAPI_COOKIE_MAX_AGE_SECONDS must be at least 60" in str(numeric_error.value)
+    assert "BCRYPT_ROUNDS must be at most 15" in str(numeric_error.value)
 
     config.LOG_DIR = ""
     config.RUNNERS_STORAGE_ENABLED = True
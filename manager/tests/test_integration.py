@@ -7,11 +7,25 @@ All comments are in English for clarity.
 
 from datetime import datetime
 
+import pytest
+from state_helpers import isolated_mapping
+
 from app.__version__ import __version__
 from app.core.config import config
 from app.core.state import runners, tasks
 from app.models.models import Runner
 
+# Fixed timestamps: these tests only need a valid value, never the current time.
+_FIXED_TS = datetime(2024, 1, 1, 12, 0, 0)
+_FIXED_TS_ISO = _FIXED_TS.isoformat()
+
+
+@pytest.fixture
+def clean_state():
+    """Empty runners/tasks for the test, then restore the original contents."""
+    with isolated_mapping(runners), isolated_mapping(tasks):
+        yield
+
 
 def test_root_endpoint(client):
     """
@@ -34,74 +48,56 @@ def test_manager_configuration():
     assert len(config.AUTHORIZED_TOKENS) > 0, "Manager should have at least one authorized token."
 
 
-def test_runner_state_management():
+def test_runner_state_management(clean_state):
     """
     Test runner state dictionary operations.
     """
-    original_runners = dict(runners)
-
-    try:
-        runners.clear()
-
-        # Add a test runner
-        test_runner = Runner(
-            id="test_runner_state",
-            url="http://localhost:9000",
-            task_types=["test"],
-            last_heartbeat=datetime.now(),
-            token="test_token",
-            version="1.0.0",
-        )
-        runners["test_runner_state"] = test_runner
+    # Add a test runner
+    test_runner = Runner(
+        id="test_runner_state",
+        url="http://localhost:9000",
+        task_types=["test"],
+        last_heartbeat=_FIXED_TS,
+        token="test_token",
+        version="1.0.0",
+    )
+    runners["test_runner_state"] = test_runner
 
-        # Verify runner is in state
-        assert "test_runner_state" in runners, "Runner should be in state."
-        assert runners["test_runner_state"].id == "test_runner_state", "Runner ID should match."
-        assert (
-            runners["test_runner_state"].url == "http://localhost:9000"
-        ), "Runner URL should match."
-    finally:
-        runners.clear()
-        runners.update(original_runners)
+    # Verify runner is in state
+    assert "test_runner_state" in runners, "Runner should be in state."
+    assert runners["test_runner_state"].id == "test_runner_state", "Runner ID should match."
+    assert runners["test_runner_state"].url == "http://localhost:9000", "Runner URL should match."
 
 
-def test_task_state_management():
+def test_task_state_management(clean_state):
     """
     Test task state dictionary operations.
     """
-    original_tasks = dict(tasks)
-
-    try:
-        tasks.clear()
-
-        # Import Task model
-        from app.models.models import Task
-
-        # Add a test task
-        test_task = Task(
-            task_id="test_task_state",
-            etab_name="test_etab",
-            app_name="test_app",
-            app_version="1.0.0",
-            task_type="test",
-            source_url="http://example.com",
-            affiliation="test",
-            parameters={},
-            status="pending",
-            runner_id="test_runner",
-            notify_url="http://example.com/notify",
-            created_at=datetime.now().isoformat(),
-            updated_at=datetime.now().isoformat(),
-        )
-        tasks["test_task_state"] = test_task
-
-        # Verify task is in state
-        assert "test_task_state" in tasks, "Task should be in state."
-        assert tasks["test_task_state"].task_id == "test_task_state", "Task ID should match."
-        assert tasks["test_task_state"].status == "pending", "Task status should match."
-    finally:
-        tasks.clear()
-        tasks.update(original_tasks)
+    # Import Task model
+    from app.models.models import Task
+
+    # Add a test task
+    test_task = Task(
+        task_id="test_task_state",
+        etab_name="test_etab",
+        app_name="test_app",
+        app_version="1.0.0",
+        task_type="test",
+        source_url="http://example.com",
+        affiliation="test",
+        parameters={},
+        status="pending",
+        runner_id="test_runner",
+        notify_url="http://example.com/notify",
+        created_at=_FIXED_TS_ISO,
+        updated_at=_FIXED_TS_ISO,
+    )
+    tasks["test_task_state"] = test_task
+
+    # Verify task is in state
+    assert "test_task_state" in tasks, "Task should be in state."
+    assert tasks["test_task_state"].task_id == "test_task_state", "Task ID should match."
+    assert tasks["test_task_state"].status == "pending", "Task status should match."
 
 
 def test_runner_model_validation():
@@ -113,7 +109,7 @@ def test_runner_model_validation():
         id="valid_runner",
         url="http://localhost:8081",
         task_types=["test", "video"],
-        last_heartbeat=datetime.now(),
+        last_heartbeat=_FIXED_TS,
         token="valid_token",
         version="1.0.0",
     )
@@ -142,8 +138,8 @@ def test_task_model_validation():
         status="pending",
         runner_id="test_runner",
         notify_url="http://example.com/notify",
-        created_at=datetime.now().isoformat(),
-        updated_at=datetime.now().isoformat(),
+        created_at=_FIXED_TS_ISO,
+        updated_at=_FIXED_TS_ISO,
     )
 
     assert valid_task.task_id == "valid_task", "Task ID should be set."
@@ -191,15 +187,14 @@ def test_manager_url_configuration():
     assert config.MANAGER_URL.startswith("http"), "Manager URL should start with http/https."
 
 
-def test_password_context_configuration():
+def test_password_context_configuration(hashed_password):
     """
     Test password hashing context configuration.
     """
     assert config.pwd_context is not None, "Password context should be configured."
 
-    # Test password hashing
-    test_password = "test_password_123"
-    hashed = config.pwd_context.hash(test_password)
+    # The hash itself is computed once per session by the hashed_password fixture
+    test_password, hashed = hashed_password
 
     assert len(hashed) > 0, "Hashed password should not be empty."
     assert config.pwd_context.verify(test_password, hashed), "Password verification should succeed."
@@ -0,0 +1,57 @@
+"""Unit coverage for the shared JSON codec, with and without orjson."""
+
+import json
+
+import pytest
+
+from app.core import json_codec
+
+
+@pytest.fixture(params=["orjson", "json"])
+def encoder(request, monkeypatch):
+    """Run a test once with orjson (when installed) and once on the json fallback."""
+    if request.param == "json":
+        monkeypatch.setattr(json_codec, "orjson", None)
+    elif json_codec.orjson is None:
+        pytest.skip("orjson is not installed")
+    return request.param
+
+
+def test_dumps_document_writes_indented_utf8(encoder):
+    """Validate dumps_document output is parseable, indented and keeps non-ASCII text."""
+    payload = json_codec.dumps_document({"name": "tâche", "n": 1, "big": 2**70})
+
+    assert json.loads(payload) == {"name": "tâche", "n": 1, "big": 2**70}
+    assert "tâche".encode("utf-8") in payload
+    assert payload.startswith(b'{\n  "name"')
+
+
+def test_dumps_line_writes_one_line_and_keeps_non_ascii(encoder):
+    """Validate dumps_line output is a single parseable line keeping non-ASCII text."""
+    line = json_codec.dumps_line({"message": "héllo\nworld", "big": 2**70})
+
+    assert "\n" not in line
+    assert "héllo" in line
+    assert json.loads(line) == {"message": "héllo\nworld", "big": 2**70}
+
+
+def test_dumps_line_is_identical_with_and_without_orjson(monkeypatch):
+    """Validate JSON log lines do not depend on whether orjson is installed."""
+    if json_codec.orjson is None:
+        pytest.skip("orjson is not installed")
+    value = {"level": "INFO", "message": 'héllo "quoted"', "line": 12, "extra": [1, None, True]}
+
+    with_orjson = json_codec.dumps_line(value)
+    monkeypatch.setattr(json_codec, "orjson", None)
+
+    assert json_codec.dumps_line(value).encode("utf-8") == with_orjson.encode("utf-8")
+    assert with_orjson.startswith('{"level":"INFO","message":')
+
+
+def test_loads_round_trips_and_raises_json_decode_error(encoder):
+    """Validate loads decodes bytes and str and raises json.JSONDecodeError on bad input."""
+    assert json_codec.loads(b'{"a": [1, "\xc3\xa9"]}') == {"a": [1, "é"]}
+    assert json_codec.loads('{"a": null}') == {"a": None}
+
+    with pytest.raises(json.JSONDecodeError):
+        json_codec.loads(b"{broken")
@@ -5,6 +5,8 @@
 import json
 from datetime import date, timedelta
 
+import pytest
+
 from app.core.persistence import SafeDailyJSONPersistence
 
 
@@ -14,33 +16,47 @@ def _write_task_file(directory, task_id, data):
         json.dump(data, f)
 
 
-def test_load_tasks_from_specific_date(tmp_path):
-    """Validate Load tasks from specific date."""
-    persistence = SafeDailyJSONPersistence(data_directory=tmp_path, lock_timeout=1, max_retries=1)
-
-    target_date = date(2024, 1, 2)
-    day_dir = tmp_path / target_date.strftime("%Y-%m-%d")
-    _write_task_file(day_dir, "task-1", {"task_id": "task-1", "status": "pending"})
+_SPECIFIC_DATE = date(2024, 1, 2)
 
-    loaded = persistence.load_tasks(target_date=target_date, load_all=False)
-
-    assert loaded == {"task-1": {"task_id": "task-1", "status": "pending"}}
 
-
-def test_load_tasks_prefers_newest_copy(tmp_path):
-    """Validate Load tasks prefers newest copy."""
-    persistence = SafeDailyJSONPersistence(data_directory=tmp_path, lock_timeout=1, max_retries=1)
+@pytest.fixture(scope="session")
+def persistence_corpus(tmp_path_factory):
+    """Task directories written once per session; the load tests only read from them."""
+    root = tmp_path_factory.mktemp("tasks")
 
     newest_date = date.today()
     older_date = newest_date - timedelta(days=1)
-
-    newest_dir = tmp_path / newest_date.strftime("%Y-%m-%d")
-    older_dir = tmp_path / older_date.strftime("%Y-%m-%d")
-
+    newest_dir = root / newest_date.strftime("%Y-%m-%d")
+    older_dir = root / older_date.strftime("%Y-%m-%d")
+
+    _write_task_file(
+        root / _SPECIFIC_DATE.strftime("%Y-%m-%d"),
+        "task-1",
+        {"task_id": "task-1", "status": "pending"},
+    )
     _write_task_file(older_dir, "shared-task", {"task_id": "shared-task", "status": "pending"})
     _write_task_file(newest_dir, "shared-task", {"task_id": "shared-task", "status": "completed"})
     _write_task_file(newest_dir, "unique-task", {"task_id": "unique-task", "status": "running"})
+    return root
 
+
+@pytest.fixture
+def persistence(persistence_corpus):
+    """Fresh persistence backend reading the shared session corpus."""
+    return SafeDailyJSONPersistence(
+        data_directory=persistence_corpus, lock_timeout=1, max_retries=1
+    )
+
+
+def test_load_tasks_from_specific_date(persistence):
+    """Validate Load tasks from specific date."""
+    loaded = persistence.load_tasks(target_date=_SPECIFIC_DATE, load_all=False)
+
+    assert loaded == {"task-1": {"task_id": "task-1", "status": "pending"}}
+
+
+def test_load_tasks_prefers_newest_copy(persistence):
+    """Validate Load tasks prefers newest copy."""
     loaded = persistence.load_tasks(load_all=True)
 
     assert loaded["shared-task"]["status"] == "completed"
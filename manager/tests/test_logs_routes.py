@@ -6,42 +6,58 @@ import builtins
 from pathlib import Path
 
 import pytest
-from fastapi.testclient import TestClient
 
-from app.core.auth import verify_admin
-from app.main import app
-from app.services import background_service
+_BOOM = Exception("x")
 
 
-@pytest.fixture
-def admin_client(monkeypatch):
-    async def _noop(*_, **__):
-        return None
+def _raise(*_a, **_k):
+    """Stand-in for read_logs that always fails."""
+    raise _BOOM
+
 
-    monkeypatch.setattr(background_service.background_manager, "start_all_services", _noop)
-    monkeypatch.setattr(background_service.background_manager, "stop_all_services", _noop)
+@pytest.fixture(scope="session")
+def logs_module():
+    # Import inside fixture so tests can monkeypatch module globals cleanly.
+    from app.api.routes import logs as logs_module  # type: ignore
 
-    app.dependency_overrides[verify_admin] = lambda: True
+    return logs_module
 
-    with TestClient(app) as client:
-        yield client
 
-    app.dependency_overrides.pop(verify_admin, None)
+@pytest.fixture(scope="module")
+def sample_log_file(tmp_path_factory) -> Path:
+    """Two-line INFO/ERROR manager log, written once and shared read-only by the module."""
+    log_file = tmp_path_factory.mktemp("logs") / "manager.log"
+    log_file.write_text(
+        "2026-01-01 00:00:01 - manager - INFO - [x] - hello\n"
+        "2026-01-01 00:00:02 - manager - ERROR - [x] - boom\n",
+        encoding="utf-8",
+    )
+    return log_file
 
 
 @pytest.fixture
-def logs_module():
-    # Import inside fixture so tests can monkeypatch module globals cleanly.
-    from app.api.routes import logs as logs_module  # type: ignore
+def use_log_manager(_app_client, logs_module):
+    """Serve the log routes from a given LogManager, instead of mutating the shared one."""
+    overrides = _app_client.app.dependency_overrides
 
-    return logs_module
+    def _use(manager):
+        overrides[logs_module.get_log_manager] = lambda: manager
+        return manager
+
+    yield _use
+    overrides.pop(logs_module.get_log_manager, None)
 
 
 @pytest.fixture
-def restore_log_paths(logs_module):
-    original_paths = list(logs_module.log_manager.log_paths)
-    yield
-    logs_module.log_manager.log_paths = original_paths
+def sample_log_manager(use_log_manager, logs_module, sample_log_file: Path):
+    return use_log_manager(logs_module.LogManager([str(sample_log_file)]))
+
+
+@pytest.fixture
+def failing_log_manager(use_log_manager, logs_module):
+    manager = logs_module.LogManager([])
+    manager.read_logs = _raise
+    return use_log_manager(manager)
 
 
 def test_logparser_parse_matches_pattern(logs_module):
@@ -52,51 +68,56 @@ def test_logparser_parse_matches_pattern(logs_module):
     )
 
     parsed = logs_module.LogParser.parse_log_line(line)
-    assert parsed["timestamp"] == "2025-10-22 15:43:34"
-    assert parsed["module"] == "runner"
-    assert parsed["level"] == "INFO"
-    assert parsed["context"].startswith("[")
-    assert "Encoding task" in parsed["message"]
+    assert parsed.timestamp == "2025-10-22 15:43:34"
+    assert parsed.module == "runner"
+    assert parsed.level == "INFO"
+    assert parsed.context.startswith("[")
+    assert "Encoding task" in parsed.message
+
+
+def test_logparser_returns_parsed_line(logs_module):
+    """Validate parsed entries expose fields by attribute and position."""
+    parsed = logs_module.LogParser.parse_log_line(
+        "2025-10-22 15:43:34 - manager - warning - [m:f:1] - careful\n"
+    )
+
+    assert isinstance(parsed, logs_module.ParsedLine)
+    assert parsed.level == "WARNING"
+    assert parsed[0] == parsed.timestamp == "2025-10-22 15:43:34"
+    assert parsed.raw == "2025-10-22 15:43:34 - manager - warning - [m:f:1] - careful"
 
 
 def test_logparser_parse_fallback(logs_module):
     """Validate Logparser parse fallback."""
     parsed = logs_module.LogParser.parse_log_line("not matching")
-    assert parsed["module"] == "UNKNOWN"
-    assert parsed["level"] == "UNKNOWN"
-    assert parsed["message"] == "not matching"
+    assert parsed.module == "UNKNOWN"
+    assert parsed.level == "UNKNOWN"
+    assert parsed.message == "not matching"
 
 
-def test_logmanager_read_logs_filters_and_sorts(tmp_path: Path, logs_module):
+def test_logmanager_read_logs_filters_and_sorts(sample_log_file: Path, logs_module):
     """Validate Logmanager read logs filters and sorts."""
-    log_file = tmp_path / "manager.log"
-    log_file.write_text(
-        "2026-01-01 00:00:01 - manager - INFO - [x] - hello\n"
-        "2026-01-01 00:00:02 - manager - ERROR - [x] - boom\n",
-        encoding="utf-8",
-    )
-
-    manager = logs_module.LogManager([str(log_file)])
+    manager = logs_module.LogManager([str(sample_log_file)])
 
     # Filter by level
     only_error = manager.read_logs(limit=100, level_filter=["ERROR"])
     assert len(only_error) == 1
-    assert only_error[0]["level"] == "ERROR"
+    assert only_error[0].level == "ERROR"
 
     # Search term
     only_hello = manager.read_logs(limit=100, search_term="hello")
     assert len(only_hello) == 1
-    assert "hello" in only_hello[0]["raw"]
+    assert "hello" in only_hello[0].raw
 
     # Chronological display order (oldest -> newest)
     ordered = manager.read_logs(limit=100)
-    assert ordered[0]["raw"].endswith("hello")
-    assert ordered[1]["raw"].endswith("boom")
+    assert ordered[0].raw.endswith("hello")
+    assert ordered[1].raw.endswith("boom")
 
     # Sorting + limit
     limited = manager.read_logs(limit=1)
     assert len(limited) == 1
-    assert limited[0]["raw"].endswith("boom")
+    assert limited[0].raw.endswith("boom")
 
 
 def test_logmanager_groups_multiline_payloads(tmp_path: Path, logs_module):
@@ -117,13 +138,36 @@ def test_logmanager_groups_multiline_payloads(tmp_path: Path, logs_module):
     logs = manager.read_logs(limit=100)
 
     assert len(logs) == 1
-    assert logs[0]["level"] == "WARNING"
-    assert "<!DOCTYPE html>" in logs[0]["message"]
-    assert "<title>403 Forbidden</title>" in logs[0]["raw"]
+    assert logs[0].level == "WARNING"
+    assert "<!DOCTYPE html>" in logs[0].message
+    assert "<title>403 Forbidden</title>" in logs[0].raw
 
     filtered = manager.read_logs(limit=100, search_term="forbidden")
     assert len(filtered) == 1
-    assert filtered[0]["level"] == "WARNING"
+    assert filtered[0].level == "WARNING"
+
+
+def test_logmanager_limit_reads_newest_entries_from_the_end(tmp_path: Path, logs_module):
+    """Validate Logmanager limit keeps newest grouped entries and skips empty files."""
+    log_file = tmp_path / "manager.log"
+    log_file.write_text(
+        "2026-01-01 00:00:01 - manager - INFO - [x] - first\n"
+        "2026-01-01 00:00:02 - manager - ERROR - [x] - second\n"
+        "  trace line\n"
+        "2026-01-01 00:00:03 - manager - INFO - [x] - third\n",
+        encoding="utf-8",
+    )
+    empty_file = tmp_path / "empty.log"
+    empty_file.write_text("", encoding="utf-8")
+
+    manager = logs_module.LogManager([str(empty_file), str(log_file)])
+
+    newest = manager.read_logs(limit=2)
+    assert [log.message for log in newest] == ["second\n  trace line", "third"]
+
+    only_error = manager.read_logs(limit=1, level_filter=["ERROR"])
+    assert len(only_error) == 1
+    assert only_error[0].raw.endswith("trace line")
 
 
 def test_logmanager_keeps_leading_unknown_and_skips_blank_lines(tmp_path: Path, logs_module):
@@ -141,9 +185,42 @@ def test_logmanager_keeps_leading_unknown_and_skips_blank_lines(tmp_path: Path,
 
     assert len(logs) == 2
     assert any(
-        log["level"] == "UNKNOWN" and log["message"] == "leading unstructured line" for log in logs
+        log.level == "UNKNOWN" and log.message == "leading unstructured line" for log in logs
     )
-    assert any(log["level"] == "INFO" and log["message"] == "structured" for log in logs)
+    assert any(log.level == "INFO" and log.message == "structured" for log in logs)
+
+
+@pytest.mark.parametrize(
+    "content",
+    [b"", b"\n", b"one", b"one\ntwo\n", b"one\r\n\nthree\n", b"a\nb\nc\nd\ne\nlast line"],
+)
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 1024])
+def test_iter_lines_reversed_matches_lines_across_chunk_boundaries(
+    tmp_path: Path, logs_module, content: bytes, chunk_size: int
+):
+    """Validate the reverse reader yields the file lines last to first for any chunk size."""
+    log_file = tmp_path / "manager.log"
+    log_file.write_bytes(content)
+    expected = [line.rstrip("\r") for line in content.decode().split("\n")] if content else []
+    if content.endswith(b"\n"):
+        expected.pop()
+
+    with open(log_file, "rb") as f:
+        lines = list(logs_module.LogManager._iter_lines_reversed(f, chunk_size))
+
+    assert lines == expected[::-1]
+
+
+def test_iter_lines_reversed_stops_when_file_is_truncated(tmp_path: Path, logs_module):
+    """Validate a copytruncate rotation during the scan ends it instead of failing."""
+    log_file = tmp_path / "manager.log"
+    log_file.write_bytes(b"first\nsecond\nthird\n")
+
+    with open(log_file, "rb") as f:
+        lines = logs_module.LogManager._iter_lines_reversed(f, 6)
+        assert next(lines) == "third"
+        log_file.write_bytes(b"")
+        assert list(lines) == []
 
 
 def test_logmanager_skips_missing_file(tmp_path: Path, logs_module):
@@ -176,17 +253,18 @@ def test_logmanager_continues_on_read_error(tmp_path: Path, logs_module, monkeyp
     logs = manager.read_logs(limit=10)
 
     assert len(logs) == 1
-    assert logs[0]["raw"].endswith("ok")
+    assert logs[0].raw.endswith("ok")
 
 
 def test_get_logs_statistics_counts_unknown(logs_module):
     """Validate Get logs statistics counts unknown."""
     manager = logs_module.LogManager([])
+    unknown = logs_module.LogParser.create_unknown_log_line("x")
     stats = manager.get_logs_statistics(
         [
-            {"level": "INFO"},
-            {"level": "UNKNOWN"},
-            {"level": "MYSTERY"},
+            unknown._replace(level="INFO"),
+            unknown,
+            unknown._replace(level="MYSTERY"),
         ]
     )
 
@@ -210,93 +288,53 @@ def test_tail_logs_error_returns_empty(logs_module, tmp_path: Path):
     assert logs_module.tail_logs(str(missing), n=10) == []
 
 
-def test_view_logs_ok(admin_client, logs_module, restore_log_paths, tmp_path: Path):
+def test_view_logs_ok(admin_client, sample_log_manager):
     """Validate View logs ok."""
-    log_file = tmp_path / "manager.log"
-    log_file.write_text(
-        "2026-01-01 00:00:01 - manager - INFO - [x] - hello\n",
-        encoding="utf-8",
-    )
-
-    logs_module.log_manager.log_paths = [str(log_file)]
-
     resp = admin_client.get("/logs/?limit=10&level=INFO&search=hello")
     assert resp.status_code == 200
     assert "Logs" in resp.text
     assert "hello" in resp.text
 
 
-def test_view_logs_raises_500_on_error(admin_client, logs_module, monkeypatch):
+def test_view_logs_raises_500_on_error(admin_client, failing_log_manager):
     """Validate View logs raises 500 on error."""
-    monkeypatch.setattr(
-        logs_module.log_manager, "read_logs", lambda *a, **k: (_ for _ in ()).throw(Exception("x"))
-    )
-
     resp = admin_client.get("/logs/")
     assert resp.status_code == 500
     assert resp.json()["detail"] == "Error reading logs"
 
 
-def test_stream_logs_ok(admin_client, logs_module, restore_log_paths, tmp_path: Path):
+def test_stream_logs_ok(admin_client, sample_log_manager):
     """Validate Stream logs ok."""
-    log_file = tmp_path / "manager.log"
-    log_file.write_text(
-        "2026-01-01 00:00:01 - manager - INFO - [x] - hello\n",
-        encoding="utf-8",
-    )
-    logs_module.log_manager.log_paths = [str(log_file)]
-
+    # limit keeps the newest entry only.
     resp = admin_client.get("/logs/stream?limit=1")
     assert resp.status_code == 200
-    assert "hello" in resp.text
+    assert "boom" in resp.text
+    assert "hello" not in resp.text
 
 
-def test_stream_logs_returns_html_error_on_exception(admin_client, logs_module, monkeypatch):
+def test_stream_logs_returns_html_error_on_exception(admin_client, failing_log_manager):
     """Validate Stream logs returns html error on exception."""
-    monkeypatch.setattr(
-        logs_module.log_manager, "read_logs", lambda *a, **k: (_ for _ in ()).throw(Exception("x"))
-    )
-
     resp = admin_client.get("/logs/stream")
     assert resp.status_code == 200
     assert "Error reading logs" in resp.text
 
 
-def test_search_logs_ok(admin_client, logs_module, restore_log_paths, tmp_path: Path):
+def test_search_logs_ok(admin_client, sample_log_manager):
     """Validate Search logs ok."""
-    log_file = tmp_path / "manager.log"
-    log_file.write_text(
-        "2026-01-01 00:00:01 - manager - INFO - [x] - needle\n",
-        encoding="utf-8",
-    )
-    logs_module.log_manager.log_paths = [str(log_file)]
-
-    resp = admin_client.get("/logs/search?q=needle&limit=10")
+    resp = admin_client.get("/logs/search?q=hello&limit=10")
     assert resp.status_code == 200
-    assert "needle" in resp.text
+    assert "hello" in resp.text
 
 
-def test_search_logs_raises_500_on_error(admin_client, logs_module, monkeypatch):
+def test_search_logs_raises_500_on_error(admin_client, failing_log_manager):
     """Validate Search logs raises 500 on error."""
-    monkeypatch.setattr(
-        logs_module.log_manager, "read_logs", lambda *a, **k: (_ for _ in ()).throw(Exception("x"))
-    )
-
     resp = admin_client.get("/logs/search?q=x")
     assert resp.status_code == 500
     assert resp.json()["detail"] == "Error during search"
 
 
-def test_logs_stats_ok(admin_client, logs_module, restore_log_paths, tmp_path: Path):
+def test_logs_stats_ok(admin_client, sample_log_manager):
     """Validate Logs stats ok."""
-    log_file = tmp_path / "manager.log"
-    log_file.write_text(
-        "2026-01-01 00:00:01 - manager - INFO - [x] - hello\n"
-        "2026-01-01 00:00:02 - manager - ERROR - [x] - boom\n",
-        encoding="utf-8",
-    )
-    logs_module.log_manager.log_paths = [str(log_file)]
-
     resp = admin_client.get("/logs/api/stats")
     assert resp.status_code == 200
 
@@ -307,12 +345,8 @@ def test_logs_stats_ok(admin_client, logs_module, restore_log_paths, tmp_path: P
     assert isinstance(payload["last_updated"], str)
 
 
-def test_logs_stats_raises_500_on_error(admin_client, logs_module, monkeypatch):
+def test_logs_stats_raises_500_on_error(admin_client, failing_log_manager):
     """Validate Logs stats raises 500 on error."""
-    monkeypatch.setattr(
-        logs_module.log_manager, "read_logs", lambda *a, **k: (_ for _ in ()).throw(Exception("x"))
-    )
-
     resp = admin_client.get("/logs/api/stats")
     assert resp.status_code == 500
     assert resp.json()["detail"] == "Error calculating statistics"
@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-import importlib
 import signal
 from types import SimpleNamespace
 
 import pytest
-from fastapi.testclient import TestClient
+from fastapi import FastAPI
 
 from app import main
 from app.core.config import config
@@ -23,43 +22,33 @@ def test_register_sighup_reload_handles_failure(monkeypatch):
     main._register_sighup_reload()
 
 
-def test_lifespan_adds_protected_openapi_when_private(monkeypatch):
-    """Validate Lifespan adds protected openapi when private."""
-    orig_visibility = config.API_DOCS_VISIBILITY
-
-    # Force private docs so both openapi_config and lifespan branch run
-    monkeypatch.setattr(config, "API_DOCS_VISIBILITY", "private")
-
-    reloaded_main = importlib.reload(main)
+@pytest.mark.parametrize("visibility", ["private", "public"])
+def test_build_openapi_config_hides_default_routes_only_when_private(visibility):
+    """Validate Build openapi config hides default routes only when private."""
+    openapi_config = main._build_openapi_config(visibility)
 
-    async def _noop(*_, **__):
-        return None
+    urls = (openapi_config["docs_url"], openapi_config["redoc_url"], openapi_config["openapi_url"])
+    if visibility == "private":
+        assert urls == (None, None, None)
+    else:
+        assert None not in urls
 
-    monkeypatch.setattr(reloaded_main.background_manager, "start_all_services", _noop)
-    monkeypatch.setattr(reloaded_main.background_manager, "stop_all_services", _noop)
 
-    called = {}
-    monkeypatch.setattr(
-        reloaded_main,
-        "setup_protected_openapi_routes",
-        lambda app: called.setdefault("called", True),
-    )
-
-    # Ensure routers are re-included during startup
-    if getattr(reloaded_main.app.state, "routers_included", False):
-        reloaded_main.app.state.routers_included = False
+@pytest.mark.asyncio
+async def test_lifespan_adds_protected_openapi_when_private(monkeypatch):
+    """Validate Lifespan adds protected openapi when private."""
+    monkeypatch.setattr(config, "API_DOCS_VISIBILITY", "private")
 
-    with TestClient(reloaded_main.app) as client:
-        client.get("/")
+    protected: list[FastAPI] = []
+    monkeypatch.setattr(main, "setup_protected_openapi_routes", protected.append)
 
-    assert reloaded_main.openapi_config["docs_url"] is None
-    assert reloaded_main.openapi_config["redoc_url"] is None
-    assert reloaded_main.openapi_config["openapi_url"] is None
-    assert called.get("called") is True
+    # A throwaway app runs the router-inclusion branch without reloading app.main.
+    throwaway = FastAPI()
+    async with main.lifespan(throwaway):
+        pass
 
-    # Restore visibility and module state for subsequent tests
-    monkeypatch.setattr(config, "API_DOCS_VISIBILITY", orig_visibility)
-    importlib.reload(main)
+    assert protected == [throwaway]
+    assert throwaway.state.routers_included is True
 
 
 @pytest.mark.asyncio
@@ -5,65 +5,37 @@ from __future__ import annotations
 from datetime import datetime
 
 import pytest
-from fastapi.testclient import TestClient
+from state_helpers import isolated_mapping
 
+from app.api.routes import manager as manager_routes
 from app.core import state as state_module
-from app.core.auth import verify_token
 from app.core.state import runners, tasks
-from app.main import app
 from app.models.models import Runner, Task
-from app.services import background_service
 
-
-@pytest.fixture
-def client(monkeypatch):
-    async def _noop(*_, **__):
-        return None
-
-    monkeypatch.setattr(background_service.background_manager, "start_all_services", _noop)
-    monkeypatch.setattr(background_service.background_manager, "stop_all_services", _noop)
-
-    app.dependency_overrides[verify_token] = lambda: True
-
-    with TestClient(app) as test_client:
-        yield test_client
-
-    app.dependency_overrides.pop(verify_token, None)
+# Fixed timestamps: these tests only need a valid value, never the current time.
+_FIXED_TS = datetime(2024, 1, 1, 12, 0, 0)
+_FIXED_TS_ISO = _FIXED_TS.isoformat()
 
 
 @pytest.fixture
 def clean_state(monkeypatch):
-    original_runners = dict(runners)
-    original_tasks = dict(tasks)
-    original_is_production = state_module.IS_PRODUCTION
-
     monkeypatch.setattr(state_module, "IS_PRODUCTION", False)
-    runners.clear()
-    tasks.clear()
-
-    yield
-
-    monkeypatch.setattr(state_module, "IS_PRODUCTION", original_is_production)
-    runners.clear()
-    runners.update(original_runners)
-    tasks.clear()
-    tasks.update(original_tasks)
+    with isolated_mapping(runners), isolated_mapping(tasks):
+        yield
 
 
-def test_manager_health_includes_counts(client, clean_state):
-    """Validate Manager health includes counts."""
+def _populate_one_runner_and_task() -> None:
     runners["r1"] = Runner(
         id="r1",
         url="http://r1.example",
         task_types=["encoding"],
         token="",
         version="1.0.0",
-        last_heartbeat=datetime.now(),
+        last_heartbeat=_FIXED_TS,
         availability="available",
         status="offline",
     )
 
-    now = datetime.now().isoformat()
     tasks["t1"] = Task(
         task_id="t1",
         runner_id="r1",
@@ -77,17 +49,31 @@ def test_manager_health_includes_counts(client, clean_state):
         parameters={},
         notify_url="https://example.com/notify",
         completion_callback=None,
-        created_at=now,
-        updated_at=now,
+        created_at=_FIXED_TS_ISO,
+        updated_at=_FIXED_TS_ISO,
         error=None,
         script_output=None,
     )
 
-    resp = client.get("/manager/health")
-    assert resp.status_code == 200
 
-    payload = resp.json()
+@pytest.mark.asyncio
+async def test_manager_health_includes_counts(clean_state):
+    """Validate Manager health includes counts."""
+    _populate_one_runner_and_task()
+
+    # Call the handler directly: the assertions are about its return value, not routing.
+    payload = await manager_routes.health_check()
+
     assert payload["status"] == "healthy"
     assert payload["runners"] == 1
     assert payload["tasks"] == 1
     assert isinstance(payload["timestamp"], str)
+
+
+def test_manager_health_route_smoke(api_client, clean_state):
+    """Validate the /manager/health route is wired and serializes the handler result."""
+    _populate_one_runner_and_task()
+
+    resp = api_client.get("/manager/health")
+    assert resp.status_code == 200
+    assert resp.json()["runners"] == 1
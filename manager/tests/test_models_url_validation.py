@@ -5,19 +5,24 @@ import pytest
 from app.models.models import TaskRequest
 
 
-def test_task_request_allows_empty_urls_but_keeps_value():
-    # _validate_safe_url returns early when the value is falsy.
-    """Validate Task request allows empty urls but keeps value."""
-    req = TaskRequest(
+@pytest.fixture(scope="module")
+def base_task_kwargs():
+    """Valid TaskRequest fields shared by the URL tests; each test overrides the URLs."""
+    return dict(
         etab_name="UM",
         app_name="pod",
         app_version="1.0",
         task_type="encoding",
-        source_url="",
         affiliation=None,
         parameters={},
-        notify_url="",
+        notify_url="https://example.com/notify",
     )
+
+
+def test_task_request_allows_empty_urls_but_keeps_value(base_task_kwargs):
+    # _validate_safe_url returns early when the value is falsy.
+    """Validate Task request allows empty urls but keeps value."""
+    req = TaskRequest(**{**base_task_kwargs, "source_url": "", "notify_url": ""})
     assert req.source_url == ""
     assert req.notify_url == ""
 
@@ -31,16 +36,7 @@ def test_task_request_allows_empty_urls_but_keeps_value():
         ("http://169.254.169.254/x", "must not point to a private"),
     ),
 )
-def test_task_request_rejects_unsafe_urls(url: str, expected: str):
+def test_task_request_rejects_unsafe_urls(base_task_kwargs, url: str, expected: str):
     """Validate Task request rejects unsafe urls."""
     with pytest.raises(ValueError, match=expected):
-        TaskRequest(
-            etab_name="UM",
-            app_name="pod",
-            app_version="1.0",
-            task_type="encoding",
-            source_url=url,
-            affiliation=None,
-            parameters={},
-            notify_url="https://example.com/notify",
-        )
+        TaskRequest(**base_task_kwargs, source_url=url)
@@ -4,6 +4,15 @@ import pytest
 from fastapi import HTTPException
 
 import app.api.routes.task as task_module
+from app.services import task_callback_service
+
+
+@pytest.fixture
+def resolved_hosts(monkeypatch):
+    """Give each test an empty DNS cache."""
+    cache = {}
+    monkeypatch.setattr(task_callback_service, "_resolved_hosts", cache)
+    return cache
 
 
 def test_host_matches_allowlist_variants():
@@ -23,7 +32,7 @@ def test_is_disallowed_ip_invalid_is_true():
 
 
 @pytest.mark.asyncio
-async def test_resolve_host_ips_skips_empty_sockaddr(monkeypatch):
+async def test_resolve_host_ips_skips_empty_sockaddr(monkeypatch, resolved_hosts):
     """Validate Resolve host ips skips empty sockaddr entries."""
 
     class DummyLoop:
@@ -42,6 +51,50 @@ async def test_resolve_host_ips_skips_empty_sockaddr(monkeypatch):
     assert ips == ["1.1.1.1", "8.8.8.8"]
 
 
+@pytest.mark.asyncio
+async def test_resolve_host_ips_caches_successful_lookups(monkeypatch, resolved_hosts):
+    """Validate DNS answers are reused until they expire, and failures are not cached."""
+    answers = {"example.com": ["93.184.216.34"], "empty.example": []}
+    calls = []
+    clock = [1000.0]
+
+    async def fake_resolve(host: str):
+        calls.append(host)
+        return list(answers[host])
+
+    monkeypatch.setattr(task_callback_service, "resolve_host_ips", fake_resolve)
+    monkeypatch.setattr(task_callback_service.time, "monotonic", lambda: clock[0])
+
+    assert await task_module._resolve_host_ips("example.com") == ["93.184.216.34"]
+    assert await task_module._resolve_host_ips("example.com") == ["93.184.216.34"]
+    assert calls == ["example.com"]
+
+    clock[0] += task_callback_service.RESOLVED_HOSTS_TTL_SECONDS
+    assert await task_module._resolve_host_ips("example.com") == ["93.184.216.34"]
+    assert calls == ["example.com", "example.com"]
+
+    assert await task_module._resolve_host_ips("empty.example") == []
+    assert await task_module._resolve_host_ips("empty.example") == []
+    assert calls.count("empty.example") == 2
+    assert set(resolved_hosts) == {"example.com"}
+
+
+@pytest.mark.asyncio
+async def test_resolve_host_ips_cache_evicts_oldest(monkeypatch, resolved_hosts):
+    """Validate the DNS cache drops its oldest entry once full."""
+
+    async def fake_resolve(host: str):
+        return ["93.184.216.34"]
+
+    monkeypatch.setattr(task_callback_service, "resolve_host_ips", fake_resolve)
+    monkeypatch.setattr(task_callback_service, "RESOLVED_HOSTS_MAXSIZE", 2)
+
+    for host in ("a.example", "b.example", "c.example"):
+        await task_module._resolve_host_ips(host)
+
+    assert list(resolved_hosts) == ["b.example", "c.example"]
+
+
 @pytest.mark.parametrize(
     "url,detail",
     (
@@ -10,19 +10,33 @@ from app.core.config import config
 OPENAPI_ROUTES = ("/docs", "/redoc", "/openapi.json")
 
 
+@pytest.fixture
+def openapi_client(_app_client):
+    """Session test client without cookies left over from other tests."""
+
+    _app_client.cookies.clear()
+    yield _app_client
+    _app_client.cookies.clear()
+
+
+@pytest.mark.skipif(config.API_DOCS_VISIBILITY != "public", reason="API docs are private")
+@pytest.mark.filterwarnings("ignore:Duplicate Operation ID.*:UserWarning")
+@pytest.mark.parametrize("route", OPENAPI_ROUTES)
+def test_openapi_routes_are_open_when_public(openapi_client, route):
+    """Ensure OpenAPI routes are served without a token when docs are public."""
+
+    response = openapi_client.get(route)
+    assert response.status_code == 200
+
+
+@pytest.mark.skipif(config.API_DOCS_VISIBILITY == "public", reason="API docs are public")
 @pytest.mark.filterwarnings("ignore:Duplicate Operation ID.*:UserWarning")
 @pytest.mark.parametrize("route", OPENAPI_ROUTES)
-def test_openapi_access_control(client, auth_headers, route):
-    """Ensure OpenAPI routes respect API_DOCS_VISIBILITY."""
-
-    if config.API_DOCS_VISIBILITY == "public":
-        response = client.get(route)
-        assert response.status_code == 200
-    else:
-        # Private mode: no token -> 401
-        unauthorized = client.get(route)
-        assert unauthorized.status_code == 401
-
-        # Private mode: token -> 200
-        authorized = client.get(route, headers={"Authorization": auth_headers["Authorization"]})
-        assert authorized.status_code == 200
+def test_openapi_routes_require_token_when_private(openapi_client, auth_headers, route):
+    """Ensure OpenAPI routes answer 401 without a token and 200 with one when docs are private."""
+
+    unauthorized = openapi_client.get(route)
+    assert unauthorized.status_code == 401
+
+    authorized = openapi_client.get(route, headers={"Authorization": auth_headers["Authorization"]})
+    assert authorized.status_code == 200
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import httpx
+import pytest
 from fastapi import Depends, FastAPI
 from fastapi.testclient import TestClient
 from starlette.requests import Request
@@ -17,10 +19,36 @@ from app.api.openapi import (
     setup_openapi_config,
     setup_protected_openapi_routes,
 )
-from app.core.auth import verify_admin, verify_runner_version, verify_token
+from app.core.auth import (
+    build_openapi_cookie_value,
+    verify_admin,
+    verify_openapi_token,
+    verify_runner_version,
+    verify_token,
+)
 from app.core.config import config
 
 
+@pytest.fixture(scope="module")
+def _protected_openapi_app():
+    """One app with the protected docs routes and its client, shared by the module."""
+    app = FastAPI(openapi_url=None, docs_url=None, redoc_url=None)
+    setup_protected_openapi_routes(app)
+    # Not entered as a context manager: the docs-only app has no lifespan to run
+    client = TestClient(app)
+    yield app, client
+    client.close()
+
+
+@pytest.fixture
+def protected_openapi(_protected_openapi_app):
+    """Shared protected docs app/client; overrides and cookies are reset after each test."""
+    app, client = _protected_openapi_app
+    yield app, client
+    app.dependency_overrides.clear()
+    client.cookies.clear()
+
+
 def test_get_openapi_tags_contains_expected_names():
     """Validate Get openapi tags contains expected names."""
     tags = _get_openapi_tags()
@@ -39,6 +67,8 @@ def test_assign_tags_to_endpoints_by_path_patterns():
             "/task/stop/{task_id}": {"post": {}},
             "/auth/token": {"post": {}},
             "/other": {"get": {}},
+            "/manager/ping": {"get": {}, "head": {}},
+            "/task/heartbeat": {"post": {}},
         }
     }
 
@@ -51,6 +81,9 @@ def test_assign_tags_to_endpoints_by_path_patterns():
     assert schema["paths"]["/task/stop/{task_id}"]["post"]["tags"] == ["Task"]
     assert schema["paths"]["/auth/token"]["post"]["tags"] == ["Authentication"]
     assert schema["paths"]["/other"]["get"]["tags"] == ["API"]
+    assert schema["paths"]["/manager/ping"]["head"]["tags"] == ["Health"]
+    # Earlier rules win: "heartbeat" (Runner) is checked before "task"
+    assert schema["paths"]["/task/heartbeat"]["post"]["tags"] == ["Runner"]
 
 
 def test_enhance_schemas_with_examples_sets_examples_when_schemas_exist():
@@ -193,7 +226,7 @@ def test_mark_runner_version_header_ignores_path_level_parameters():
     assert schema["paths"]["/runner"]["get"]["parameters"][0]["required"] is True
 
 
-def test_runner_version_dependency_keeps_explicit_missing_header_error():
+async def test_runner_version_dependency_keeps_explicit_missing_header_error():
     """Return the existing HTTP 400 response when the version header is absent."""
     app = FastAPI()
 
@@ -201,8 +234,10 @@ def test_runner_version_dependency_keeps_explicit_missing_header_error():
     def runner_route():
         return None
 
-    with TestClient(app) as client:
-        response = client.get("/runner")
+    # No lifespan needed: call the ASGI app in-process on the test's own event loop
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        response = await client.get("/runner")
 
     assert response.status_code == 400
     assert response.json()["detail"].startswith("Missing X-Runner-Version header")
@@ -249,62 +284,51 @@ def test_set_openapi_auth_cookie_if_needed_skips_when_builder_returns_none():
     assert response.headers.get("set-cookie") is None
 
 
-def test_setup_protected_openapi_routes_docs_uses_cookie_and_no_query_token(monkeypatch):
-    # Start with docs disabled so we know the override route comes from setup_protected_openapi_routes
+def test_setup_protected_openapi_routes_docs_uses_cookie_and_no_query_token(
+    monkeypatch, protected_openapi
+):
     """Validate Setup protected openapi routes docs uses cookie and no query token."""
-    app = FastAPI(openapi_url=None, docs_url=None, redoc_url=None)
-    setup_protected_openapi_routes(app)
-
-    from app.core.auth import verify_openapi_token
-
+    app, client = protected_openapi
     monkeypatch.setattr(config, "AUTHORIZED_TOKENS", {"docs": "tok123"})
     monkeypatch.setattr(config, "OPENAPI_COOKIE_SECRET", "unit-test-secret")
     monkeypatch.setattr(config, "OPENAPI_COOKIE_MAX_AGE_SECONDS", 900)
     app.dependency_overrides[verify_openapi_token] = lambda: "tok123"
 
-    with TestClient(app) as client:
-        resp = client.get("/docs")
-        assert resp.status_code == 200
-        assert "openapi.json?token=tok123" not in resp.text
-        assert "openapi.json" in resp.text
-        set_cookie = resp.headers.get("set-cookie", "")
-        assert "openapi_token=" in set_cookie
-        assert "openapi_token=tok123" not in set_cookie
-        assert "Max-Age=900" in set_cookie
+    resp = client.get("/docs")
+    assert resp.status_code == 200
+    assert "openapi.json?token=tok123" not in resp.text
+    assert "openapi.json" in resp.text
+    set_cookie = resp.headers.get("set-cookie", "")
+    assert "openapi_token=" in set_cookie
+    assert "openapi_token=tok123" not in set_cookie
+    assert "Max-Age=900" in set_cookie
 
 
-def test_setup_protected_openapi_routes_redoc_uses_cookie_and_no_query_token(monkeypatch):
+def test_setup_protected_openapi_routes_redoc_uses_cookie_and_no_query_token(
+    monkeypatch, protected_openapi
+):
     """Validate Setup protected openapi routes redoc uses cookie and no query token."""
-    app = FastAPI(openapi_url=None, docs_url=None, redoc_url=None)
-    setup_protected_openapi_routes(app)
-
-    from app.core.auth import verify_openapi_token
-
+    app, client = protected_openapi
     monkeypatch.setattr(config, "AUTHORIZED_TOKENS", {"docs": "tok456"})
     monkeypatch.setattr(config, "OPENAPI_COOKIE_SECRET", "unit-test-secret")
     monkeypatch.setattr(config, "OPENAPI_COOKIE_MAX_AGE_SECONDS", 900)
     app.dependency_overrides[verify_openapi_token] = lambda: "tok456"
 
-    with TestClient(app) as client:
-        resp = client.get("/redoc")
-        assert resp.status_code == 200
-        assert "openapi.json?token=tok456" not in resp.text
-        assert "openapi.json" in resp.text
-        set_cookie = resp.headers.get("set-cookie", "")
-        assert "openapi_token=" in set_cookie
-        assert "openapi_token=tok456" not in set_cookie
-        assert "Max-Age=900" in set_cookie
+    resp = client.get("/redoc")
+    assert resp.status_code == 200
+    assert "openapi.json?token=tok456" not in resp.text
+    assert "openapi.json" in resp.text
+    set_cookie = resp.headers.get("set-cookie", "")
+    assert "openapi_token=" in set_cookie
+    assert "openapi_token=tok456" not in set_cookie
+    assert "Max-Age=900" in set_cookie
 
 
 def test_setup_protected_openapi_routes_skips_rotation_when_disabled_and_cookie_present(
-    monkeypatch,
+    monkeypatch, protected_openapi
 ):
     """Validate Setup protected openapi routes skips rotation when disabled and cookie present."""
-    app = FastAPI(openapi_url=None, docs_url=None, redoc_url=None)
-    setup_protected_openapi_routes(app)
-
-    from app.core.auth import build_openapi_cookie_value, verify_openapi_token
-
+    app, client = protected_openapi
     monkeypatch.setattr(config, "AUTHORIZED_TOKENS", {"docs": "tok-no-rotate"})
     monkeypatch.setattr(config, "OPENAPI_COOKIE_SECRET", "unit-test-secret")
     monkeypatch.setattr(config, "OPENAPI_COOKIE_MAX_AGE_SECONDS", 900)
@@ -314,33 +338,29 @@ def test_setup_protected_openapi_routes_skips_rotation_when_disabled_and_cookie_
     existing_cookie = build_openapi_cookie_value("tok-no-rotate")
     assert existing_cookie is not None
 
-    with TestClient(app) as client:
-        client.cookies.set("openapi_token", existing_cookie)
-        resp = client.get("/docs")
-        assert resp.status_code == 200
-        assert resp.headers.get("set-cookie") is None
+    client.cookies.set("openapi_token", existing_cookie)
+    resp = client.get("/docs")
+    assert resp.status_code == 200
+    assert resp.headers.get("set-cookie") is None
 
 
-def test_setup_protected_openapi_routes_without_token_keeps_plain_openapi_url_and_openapi_json_works():
+def test_setup_protected_openapi_routes_without_token_keeps_plain_openapi_url_and_openapi_json_works(
+    protected_openapi,
+):
     """Validate Setup protected openapi routes without token keeps plain openapi url and openapi json works."""
-    app = FastAPI(openapi_url=None, docs_url=None, redoc_url=None)
-    setup_protected_openapi_routes(app)
-
-    from app.core.auth import verify_openapi_token
-
+    app, client = protected_openapi
     app.dependency_overrides[verify_openapi_token] = lambda: None
 
-    with TestClient(app) as client:
-        docs = client.get("/docs")
-        assert docs.status_code == 200
-        assert "openapi.json?token=" not in docs.text
+    docs = client.get("/docs")
+    assert docs.status_code == 200
+    assert "openapi.json?token=" not in docs.text
 
-        redoc = client.get("/redoc")
-        assert redoc.status_code == 200
+    redoc = client.get("/redoc")
+    assert redoc.status_code == 200
 
-        schema = client.get("/openapi.json")
-        assert schema.status_code == 200
-        assert schema.json()["openapi"]
+    schema = client.get("/openapi.json")
+    assert schema.status_code == 200
+    assert schema.json()["openapi"]
 
 
 def test_openapi_config_get_fastapi_config_has_expected_keys():
@@ -350,3 +370,29 @@ def test_openapi_config_get_fastapi_config_has_expected_keys():
     assert cfg["openapi_url"] == OpenAPIConfig.OPENAPI_URL
     assert cfg["docs_url"] == OpenAPIConfig.DOCS_URL
     assert cfg["redoc_url"] == OpenAPIConfig.REDOC_URL
+
+
+def test_protected_openapi_json_serves_cached_body_with_etag(protected_openapi):
+    """Validate /openapi.json is encoded once, carries an ETag and answers 304 on a match."""
+    app, client = protected_openapi
+    app.dependency_overrides[verify_openapi_token] = lambda: None
+
+    first = client.get("/openapi.json")
+    assert first.status_code == 200
+    assert first.headers["content-type"] == "application/json"
+    etag = first.headers["etag"]
+    assert etag.startswith('"') and etag.endswith('"')
+    cached = app.state.openapi_json
+
+    second = client.get("/openapi.json")
+    assert second.content == first.content
+    assert second.headers["etag"] == etag
+    assert app.state.openapi_json is cached
+
+    not_modified = client.get("/openapi.json", headers={"If-None-Match": f"W/{etag}"})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+    stale = client.get("/openapi.json", headers={"If-None-Match": '"stale"'})
+    assert stale.status_code == 200
+    assert stale.json() == first.json()
@@ -18,7 +18,7 @@ def test_password_context_supports_bytes_for_hash_and_verify():
 
 def test_password_context_hash_rejects_invalid_type():
     """Validate Password context hash rejects invalid type."""
-    context = BcryptPasswordContext()
+    context = BcryptPasswordContext(rounds=4)
 
     with pytest.raises(TypeError):
         context.hash(123)  # type: ignore[arg-type]
@@ -31,3 +31,15 @@ def test_password_context_verify_handles_invalid_inputs():
 
     assert context.verify("secret-password", "not-a-valid-bcrypt-hash") is False
     assert context.verify(123, valid_hash) is False  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("rounds", [3, 16])
+def test_password_context_rejects_out_of_range_rounds(rounds):
+    """Validate Password context rejects bcrypt costs outside the supported range."""
+    with pytest.raises(ValueError, match="between 4 and 15"):
+        BcryptPasswordContext(rounds=rounds)
+
+
+def test_password_context_hash_uses_requested_rounds():
+    """Validate Password context hash embeds the configured cost factor."""
+    assert BcryptPasswordContext(rounds=5).hash("secret-password").startswith("$2b$05$")
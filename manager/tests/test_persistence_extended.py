@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import json
-import shutil
 from datetime import date, datetime, timedelta
 
 import pytest
@@ -14,25 +13,37 @@ from app.core.persistence import DailyJSONPersistence, SafeDailyJSONPersistence
 from app.models.models import Task
 
 
+@pytest.fixture(autouse=True)
+def no_retry_backoff(monkeypatch):
+    """Keep SafeDailyJSONPersistence retries immediate in tests."""
+    monkeypatch.setattr(persistence_module, "RETRY_BACKOFF_BASE_SECONDS", 0.0)
+
+
+# Fields shared by every task built by _task(); only id, status and timestamps vary
+_TASK_DEFAULTS = {
+    "runner_id": "r1",
+    "etab_name": "UM",
+    "app_name": "pod",
+    "app_version": "1.0",
+    "task_type": "encoding",
+    "source_url": "https://example.com/video.mp4",
+    "affiliation": None,
+    "notify_url": "https://example.com/notify",
+    "completion_callback": None,
+    "error": None,
+    "script_output": None,
+}
+
+
 def _task(task_id: str = "t1", status: str = "pending", created: datetime | None = None) -> Task:
     now = (created or datetime.now()).isoformat()
     return Task(
+        **_TASK_DEFAULTS,
         task_id=task_id,
-        runner_id="r1",
         status=status,
-        etab_name="UM",
-        app_name="pod",
-        app_version="1.0",
-        task_type="encoding",
-        source_url="https://example.com/video.mp4",
-        affiliation=None,
         parameters={},
-        notify_url="https://example.com/notify",
-        completion_callback=None,
         created_at=now,
         updated_at=now,
-        error=None,
-        script_output=None,
     )
 
 
@@ -52,6 +63,30 @@ def test_save_tasks_writes_and_deletes(tmp_path):
     assert not task_file.exists()
 
 
+def test_save_tasks_stamps_batch_once_and_leaves_no_temp_files(tmp_path):
+    """Validate one save batch shares its metadata and only leaves .json task files."""
+    persistence = DailyJSONPersistence(data_directory=tmp_path, lock_timeout=1)
+    today_dir = tmp_path / datetime.now().strftime("%Y-%m-%d")
+
+    assert persistence.save_tasks({"t1": _task("t1"), "t2": _task("t2")})
+
+    stored = {
+        path.stem: json.loads(path.read_text(encoding="utf-8")) for path in today_dir.glob("*.json")
+    }
+    assert set(stored) == {"t1", "t2"}
+    assert stored["t1"]["_metadata"]["saved_at"] == stored["t2"]["_metadata"]["saved_at"]
+    assert stored["t2"]["_metadata"]["date"] == today_dir.name
+    assert not list(today_dir.glob("*.tmp"))
+
+
+def test_date_suffix_formats_given_and_current_date(tmp_path):
+    """Validate Date suffix formats given and current date."""
+    persistence = DailyJSONPersistence(data_directory=tmp_path, lock_timeout=1)
+
+    assert persistence._get_date_suffix(date(2024, 1, 2)) == "2024-01-02"
+    assert persistence._get_date_suffix() == datetime.now().strftime("%Y-%m-%d")
+
+
 @pytest.mark.parametrize("task_id", ["../outside", "task/name", r"task\name", ".hidden", "é"])
 def test_task_file_path_rejects_unsafe_task_ids(tmp_path, task_id):
     """Reject task IDs that are not safe single filename components."""
@@ -172,7 +207,24 @@ def test_read_task_file_metadata_and_json_error(tmp_path):
     task_file.write_text("{not-json}", encoding="utf-8")
     result = persistence._read_task_file(task_file)
     assert result is None
-    assert task_file.with_suffix(".json.bak").exists()
+    assert task_file.with_suffix(".json.bak").read_text(encoding="utf-8") == "{not-json}"
+    assert not task_file.exists()
+
+
+def test_read_task_file_interns_repeated_task_fields(tmp_path):
+    """Validate Read task file interns repeated task fields."""
+    persistence = DailyJSONPersistence(data_directory=tmp_path, lock_timeout=1)
+    for task_id in ("a", "b"):
+        (tmp_path / f"{task_id}.json").write_text(
+            json.dumps({"task_id": task_id, "status": "running", "runner_id": 7}),
+            encoding="utf-8",
+        )
+
+    _, first, _ = persistence._read_task_file(tmp_path / "a.json")
+    _, second, _ = persistence._read_task_file(tmp_path / "b.json")
+
+    assert first["status"] is second["status"]
+    assert first["runner_id"] == 7
 
 
 def test_load_tasks_from_all_dates_handles_empty_and_duplicates(tmp_path):
@@ -222,6 +274,21 @@ def test_merge_tasks_handles_timeout(monkeypatch, tmp_path):
     assert calls["count"] == 1
 
 
+def test_date_locks_are_reused_and_pruned_by_cleanup(tmp_path):
+    """Validate Date locks are reused and pruned by cleanup."""
+    persistence = DailyJSONPersistence(data_directory=tmp_path, lock_timeout=1)
+    old_day = date.today() - timedelta(days=5)
+    (tmp_path / old_day.strftime("%Y-%m-%d")).mkdir()
+
+    current_lock = persistence._get_current_lock()
+    assert persistence._get_current_lock() is current_lock
+    assert persistence._get_date_lock(date.today()) is current_lock
+    assert persistence._get_date_lock(old_day) is persistence._get_date_lock(old_day)
+
+    assert persistence.cleanup_old_files(days_to_keep=1) == 1
+    assert set(persistence._date_locks) == {date.today()}
+
+
 def test_merge_tasks_skips_invalid_files(tmp_path):
     """Validate Merge tasks skips invalid files."""
     persistence = DailyJSONPersistence(data_directory=tmp_path, lock_timeout=1)
@@ -238,6 +305,7 @@ def test_merge_tasks_skips_invalid_files(tmp_path):
 def test_load_single_date_tasks_paths(tmp_path, monkeypatch):
     """Validate Load single date tasks paths."""
     persistence = DailyJSONPersistence(data_directory=tmp_path, lock_timeout=1)
+    original_filelock = persistence_module.FileLock
     missing = persistence._load_single_date_tasks(date(2020, 1, 1))
     assert missing == {}
 
@@ -260,10 +328,11 @@ def test_load_single_date_tasks_paths(tmp_path, monkeypatch):
     assert persistence._load_single_date_tasks(date.today()) == {}
 
     # Restore normal lock and trigger generic exception inside loader
-    monkeypatch.setattr(persistence_module, "FileLock", persistence_module.FileLock)
+    monkeypatch.setattr(persistence_module, "FileLock", original_filelock)
+    persistence._date_locks.clear()
     monkeypatch.setattr(
-        persistence_module.Path,
-        "glob",
+        persistence_module,
+        "_iter_json_files",
         lambda *_args, **_kwargs: (_ for _ in ()).throw(RuntimeError("fail")),
     )
     day_dir.mkdir(parents=True, exist_ok=True)
@@ -310,6 +379,52 @@ def test_load_historical_tasks_and_available_dates(tmp_path):
     assert len(dates) == 2
 
 
+def test_load_historical_tasks_keeps_range_bounds_and_same_ids_per_day(tmp_path):
+    """Validate Load historical tasks keeps range bounds and same ids per day."""
+    persistence = DailyJSONPersistence(data_directory=tmp_path, lock_timeout=1)
+    for day in (date(2024, 1, 1), date(2024, 1, 3), date(2024, 1, 5), date(2024, 1, 9)):
+        day_dir = tmp_path / day.strftime("%Y-%m-%d")
+        day_dir.mkdir()
+        (day_dir / "same.json").write_text(
+            json.dumps({"task_id": "same", "day": day.isoformat()}), encoding="utf-8"
+        )
+
+    loaded = persistence.load_historical_tasks(date(2024, 1, 2), date(2024, 1, 5))
+
+    assert list(loaded) == ["20240103_same", "20240105_same"]
+    assert loaded["20240105_same"]["day"] == "2024-01-05"
+    assert persistence.load_historical_tasks(date(2024, 1, 6), date(2024, 1, 8)) == {}
+
+
+def test_list_available_dates_skips_files_symlinks_and_non_dates(tmp_path):
+    """Validate List available dates skips files, symlinks and non-date names."""
+    data_directory = tmp_path / "data"
+    persistence = DailyJSONPersistence(data_directory=data_directory, lock_timeout=1)
+    (data_directory / "2024-01-02").mkdir()
+    (data_directory / "2024-13-40").mkdir()
+    (data_directory / "2024-01-03-old").mkdir()
+    (data_directory / "2024-1-002").mkdir()
+    (data_directory / "\u0662\u0660\u0662\u0664-01-06").mkdir()
+    (data_directory / "2024-01-04").write_text("{}", encoding="utf-8")
+    outside_directory = tmp_path / "2024-01-05"
+    outside_directory.mkdir()
+    (data_directory / "2024-01-05").symlink_to(outside_directory, target_is_directory=True)
+
+    assert persistence.list_available_dates() == [date(2024, 1, 2)]
+
+
+def test_iter_json_files_lists_json_entries_and_tolerates_missing_directory(tmp_path):
+    """Validate Iter json files lists json entries and tolerates missing directory."""
+    (tmp_path / "a.json").write_text("{}", encoding="utf-8")
+    (tmp_path / ".hidden.json").write_text("{}", encoding="utf-8")
+    (tmp_path / "notes.txt").write_text("", encoding="utf-8")
+
+    found = sorted(persistence_module._iter_json_files(tmp_path))
+
+    assert found == sorted(tmp_path.glob("*.json"))
+    assert list(persistence_module._iter_json_files(tmp_path / "missing")) == []
+
+
 def test_delete_task_marks_tombstone_and_hides_all_copies(tmp_path):
     """Validate Delete task marks tombstone and hides all copies."""
     persistence = DailyJSONPersistence(data_directory=tmp_path, lock_timeout=1)
@@ -434,12 +549,13 @@ def test_cleanup_old_files_handles_unlink_error(monkeypatch, tmp_path):
     file_path = old_dir / "file.json"
     file_path.write_text("{}", encoding="utf-8")
 
-    def failing_unlink(self, *args, **kwargs):
+    def failing_unlink(*args, **kwargs):
         raise OSError("nope")
 
-    monkeypatch.setattr(persistence_module.Path, "unlink", failing_unlink)
+    monkeypatch.setattr(persistence_module.os, "unlink", failing_unlink)
     deleted = persistence.cleanup_old_files(days_to_keep=1)
     assert deleted == 0
+    assert file_path.exists()
 
 
 def test_backup_corrupted_file_handles_copy_error(monkeypatch, tmp_path):
@@ -448,11 +564,12 @@ def test_backup_corrupted_file_handles_copy_error(monkeypatch, tmp_path):
     file_path = tmp_path / "corrupt.json"
     file_path.write_text("{}", encoding="utf-8")
 
-    def failing_copy(*_args, **_kwargs):
-        raise RuntimeError("fail")
+    def failing_replace(*_args, **_kwargs):
+        raise OSError("fail")
 
-    monkeypatch.setattr(shutil, "copy2", failing_copy)
+    monkeypatch.setattr(persistence_module.os, "replace", failing_replace)
     persistence._backup_corrupted_file(file_path)
+    assert file_path.exists()
 
 
 def test_upsert_tasks_branches(monkeypatch, tmp_path):
@@ -517,6 +634,7 @@ def test_load_task_branches(monkeypatch, tmp_path):
             return False
 
     monkeypatch.setattr(persistence_module, "FileLock", GenericFailLock)
+    persistence._date_locks.clear()
     assert persistence.load_task("t1") is None
 
 
@@ -613,6 +731,24 @@ def test_safe_persistence_retries_upsert_and_load_task(monkeypatch, tmp_path):
     assert safe_load_fail.load_task("x") is None
 
 
+def test_safe_persistence_backs_off_between_retries(monkeypatch, tmp_path):
+    """Validate Safe persistence backs off between retries."""
+    sleeps = []
+
+    def failing_save(self, _tasks):
+        raise RuntimeError("fail")
+
+    monkeypatch.setattr(DailyJSONPersistence, "save_tasks", failing_save)
+    monkeypatch.setattr(persistence_module.time, "sleep", sleeps.append)
+    monkeypatch.setattr(persistence_module.random, "random", lambda: 0.5)
+    safe = SafeDailyJSONPersistence(
+        data_directory=tmp_path, lock_timeout=1, max_retries=6, backoff_base=0.05
+    )
+
+    assert safe.save_tasks({"t": _task("t")}) is False
+    assert sleeps == pytest.approx([0.05, 0.1, 0.2, 0.4, 0.5])
+
+
 def test_get_deleted_task_ids_handles_non_dict_invalid_and_timeout(monkeypatch, tmp_path):
     """Validate Get deleted task ids handles non dict invalid and timeout."""
     persistence = DailyJSONPersistence(data_directory=tmp_path, lock_timeout=1)
@@ -689,7 +825,7 @@ def test_delete_task_handles_tombstone_write_failures(monkeypatch, tmp_path):
     def failing_dump(*_args, **_kwargs):
         raise RuntimeError("dump-fail")
 
-    monkeypatch.setattr(persistence_module.json, "dump", failing_dump)
+    monkeypatch.setattr(persistence_module.json_codec, "dumps_document", failing_dump)
     assert persistence2.delete_task("t-generic") is False
 
 
@@ -730,6 +866,7 @@ def test_delete_task_handles_timeout_oserror_and_generic_during_file_cleanup(mon
     day_dir.mkdir(parents=True, exist_ok=True)
     (day_dir / "victim.json").write_text(json.dumps({"task_id": "victim"}), encoding="utf-8")
     monkeypatch.setattr(persistence_module, "FileLock", original_filelock)
+    persistence._date_locks.clear()
 
     def unlink_oserror(self, *args, **kwargs):
         if self.name == "victim.json":
@@ -5,6 +5,7 @@
 from datetime import datetime
 
 import pytest
+from state_helpers import isolated_mapping
 
 from app.api.routes import task as task_module
 from app.core.priorities import (
@@ -17,22 +18,28 @@ from app.core.priorities import (
 from app.core.state import runners, tasks
 from app.models.models import Runner, Task
 
+# Fields shared by every task built by _make_task()
+_TASK_DEFAULTS = {
+    "runner_id": "runner-1",
+    "etab_name": "test_etab",
+    "app_name": "test_app",
+    "app_version": "1.0.0",
+    "task_type": "video",
+    "source_url": "http://example.com/source",
+    "affiliation": "qa",
+}
+
 
 def _make_task(task_id: str, notify_url: str, status: str = "running") -> Task:
+    now = datetime.now().isoformat()
     return Task(
+        **_TASK_DEFAULTS,
         task_id=task_id,
-        runner_id="runner-1",
         status=status,
-        etab_name="test_etab",
-        app_name="test_app",
-        app_version="1.0.0",
-        task_type="video",
-        source_url="http://example.com/source",
-        affiliation="qa",
         parameters={},
         notify_url=notify_url,
-        created_at=datetime.now().isoformat(),
-        updated_at=datetime.now().isoformat(),
+        created_at=now,
+        updated_at=now,
     )
 
 
@@ -66,6 +73,8 @@ def test_quota_math_flooring_with_minimum_one_for_positive_percent():
     assert max_other_concurrent_tasks(0, 25) == 0
     assert max_other_concurrent_tasks(5, 0) == 0
     assert max_other_concurrent_tasks(5, 100) == 5
+    assert max_other_concurrent_tasks(100, 29) == 29
+    assert max_other_concurrent_tasks(50, 58) == 29
 
 
 def test_other_domain_running_count():
@@ -133,13 +142,7 @@ def test_execute_rejects_when_quota_reached(client, auth_headers, monkeypatch):
     monkeypatch.setattr(task_module, "_resolve_host_ips", _resolve_public_ip_without_network)
 
     # Arrange state
-    original_tasks = dict(tasks)
-    original_runners = dict(runners)
-
-    try:
-        tasks.clear()
-        runners.clear()
-
+    with isolated_mapping(tasks), isolated_mapping(runners):
         # Capacity = 10 runners => allowed_other = floor(10 * 0.2) = 2
         for i in range(10):
             runners[f"r{i}"] = Runner(
@@ -172,8 +175,3 @@ def test_execute_rejects_when_quota_reached(client, auth_headers, monkeypatch):
 
         # Assert
         assert resp.status_code == 503
-    finally:
-        tasks.clear()
-        tasks.update(original_tasks)
-        runners.clear()
-        runners.update(original_runners)
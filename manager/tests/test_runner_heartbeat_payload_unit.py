@@ -5,6 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 
 import pytest
+from state_helpers import isolated_mapping
 
 from app.api.routes import runner as runner_routes
 from app.core.state import runners
@@ -13,11 +14,8 @@ from app.models.models import Runner
 
 @pytest.fixture
 def clean_runners_state():
-    original = dict(runners)
-    runners.clear()
-    yield
-    runners.clear()
-    runners.update(original)
+    with isolated_mapping(runners):
+        yield
 
 
 @pytest.mark.asyncio
@@ -7,40 +7,32 @@ from urllib.parse import urlparse
 
 import pytest
 from fastapi import HTTPException
-from fastapi.testclient import TestClient
+from state_helpers import isolated_mapping
 
 from app.core.auth import verify_runner_version, verify_token
 from app.core.state import runners
 from app.main import app
 from app.models.models import Runner
-from app.services import background_service
 
 
 @pytest.fixture
-def runner_client(monkeypatch):
-    async def _noop(*_, **__):
-        return None
+def runner_client(_app_client):
+    """Session test client with token and runner version checks bypassed for the current test."""
+    overrides = _app_client.app.dependency_overrides
+    overrides[verify_token] = lambda: "tok-ok"
+    overrides[verify_runner_version] = lambda: "1.0.0"
+    _app_client.cookies.clear()
 
-    monkeypatch.setattr(background_service.background_manager, "start_all_services", _noop)
-    monkeypatch.setattr(background_service.background_manager, "stop_all_services", _noop)
+    yield _app_client
 
-    app.dependency_overrides[verify_token] = lambda: "tok-ok"
-    app.dependency_overrides[verify_runner_version] = lambda: "1.0.0"
-
-    with TestClient(app) as client:
-        yield client
-
-    app.dependency_overrides.pop(verify_token, None)
-    app.dependency_overrides.pop(verify_runner_version, None)
+    overrides.pop(verify_token, None)
+    overrides.pop(verify_runner_version, None)
 
 
 @pytest.fixture
 def clean_runners_state():
-    original = dict(runners)
-    runners.clear()
-    yield
-    runners.clear()
-    runners.update(original)
+    with isolated_mapping(runners):
+        yield
 
 
 @pytest.fixture
@@ -148,6 +140,9 @@ def test_runner_heartbeat_403_when_token_mismatch(runner_client, clean_runners_s
         ("example.com", ["", "example.com"], True),
         ("", ["example.com"], False),
         ("runner.other", ["example.com"], False),
+        ("a.example.com", [" Example.COM. "], True),
+        ("badexample.com", ["example.com"], False),
+        ("example.com", [], False),
     ],
 )
 def test_host_matches_allowlist_variants(runner_module, host, allowed_hosts, expected):
@@ -6,6 +6,7 @@ import asyncio
 from datetime import datetime, timedelta
 
 import pytest
+from state_helpers import isolated_mapping
 
 from app.core.state import runners
 from app.models.models import Runner
@@ -14,11 +15,8 @@ from app.services import runner_service
 
 @pytest.fixture
 def clean_runners():
-    original = dict(runners)
-    runners.clear()
-    yield
-    runners.clear()
-    runners.update(original)
+    with isolated_mapping(runners):
+        yield
 
 
 def _runner(runner_id: str, *, last_heartbeat: datetime) -> Runner:
@@ -34,41 +32,47 @@ def _runner(runner_id: str, *, last_heartbeat: datetime) -> Runner:
     )
 
 
-@pytest.mark.asyncio
-async def test_check_runners_activity_removes_inactive_and_stops(clean_runners):
-    """Validate Check runners activity removes inactive and stops."""
+def test_check_runners_once_removes_inactive_runners(clean_runners):
+    """Validate Check runners once removes inactive runners."""
     runners["old"] = _runner("old", last_heartbeat=datetime.now() - timedelta(minutes=2))
-    stop_event = asyncio.Event()
+    runners["fresh"] = _runner("fresh", last_heartbeat=datetime.now())
 
-    task = asyncio.create_task(
-        runner_service.check_runners_activity(poll_interval=0, stop_event=stop_event)
-    )
-    await asyncio.sleep(0)
-    stop_event.set()
-    await asyncio.wait_for(task, timeout=0.1)
+    runner_service._check_runners_once()
 
     assert "old" not in runners
+    assert "fresh" in runners
 
 
-@pytest.mark.asyncio
-async def test_check_runners_activity_handles_missing_runner_on_delete(monkeypatch, clean_runners):
-    """Validate Check runners activity handles missing runner on delete."""
+def test_check_runners_once_handles_missing_runner_on_delete(monkeypatch, clean_runners):
+    """Validate Check runners once handles missing runner on delete."""
     runners["old"] = _runner("old", last_heartbeat=datetime.now() - timedelta(minutes=2))
-    stop_event = asyncio.Event()
 
     monkeypatch.setattr(runner_service.runners, "get", lambda *_args, **_kwargs: None)
 
-    task = asyncio.create_task(
-        runner_service.check_runners_activity(poll_interval=0, stop_event=stop_event)
-    )
-    await asyncio.sleep(0)
-    stop_event.set()
-    await asyncio.wait_for(task, timeout=0.1)
+    runner_service._check_runners_once()
 
     # Simulate race: runner disappeared between scan and delete attempt.
     assert "old" in runners
 
 
+@pytest.mark.asyncio
+async def test_check_runners_activity_runs_passes_until_stopped(monkeypatch):
+    """Validate Check runners activity runs passes until stopped."""
+    stop_event = asyncio.Event()
+    passes = []
+
+    def fake_check_runners_once():
+        passes.append(1)
+        if len(passes) == 2:
+            stop_event.set()
+
+    monkeypatch.setattr(runner_service, "_check_runners_once", fake_check_runners_once)
+
+    await runner_service.check_runners_activity(poll_interval=0, stop_event=stop_event)
+
+    assert len(passes) == 2
+
+
 def test_get_online_runners_filters_by_heartbeat(clean_runners):
     """Validate Get online runners filters by heartbeat."""
     now = datetime.now()
@@ -3,6 +3,8 @@
 import json
 from datetime import datetime
 
+from state_helpers import isolated_mapping
+
 from app.core.config import config
 from app.core.state import tasks
 from app.models.models import Task
@@ -25,9 +27,7 @@ def test_get_task_manifest_from_shared_storage_when_enabled(
     manifest = _create_manifest(task_dir, task_id, ["output.txt"])
     (output_dir / "output.txt").write_bytes(b"shared")
 
-    original_tasks = dict(tasks)
-    try:
-        tasks.clear()
+    with isolated_mapping(tasks):
         tasks[task_id] = Task(
             task_id=task_id,
             etab_name="test_etab",
@@ -54,9 +54,6 @@ def test_get_task_manifest_from_shared_storage_when_enabled(
         assert resp.headers["content-type"].startswith("application/json")
         assert resp.headers.get("X-Task-ID") == task_id
         assert resp.json() == manifest
-    finally:
-        tasks.clear()
-        tasks.update(original_tasks)
 
 
 def test_get_task_manifest_from_shared_storage_turns_warning_to_completed(
@@ -70,9 +67,7 @@ def test_get_task_manifest_from_shared_storage_turns_warning_to_completed(
     _create_manifest(task_dir, task_id, ["output.txt"])
     (output_dir / "output.txt").write_bytes(b"shared-warning")
 
-    original_tasks = dict(tasks)
-    try:
-        tasks.clear()
+    with isolated_mapping(tasks):
         tasks[task_id] = Task(
             task_id=task_id,
             etab_name="test_etab",
@@ -98,9 +93,6 @@ def test_get_task_manifest_from_shared_storage_turns_warning_to_completed(
         assert resp.status_code == 200
         assert tasks[task_id].status == "completed"
         assert tasks[task_id].error is None
-    finally:
-        tasks.clear()
-        tasks.update(original_tasks)
 
 
 def test_get_task_result_file_from_shared_storage_when_enabled(
@@ -114,9 +106,7 @@ def test_get_task_result_file_from_shared_storage_when_enabled(
     _create_manifest(task_dir, task_id, ["output.txt"])
     (output_dir / "output.txt").write_bytes(b"shared-file")
 
-    original_tasks = dict(tasks)
-    try:
-        tasks.clear()
+    with isolated_mapping(tasks):
         tasks[task_id] = Task(
             task_id=task_id,
             etab_name="test_etab",
@@ -142,6 +132,3 @@ def test_get_task_result_file_from_shared_storage_when_enabled(
         assert resp.status_code == 200
         assert resp.headers.get("X-Task-ID") == task_id
         assert resp.content == b"shared-file"
-    finally:
-        tasks.clear()
-        tasks.update(original_tasks)
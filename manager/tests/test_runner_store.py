@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import json
+import os
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any, cast
@@ -10,10 +12,16 @@ from typing import Any, cast
 import pytest
 from filelock import Timeout
 
+import app.core.runner_store as runner_store_module
 from app.core.runner_store import RunnerStore
 from app.models.models import Runner
 
 
+def _in_process_lock(_path: str, _timeout: int) -> Any:
+    """Lock factory for single-process tests: no lock file round trip per operation."""
+    return threading.RLock()
+
+
 def _runner(runner_id: str) -> Runner:
     return Runner(
         id=runner_id,
@@ -30,8 +38,12 @@ def _runner(runner_id: str) -> Runner:
 def test_shared_store_is_visible_across_instances(tmp_path):
     """Validate Shared store is visible across instances."""
     state_path = tmp_path / "runners_state.json"
-    store_a = RunnerStore(shared_enabled=True, state_file=str(state_path), lock_timeout=1)
-    store_b = RunnerStore(shared_enabled=True, state_file=str(state_path), lock_timeout=1)
+    store_a = RunnerStore(
+        shared_enabled=True, state_file=str(state_path), lock_factory=_in_process_lock
+    )
+    store_b = RunnerStore(
+        shared_enabled=True, state_file=str(state_path), lock_factory=_in_process_lock
+    )
 
     store_a["r1"] = _runner("r1")
     assert "r1" in store_b
@@ -161,6 +173,73 @@ def test_runner_to_dict_json_and_legacy_branches(tmp_path):
     assert isinstance(model_dump_dict["last_heartbeat"], str)
 
 
+def test_runner_to_dict_matches_json_round_trip(tmp_path):
+    """Validate Runner to dict matches the JSON text round trip for pydantic runners."""
+    store = RunnerStore(shared_enabled=False, state_file=str(tmp_path / "runners_state.json"))
+    runner = _runner("r-1")
+
+    data = store._runner_to_dict(runner)
+
+    assert data == json.loads(runner.model_dump_json())
+    assert isinstance(data["last_heartbeat"], str)
+
+
+def test_read_disk_reuses_decoded_state_until_file_changes(tmp_path, monkeypatch):
+    """Validate Read disk reuses decoded state until file changes."""
+    state_path = tmp_path / "runners_state.json"
+    store_a = RunnerStore(
+        shared_enabled=True, state_file=str(state_path), lock_factory=_in_process_lock
+    )
+    store_b = RunnerStore(
+        shared_enabled=True, state_file=str(state_path), lock_factory=_in_process_lock
+    )
+    store_b["r-1"] = _runner("r-1")
+
+    decode_calls: list[bytes] = []
+    original_loads = runner_store_module.json_codec.loads
+
+    def counting_loads(raw: bytes) -> Any:
+        decode_calls.append(raw)
+        return original_loads(raw)
+
+    monkeypatch.setattr(runner_store_module.json_codec, "loads", counting_loads)
+
+    assert "r-1" in store_a
+    assert store_a["r-1"].url == "http://r-1.example"
+    assert store_a["r-1"] is not store_a["r-1"]
+    assert len(decode_calls) == 1
+
+    # A write from another instance changes the file content and invalidates the cache.
+    store_b["r-2"] = _runner("r-2")
+    decode_calls.clear()
+    assert sorted(store_a.keys()) == ["r-1", "r-2"]
+    assert len(store_a) == 2
+    assert len(decode_calls) == 1
+
+
+def test_read_disk_sees_rewrite_with_identical_stat_signature(tmp_path):
+    """Validate Read disk sees a rewrite that keeps inode, size and mtime."""
+    state_path = tmp_path / "runners_state.json"
+    store = RunnerStore(
+        shared_enabled=True, state_file=str(state_path), lock_factory=_in_process_lock
+    )
+    store["r-1"] = _runner("r-1")
+    assert store["r-1"].url == "http://r-1.example"
+
+    before = state_path.stat()
+    content = state_path.read_bytes()
+    state_path.write_bytes(content.replace(b"http://r-1.example", b"http://r-9.example"))
+    os.utime(state_path, ns=(before.st_atime_ns, before.st_mtime_ns))
+    after = state_path.stat()
+    assert (after.st_ino, after.st_size, after.st_mtime_ns) == (
+        before.st_ino,
+        before.st_size,
+        before.st_mtime_ns,
+    )
+
+    assert store["r-1"].url == "http://r-9.example"
+
+
 def test_read_disk_error_paths_and_invalid_payloads(tmp_path, monkeypatch):
     """Validate Read disk error paths and invalid payloads."""
     state_path = tmp_path / "runners_state.json"
@@ -202,7 +281,9 @@ def test_read_disk_error_paths_and_invalid_payloads(tmp_path, monkeypatch):
 def test_shared_store_keys_values_items_and_get(tmp_path):
     """Validate Shared store keys values items and get."""
     state_path = tmp_path / "runners_state.json"
-    store = RunnerStore(shared_enabled=True, state_file=str(state_path), lock_timeout=1)
+    store = RunnerStore(
+        shared_enabled=True, state_file=str(state_path), lock_factory=_in_process_lock
+    )
 
     store["r1"] = _runner("r1")
     store["r2"] = _runner("r2")
@@ -27,6 +27,11 @@ from app.core.setup_logging import (
     setup_uvicorn_logging,
 )
 
+# Loggers configured by setup_uvicorn_logging, looked up once for the module
+_UVICORN_LOGGERS = tuple(
+    logging.getLogger(name) for name in ("uvicorn", "uvicorn.error", "uvicorn.access")
+)
+
 
 def test_json_formatter_includes_custom_fields():
     """Validate Json formatter includes custom fields."""
@@ -66,6 +71,26 @@ def test_json_formatter_aliases_uvicorn_error_logger_name():
     assert formatted["logger"] == "uvicorn.server"
 
 
+def test_json_formatter_falls_back_to_json_for_values_orjson_rejects():
+    """Validate Json formatter falls back to json for values orjson rejects."""
+    formatter = JSONFormatter()
+    record = logging.makeLogRecord(
+        {
+            "name": "logger",
+            "level": logging.INFO,
+            "pathname": __file__,
+            "lineno": 10,
+            "msg": "héllo",
+            "func": "func",
+            "module": "mod",
+            "task_id": 2**70,
+        }
+    )
+    output = formatter.format(record)
+    assert "héllo" in output
+    assert json.loads(output)["task_id"] == 2**70
+
+
 def test_json_formatter_handles_exception():
     """Validate Json formatter handles exception."""
     formatter = JSONFormatter()
@@ -100,6 +125,8 @@ def test_coerce_log_level_accepts_str_and_int():
     """Validate Coerce log level accepts str and int."""
     assert _coerce_log_level("debug") == logging.DEBUG
     assert _coerce_log_level(logging.WARNING) == logging.WARNING
+    assert _coerce_log_level(" Error ") == logging.ERROR
+    assert _coerce_log_level("nonsense") == logging.INFO
 
 
 def test_setup_logging_uses_tmp_dir_during_tests(tmp_path, monkeypatch):
@@ -197,8 +224,8 @@ def test_setup_uvicorn_logging_handles_permission_error(monkeypatch):
 
     monkeypatch.setenv("PYTEST_CURRENT_TEST", "1")
     monkeypatch.setattr(logging_module, "RotatingFileHandler", FailingHandler)
-    for name in ["uvicorn", "uvicorn.error", "uvicorn.access"]:
-        logging.getLogger(name).handlers.clear()
+    for uvicorn_logger in _UVICORN_LOGGERS:
+        uvicorn_logger.handlers.clear()
 
     setup_uvicorn_logging(json_format=True)
     uvicorn_logger = logging.getLogger("uvicorn")
@@ -209,8 +236,8 @@ def test_setup_uvicorn_logging_adds_file_handler(monkeypatch, tmp_path):
     """Validate Setup uvicorn logging adds file handler."""
     monkeypatch.delenv("PYTEST_CURRENT_TEST", raising=False)
     monkeypatch.setattr(logging_module.config, "LOG_DIRECTORY", f"{tmp_path}/")
-    for name in ["uvicorn", "uvicorn.error", "uvicorn.access"]:
-        logging.getLogger(name).handlers.clear()
+    for uvicorn_logger in _UVICORN_LOGGERS:
+        uvicorn_logger.handlers.clear()
 
     setup_uvicorn_logging(json_format=False)
     uvicorn_logger = logging.getLogger("uvicorn")
@@ -222,13 +249,13 @@ def test_setup_uvicorn_logging_clears_existing_handlers(monkeypatch, tmp_path):
     monkeypatch.delenv("PYTEST_CURRENT_TEST", raising=False)
     monkeypatch.setattr(logging_module.config, "LOG_DIRECTORY", f"{tmp_path}/")
 
-    uvicorn_logger = logging.getLogger("uvicorn")
+    uvicorn_logger = _UVICORN_LOGGERS[0]
     uvicorn_logger.handlers.clear()
     dummy = logging.StreamHandler()
     uvicorn_logger.addHandler(dummy)
 
     setup_uvicorn_logging(json_format=False)
-    assert dummy not in logging.getLogger("uvicorn").handlers
+    assert dummy not in uvicorn_logger.handlers
 
 
 def test_get_uvicorn_log_config_json_format():
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from datetime import datetime
 
+import pytest
+
 from app.core import state
 from app.models.models import Task
 
@@ -353,6 +355,32 @@ def test_get_tasks_snapshot_non_production_returns_copy(monkeypatch):
     state.tasks.update(original_tasks)
 
 
+def test_get_tasks_count_non_production_skips_copy_and_drops_deleted(monkeypatch):
+    """Validate Get tasks count counts the cache in place, minus tombstoned tasks."""
+    original_tasks = dict(state.tasks)
+    state.tasks.clear()
+    state.tasks["t1"] = _task("t1")
+    state.tasks["t2"] = _task("t2")
+
+    monkeypatch.setattr(state, "IS_PRODUCTION", False)
+    monkeypatch.setattr(state.persistence, "get_deleted_task_ids", lambda: {"t2"})
+    monkeypatch.setattr(state, "get_tasks_snapshot", lambda: pytest.fail("snapshot copied"))
+
+    assert state.get_tasks_count() == 1
+    assert set(state.tasks.keys()) == {"t1"}
+
+    state.tasks.clear()
+    state.tasks.update(original_tasks)
+
+
+def test_get_tasks_count_production_uses_snapshot(monkeypatch):
+    """Validate Get tasks count relies on the merged snapshot in production."""
+    monkeypatch.setattr(state, "IS_PRODUCTION", True)
+    monkeypatch.setattr(state, "get_tasks_snapshot", lambda: {"a": None, "b": None})
+
+    assert state.get_tasks_count() == 2
+
+
 def test_get_tasks_snapshot_production_merges_and_refreshes_cache(monkeypatch):
     """Validate Get tasks snapshot production merges and refreshes cache."""
     original_tasks = dict(state.tasks)
@@ -7,6 +7,7 @@ from datetime import datetime, timedelta, timezone
 
 import httpx
 import pytest
+from state_helpers import isolated_mapping
 
 from app.core.config import config
 from app.core.state import runners, tasks
@@ -16,20 +17,14 @@ from app.services import task_service
 
 @pytest.fixture
 def clean_tasks():
-    original = dict(tasks)
-    tasks.clear()
-    yield
-    tasks.clear()
-    tasks.update(original)
+    with isolated_mapping(tasks):
+        yield
 
 
 @pytest.fixture
 def clean_runners():
-    original = dict(runners)
-    runners.clear()
-    yield
-    runners.clear()
-    runners.update(original)
+    with isolated_mapping(runners):
+        yield
 
 
 @pytest.fixture(autouse=True)